@@ -3,19 +3,50 @@ import os
 import platform
 import subprocess
 import sys
+import time
 import importlib
+import multiprocessing
 from tkinter import messagebox, filedialog
 from datetime import datetime, timedelta
 from functools import lru_cache
-from dateutil.relativedelta import relativedelta
 
 import customtkinter as ctk
-from CTkMenuBar import CTkMenuBar, CustomDropdownMenu
+from CTkMenuBar import CTkMenuBar
+from modules import assets
 from modules.about_window import AboutWindow
 from modules.utils import  set_app_icon, get_program_path
+from modules.recurrence import RecurringTarget, RECURRENCE_PRESETS
+from modules.alarms import DeadlineScheduler, notify_target_reached
+from modules.calendar_tables import days_in_month, is_valid_date, clamp_day
+from modules.theme import ThemeRegistry, resolve_palettes
+from modules.zoom import ZoomController
+from modules.settings_store import SettingsWriter, seed_settings_file
+from modules.session import load_session, save_session
+from modules.display_templates import DisplayFormatter, DEFAULT_TEMPLATES, DISPLAY_LINES
+from modules.countdown_file import parse_countdown, countdown_label, write_countdown_target
+from modules.targets import TargetStore, FLAG_REACHED
+from modules.target_updater import TargetUpdater
+from modules.clock import epoch_clock
+from modules.event_log import EventLog, EVENT_LOADED, EVENT_SAVED, EVENT_REACHED
+from modules.export import export_targets
+from modules.cli import CLI_COMMANDS, run_cli
+from modules.ics_import import next_ics_event
+from modules.http_api import CountdownApiServer
+from modules.tick_engine import TickEngine
+from modules.mini_window import MiniWindow
+from modules.lazy_menu import LazyDropdown
 REQUIRED_JSON_VERSION = 9
 
+# Command line tools write their results to stdout, so the settings/translation loading below
+# prints its diagnostics to stderr. Only when run as the script: importing main.py (tools, spawned
+# report workers run as "__mp_main__") must not swap the importer's stdout.
+CLI_MODE = __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS
+if CLI_MODE:
+    CLI_STDOUT, sys.stdout = sys.stdout, sys.stderr
+
 current_file_path = ""
+# Index of the window's own target in CountdownApp.targets
+MAIN_TARGET = 0
 
 # Application version and release date
 APP_VERSION = {
@@ -45,7 +76,17 @@ APP_SETTINGS = {
     "appearance_mode": "dark",
     "color_theme": "blue",
     "ui_zoom_factor": 1.075,
-    "refresh_interval": 1000
+    "refresh_interval": 1000,
+    "alarm_bell": True,
+    "alarm_popup": True,
+    "alarm_command": "",
+    "http_api_enabled": False,
+    "http_api_port": 8765,
+    # Origins allowed to read the HTTP API from a browser, e.g. ["http://localhost:3000"]
+    "http_api_cors_origins": [],
+    "event_log_enabled": True,
+    # Names from modules.display_templates.DISPLAY_LINES, e.g. ["weeks", "minutes"]
+    "hidden_breakdown_lines": []
 }
 
 COLOR_SETTINGS = {
@@ -63,8 +104,10 @@ COLOR_SETTINGS = {
     }
 }
 
+DEFAULT_UI_ZOOM_FACTOR = APP_SETTINGS["ui_zoom_factor"]
+
 FIELD_RANGES = {
-    "year": (0,9999),
+    "year": (1, 9999),
     "month": (1, 12),
     "day": (1, 31),
     "hour": (0, 23),
@@ -139,8 +182,8 @@ def load_settings_from_json(file_path = RESOURCE_FILE_PATHS["json_config"]):
     global FONT_SETTINGS, APP_SETTINGS, COLOR_SETTINGS
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            settings = json.load(f)
+        # The loose file (edited by the user) wins over the bundled default, see modules/assets.py
+        settings = assets.load_json(file_path, prefer_file=True)
 
         # Check the JSON version
         if "VERSION" in settings:
@@ -189,6 +232,9 @@ print("APP_SETTINGS:", APP_SETTINGS)
 print("COLOR_SETTINGS:", COLOR_SETTINGS)
 '''
 print("Selected language:", APP_SETTINGS["Language"])
+
+# Runtime changes (theme, zoom) are written back to the settings file in the background
+settings_writer = SettingsWriter(RESOURCE_FILE_PATHS["json_config"], required_version=REQUIRED_JSON_VERSION)
 # --- Translation loading from JSON and fallback to translation.py ---
 
 TRANSLATIONS = {}
@@ -204,10 +250,9 @@ def load_translations(language_code):
     lang_code = language_code.lower()
     base_path = os.path.join("Assets", "Countdown", "Translations")
     json_file = os.path.join(base_path, f"translations_{lang_code}.json")
-    # 1. Try JSON for requested language
+    # 1. Try JSON for requested language (asset bundle or loose file)
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return assets.load_json(json_file)
     except Exception as e:
         print(f"[WARNING] Could not load translation file '{json_file}': {e}")
     # 2. Fallback to translation.py TRANSLATIONS_EN
@@ -274,6 +319,8 @@ def open_settings_file_for_editing(settings_path = RESOURCE_FILE_PATHS["json_con
     print("Absolute path:", os.path.abspath(settings_path))
     """
     try:
+        # Builds that only ship the asset bundle get an editable copy of the bundled settings
+        seed_settings_file(settings_path)
         if not os.path.exists(settings_path) or not os.path.isfile(settings_path):
             raise FileNotFoundError(f"Invalid file path: {settings_path}")
 
@@ -312,23 +359,47 @@ def pluralize_time_unit(value, singular, plural, genitive):
     else:
         return f"{formatted_value} {genitive}"
 
-def generate_time_texts(years, months, weeks, days, hours, minutes, seconds):
-    return (
-        pluralize_time_unit(int(years), *get_plural_form_list('main_window.plural_forms.year')),
-        pluralize_time_unit(int(months), *get_plural_form_list('main_window.plural_forms.month')),
-        pluralize_time_unit(int(weeks), *get_plural_form_list('main_window.plural_forms.week')),
-        pluralize_time_unit(int(days), *get_plural_form_list('main_window.plural_forms.day')),
-        pluralize_time_unit(hours, *get_plural_form_list('main_window.plural_forms.hour')),
-        pluralize_time_unit(minutes, *get_plural_form_list('main_window.plural_forms.minute')),
-        pluralize_time_unit(seconds, *get_plural_form_list('main_window.plural_forms.second'))
-    )
+def build_display_formatter(hidden_lines=None):
+    """
+    Compiles the display templates of the current language (or the defaults) with the hidden lines left out.
+    hidden_lines defaults to APP_SETTINGS["hidden_breakdown_lines"].
+    """
+    templates = TRANSLATIONS.get("main_window", {}).get("display_templates") or DEFAULT_TEMPLATES
+    if hidden_lines is None:
+        hidden_lines = APP_SETTINGS["hidden_breakdown_lines"]
+    try:
+        return DisplayFormatter(templates, t_path, get_plural_form_list, pluralize_time_unit, hidden_lines)
+    except (ValueError, AttributeError) as e:
+        print(f"[WARNING]: Invalid display templates, using the defaults: {e}")
+        return DisplayFormatter(DEFAULT_TEMPLATES, t_path, get_plural_form_list, pluralize_time_unit, hidden_lines)
+
+DISPLAY_FORMATTER = build_display_formatter()
 
-def change_ui_scale(scale=0):
-    APP_SETTINGS["ui_zoom_factor"] += scale * 0.1
-    APP_SETTINGS["ui_zoom_factor"] = round(APP_SETTINGS["ui_zoom_factor"], 3)
-    print(f"UI zoom factor: {APP_SETTINGS['ui_zoom_factor']}")
-    ctk.set_window_scaling(APP_SETTINGS["ui_zoom_factor"])
-    ctk.set_widget_scaling(APP_SETTINGS["ui_zoom_factor"])
+def format_display_texts(now, target_date, mode="remaining"):
+    """
+    Builds the (time_left, total_time) label texts from the compiled display templates.
+    Shared by the window and the offscreen overlay renderer.
+    """
+    return DISPLAY_FORMATTER.format(now, target_date, mode)
+
+def format_frame_texts(frame):
+    """format_texts of the tick engine, resolved on every call so a recompiled DISPLAY_FORMATTER is used."""
+    return DISPLAY_FORMATTER.format_frame(frame)
+
+def overlay_labels(now, target_date):
+    """[(text, FONT_SETTINGS style)] of the main window labels, for the overlay renderer."""
+    mode = "remaining" if now < target_date else "elapsed"
+    time_left_text, total_time_text = format_display_texts(now, target_date, mode)
+    return [
+        (f"{t_path('main_window.current_date_label')} {now.strftime('%d.%m.%Y %H:%M:%S')}", "title"),
+        (time_left_text, "countdown"),
+        (total_time_text, "units"),
+    ]
+
+def save_ui_scale(factor):
+    """Called once the debounced zoom is applied, queues the final factor for the settings file."""
+    APP_SETTINGS["ui_zoom_factor"] = factor
+    settings_writer.update({"APP_SETTINGS": {"ui_zoom_factor": factor}})
 
 # =============== Loading and Saving Files ===============
 
@@ -346,21 +417,47 @@ def load_file(self, file_path):
         with open(file_path, "r", encoding="utf-8") as file:
             content = file.read().strip()
             print(f"[debug_file] File content: '{content}'")  # Debug print
-            
-            # Parsing the date and updating the fields
-            dt = datetime.strptime(content, "%Y-%m-%d %H:%M:%S")
+
+            # First line: target date, optional second line: RRULE
+            dt, rule_text = parse_countdown(content)
             print(f"[debug_file] Parsed datetime: {dt}")  # Debug print
+            self.updater.reset(dt, RecurringTarget(rule_text, dt) if rule_text else None)
+            print(f"[debug_file] Recurrence: {rule_text}")  # Debug print
             update_entries(self, dt)
             
             # Storing the path of the loaded file
             global current_file_path
             current_file_path = file_path
+            self.store_target(dt)
+            self.log_event(EVENT_LOADED, dt)
             print(f"[debug_file] Updated current_file_path to: {current_file_path}")  # Debug print
             print(f"Loaded: {dt} - {file_path}")
     except Exception as e:
         print(f"[debug_file] Error loading file: {e}")  # Debug print
         messagebox.showerror("Error", f"File loading error:\n{e}")
 
+def import_ics_dialog(self):
+    """Loads the next upcoming event of an .ics calendar as the target (the file is streamed, not loaded)."""
+    file_path = filedialog.askopenfilename(filetypes=[("iCalendar Files", "*.ics")])
+    if not file_path:
+        print("[INFO]: File dialog canceled by the user.")
+        return
+    try:
+        event = next_ics_event(file_path, self.clock())
+    except Exception as e:
+        print(f"[debug_file] Error importing calendar: {e}")  # Debug print
+        messagebox.showerror("Error", f"File loading error:\n{e}")
+        return
+    if event is None:
+        messagebox.showinfo(APP_SETTINGS["title"], t_path("main_window.no_upcoming_events"))
+        return
+    summary, target, rule_text = event
+    self.updater.reset(target, RecurringTarget(rule_text, target) if rule_text else None)
+    update_entries(self, target)
+    self.store_target(target)
+    self.log_event(EVENT_LOADED, target, summary)
+    print(f"Imported: {target} - {summary} ({file_path})")
+
 def update_entries(self, dt):
     debug_info = [
         "---------[update_entries]---------",
@@ -406,20 +503,20 @@ def save_file(self, save_as=False):
                 print("[save_file_as] Save dialog canceled")  # Debug print
                 return
 
-        # Format the date string
-        date_str = (f"{self.target_year.get()}-{int(self.target_month.get()):02d}-"
-                    f"{int(self.target_day.get()):02d} {int(self.target_hour.get()):02d}:"
-                    f"{int(self.target_minute.get()):02d}:{int(self.target_second.get()):02d}")
-        print(f"[debug_file] Formatted date string: {date_str}")  # Debug print
+        self.commit_target_edit()
+        target_date, error_msg = self.get_target_date()
+        if target_date is None:
+            raise ValueError(error_msg)
 
-        # Save to file
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(date_str)
+        # Save the target record to the file
+        self.store_target(target_date, countdown_label(file_path))
+        write_countdown_target(file_path, self.targets, MAIN_TARGET)
+        self.log_event(EVENT_SAVED, target_date)
 
         # Update the current file path
         current_file_path = file_path
         print(f"[debug_file] Updated current_file_path to: {current_file_path}")  # Debug print
-        print(f"Saved: {date_str} - {file_path}")
+        print(f"Saved: {self.targets[MAIN_TARGET]} - {file_path}")
 
     except Exception as e:
         print(f"[debug_file] Error saving file: {e}")  # Debug print
@@ -428,73 +525,104 @@ def save_file(self, save_as=False):
 def save_file_as(self):
     save_file(self,save_as=True)
 
+def export_file_dialog(self):
+    """Exports the current target with its breakdowns to CSV, ICS or JSON Lines."""
+    file_path = filedialog.asksaveasfilename(
+        defaultextension=".csv",
+        filetypes=[("CSV", "*.csv"), ("iCalendar", "*.ics"), ("JSON Lines", "*.jsonl")]
+    )
+    if not file_path:
+        print("[export] Export dialog canceled")  # Debug print
+        return
+    self.commit_target_edit()
+    target_date, error_msg = self.get_target_date()
+    if target_date is None:
+        messagebox.showerror("Error", f"{t_path('main_window.invalid_date')}\n{error_msg}")
+        return
+    self.store_target(target_date)
+    try:
+        export_targets(self.targets.iter_pairs(), file_path, now=self.clock())
+    except Exception as e:
+        print(f"[export] Error exporting file: {e}")  # Debug print
+        messagebox.showerror("Error", f"Failed to export file\n{e}")
+
 # =============== - ===============
 
 class CountdownApp:
-    def __init__(self, root):
+    def __init__(self, root, clock=datetime.now):
+        # Every read of the current time goes through self.clock (see modules/clock.py)
+        self.clock = clock
+        # Snapshot of the last session (target and window geometry), restored in one read.
+        # Theme and zoom are settings and only come from the settings file.
+        session = load_session()
+
         ctk.set_appearance_mode(APP_SETTINGS["appearance_mode"])
         ctk.set_default_color_theme(APP_SETTINGS["color_theme"])
 
         self.root = root
         self.root.title(APP_SETTINGS["title"])
-        self.root.geometry(APP_SETTINGS["window_size"])
+        self.root.geometry(session.get("geometry", APP_SETTINGS["window_size"]))
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.resizable(*APP_SETTINGS["resizable"])
-        self.set_theme_colors()
-
-        # Better scaling of UI elements
-        change_ui_scale()
+        # Palettes are resolved once, widgets register the role they use
+        self.theme = ThemeRegistry(resolve_palettes(COLOR_SETTINGS))
+        self.about_window = None
+
+        # Only the nearest deadline is armed as a timer, see modules/alarms.py
+        self.alarms = DeadlineScheduler(self.root, self.on_target_reached, clock=self.clock)
+        # Compact target model shared with file I/O, export and the HTTP API (see modules/targets.py)
+        self.targets = TargetStore()
+        # Entry fields -> repeat rule -> self.targets -> alarm on every tick (see modules/target_updater.py);
+        # it also holds the repeat rule (updater.recurrence)
+        self.updater = TargetUpdater(
+            self.targets, MAIN_TARGET, self.alarms,
+            read_target=self.get_target_date,
+            show_target=lambda dt: update_entries(self, dt),
+            label=self.target_label,
+            is_editing=self.editing_target,
+            on_event=self.log_event,
+        )
 
-        # Setting the app icon
-        if APP_SETTINGS["SetIcon"]:
-            set_app_icon(self)
+        # Better scaling of UI elements, zoom requests are debounced into one relayout
+        self.zoom = ZoomController(self.root, APP_SETTINGS["ui_zoom_factor"])
+        self.zoom.apply_now()
+        # Set after the initial scaling, so only user zoom changes are written back
+        self.zoom.on_applied = save_ui_scale
 
+        # Only the cascade buttons exist until a menu is first clicked (see modules/lazy_menu.py)
         self.menu = CTkMenuBar(root, padx=0)
-
-        # Sekcja File
-        file_button = self.menu.add_cascade(t_path("menubar.file.file"))
-        file_dropdown = CustomDropdownMenu(widget=file_button)
-        file_dropdown.add_option(option=t_path("menubar.file.load_file"), command=lambda: load_file_dialog(self))
-        file_dropdown.add_option(option=t_path("menubar.file.save_file"), command=lambda: save_file(self))
-        file_dropdown.add_separator()
-        file_dropdown.add_option(option=t_path("menubar.file.save_as"), command=lambda: save_file_as(self))
-        file_dropdown.add_separator()
-        file_dropdown.add_option(option=t_path("menubar.file.exit"), command=lambda: self.root.quit())
-
-        # Sekcja Appearance
-        appearance_button = self.menu.add_cascade(t_path("menubar.appearance.appearance"))
-        appearance_dropdown = CustomDropdownMenu(widget=appearance_button)
-        appearance_dropdown.add_option(option=t_path("menubar.appearance.dark_mode"), command=lambda: self.set_app_appearance_mode("dark"))
-        appearance_dropdown.add_option(option=t_path("menubar.appearance.light_mode"), command=lambda: self.set_app_appearance_mode("light"))
-        appearance_dropdown.add_separator()
-        appearance_dropdown.add_option(option=t_path("menubar.appearance.zoom_in"), command=lambda: change_ui_scale(1))
-        appearance_dropdown.add_option(option=t_path("menubar.appearance.zoom_out"), command=lambda: change_ui_scale(-1))
-
-        # Sekcja Config
-        settings_button = self.menu.add_cascade(t_path("menubar.settings.settings"))
-        settings_dropdown = CustomDropdownMenu(widget=settings_button)
-        settings_dropdown.add_option(option=t_path("menubar.settings.open_config_file"), command=lambda: open_settings_file_for_editing())
-        #settings_dropdown.add_option(option=t_path("menubar.settings.update"), command=lambda: print("Update"))
-
-        # Sekcja About
-        about_button = self.menu.add_cascade(t_path("menubar.about.about"))
-        about_dropdown = CustomDropdownMenu(widget=about_button)
-        about_dropdown.add_option(option=t_path("menubar.about.about_this_app"), command=lambda: AboutWindow(root, APP_SETTINGS, APP_VERSION, t_path))
-        about_dropdown.add_separator()
-        about_dropdown.add_option(option=t_path("menubar.about.get_program_path_debug"), command=lambda: get_program_path(True))
-        about_dropdown.add_option(option=t_path("menubar.about.get_cache_info"), command=lambda: get_cache_info())
-
-        now = datetime.now() + timedelta(
+        self.display_line_options = {}
+        self.dropdowns = [
+            LazyDropdown(self.menu.add_cascade(t_path("menubar.file.file")), self.populate_file_menu),
+            LazyDropdown(self.menu.add_cascade(t_path("menubar.appearance.appearance")), self.populate_appearance_menu),
+            LazyDropdown(self.menu.add_cascade(t_path("menubar.repeat.repeat")), self.populate_repeat_menu),
+            LazyDropdown(self.menu.add_cascade(t_path("menubar.settings.settings")), self.populate_settings_menu),
+            LazyDropdown(self.menu.add_cascade(t_path("menubar.about.about")), self.populate_about_menu),
+        ]
+
+        # Keyboard zoom: Ctrl + / Ctrl - / Ctrl 0 (reset)
+        for sequence in ("<Control-plus>", "<Control-equal>", "<Control-KP_Add>"):
+            self.root.bind(sequence, lambda e: self.zoom.request(1))
+        for sequence in ("<Control-minus>", "<Control-KP_Subtract>"):
+            self.root.bind(sequence, lambda e: self.zoom.request(-1))
+        self.root.bind("<Control-0>", lambda e: self.zoom.set_pending(DEFAULT_UI_ZOOM_FACTOR))
+
+        initial_target = self.clock() + timedelta(
             days=0,
             hours=1,
             seconds=1
         )
+        # A file passed in sys.argv wins over the target of the last session
+        if len(sys.argv) <= 1:
+            initial_target = self.restore_session_target(session) or initial_target
+        self.updater.committed = initial_target
 
         self.main_frame = ctk.CTkFrame(
             root,
             #width=665,
             #height=375, # Legacy
             #height = int(APP_SETTINGS["window_size"].split("x")[1]) - 27,
-            fg_color=self.background_color,
+            fg_color=self.theme.color("background_color"),
             border_width=1,
             #border_color="red"
         )
@@ -505,7 +633,7 @@ class CountdownApp:
             self.main_frame,
             text="current_date_label",
             font=FONT_SETTINGS["title"],
-            text_color=self.text_color
+            text_color=self.theme.color("text_color")
         )
         self.current_date_label.pack(pady=(10,0))
 
@@ -513,7 +641,7 @@ class CountdownApp:
             self.main_frame,
             text="time_left_label",
             font=FONT_SETTINGS["countdown"],
-            text_color=self.text_color
+            text_color=self.theme.color("text_color")
         )
         self.time_left_label.pack(padx=5, pady=(5,5))
 
@@ -521,7 +649,7 @@ class CountdownApp:
             self.main_frame,
             text="total_time_label",
             font=FONT_SETTINGS["units"],
-            text_color=self.text_color,
+            text_color=self.theme.color("text_color"),
         )
         self.total_time_label.pack(pady=(0,0))
 
@@ -529,13 +657,13 @@ class CountdownApp:
             self.main_frame,
             text=t_path("main_window.warning_label"),
             font=FONT_SETTINGS["footer"],
-            text_color=self.text_color,
+            text_color=self.theme.color("text_color"),
         )
         self.warning_label.pack(pady=(2,0))
 
         self.date_frame = ctk.CTkFrame(
             self.main_frame,
-            fg_color = self.date_frame_color
+            fg_color = self.theme.color("date_frame_color")
             )
         self.date_frame.pack(side="bottom", pady=(0,10), anchor="s")
 
@@ -543,10 +671,22 @@ class CountdownApp:
             self.main_frame,
             text=t_path("main_window.calculate_date"),
             font=FONT_SETTINGS["title"],
-            text_color=self.highlight_color
+            text_color=self.theme.color("highlight_color")
         )
         self.calculate_date.pack(pady=(0,10), side="bottom", anchor="s")
 
+        # Palette roles followed on theme switches (colors above are (light, dark) pairs)
+        for widget, role, option in (
+            (self.main_frame, "background_color", "fg_color"),
+            (self.current_date_label, "text_color", "text_color"),
+            (self.time_left_label, "text_color", "text_color"),
+            (self.total_time_label, "text_color", "text_color"),
+            (self.warning_label, "text_color", "text_color"),
+            (self.date_frame, "date_frame_color", "fg_color"),
+            (self.calculate_date, "highlight_color", "text_color"),
+        ):
+            self.theme.register(widget, role, option, apply=False)
+
         '''
         Creates datetime input fields (year, month, day, hour, minute, second)
         Each field consists of:
@@ -554,14 +694,41 @@ class CountdownApp:
         - Bottom: Descriptive label
         Fields are initialized with stripped/zero-padded values where appropriate
         '''
-        self.target_year = self.create_target_entry(self.date_frame, now.strftime("%Y"), 0, t_path("main_window.target_entry.year"), "year")
-        self.target_month = self.create_target_entry(self.date_frame, now.strftime("%m").lstrip('0'), 1, t_path("main_window.target_entry.month"), "month")
-        self.target_day = self.create_target_entry(self.date_frame, now.strftime("%d").lstrip('0'), 2, t_path("main_window.target_entry.day"), "day")
-        self.target_hour = self.create_target_entry(self.date_frame, now.strftime("%H"), 3, t_path("main_window.target_entry.hour"), "hour")
-        self.target_minute = self.create_target_entry(self.date_frame, now.strftime("%M"), 4, t_path("main_window.target_entry.minute"), "minute")
-        self.target_second = self.create_target_entry(self.date_frame, now.strftime("%S"), 5, t_path("main_window.target_entry.second"), "second")
-        
-        self.update_time()
+        # One Tcl command validates every field (the field type is passed as an argument),
+        # instead of a new command per entry that Tcl keeps until the window is destroyed
+        self.validate_command = self.root.register(self.validate_range)
+        self.target_year = self.create_target_entry(self.date_frame, initial_target.strftime("%Y"), 0, t_path("main_window.target_entry.year"), "year")
+        self.target_month = self.create_target_entry(self.date_frame, initial_target.strftime("%m").lstrip('0'), 1, t_path("main_window.target_entry.month"), "month")
+        self.target_day = self.create_target_entry(self.date_frame, initial_target.strftime("%d").lstrip('0'), 2, t_path("main_window.target_entry.day"), "day")
+        self.target_hour = self.create_target_entry(self.date_frame, initial_target.strftime("%H"), 3, t_path("main_window.target_entry.hour"), "hour")
+        self.target_minute = self.create_target_entry(self.date_frame, initial_target.strftime("%M"), 4, t_path("main_window.target_entry.minute"), "minute")
+        self.target_second = self.create_target_entry(self.date_frame, initial_target.strftime("%S"), 5, t_path("main_window.target_entry.second"), "second")
+        self.target_entries = (self.target_year, self.target_month, self.target_day, self.target_hour, self.target_minute, self.target_second)
+
+        self.targets.append(APP_SETTINGS["title"], initial_target, self.updater.recurrence.rule_text if self.updater.recurrence else None)
+
+        # Append-only audit trail of set/loaded/saved/reached events (see modules/event_log.py)
+        self.event_log = None
+        if APP_SETTINGS["event_log_enabled"]:
+            try:
+                # Event times follow the app clock (simulated time in tools/soak_test.py)
+                self.event_log = EventLog(clock=epoch_clock(self.clock))
+            except OSError as e:
+                print(f"[WARNING]: Event log disabled: {e}")
+
+        self.api_server = None
+        self.published_version = None
+
+        # One tick loop computes the breakdown once and broadcasts it to every view
+        # (this window, mini windows, the HTTP API), see modules/tick_engine.py
+        self.engine = TickEngine(self.root, self.targets, format_frame_texts, clock=self.clock, interval_ms=APP_SETTINGS["refresh_interval"])
+        self.engine.add_updater(self.updater)
+        self.engine.add_updater(self.sync_event_log)
+        self.engine.subscribe(self.render)
+        self.engine.start()
+
+        # The icon and the HTTP API are not part of the first frame, they follow once it is painted
+        self.startup_job = self.root.after_idle(self.finish_startup)
 
         '''
         # For Debug
@@ -606,44 +773,183 @@ class CountdownApp:
         else:
             print("\nProgram launched without a file.\n")
 
-    def set_theme_colors(self):
-        """
-        Sets widget colors based on current appearance mode (dark/light).
-        Updates text, background and highlight colors from global COLOR_SETTINGS.
-        """
-        # Get the current theme mode
-        current_theme = ctk.get_appearance_mode().lower()
+    def finish_startup(self):
+        """Second startup step, run from after_idle so the window shows up first."""
+        # Setting the app icon
+        if APP_SETTINGS["SetIcon"]:
+            set_app_icon(self)
 
-        print(f"Current theme: {current_theme}\nSettings theme:", APP_SETTINGS["appearance_mode"])
-        
-        if current_theme == "dark":
-            self.text_color = COLOR_SETTINGS["dark"]["text_color"]
-            self.background_color = COLOR_SETTINGS["dark"]["background_color"]
-            self.date_frame_color = COLOR_SETTINGS["dark"]["date_frame_color"]
-            self.highlight_color = COLOR_SETTINGS["dark"]["highlight_color"]
-            #ctk.set_appearance_mode("dark")
+        # Optional local HTTP/JSON API (own thread), fed with a copy of the targets on change
+        if APP_SETTINGS["http_api_enabled"]:
+            self.api_server = CountdownApiServer(
+                port=APP_SETTINGS["http_api_port"], clock=self.clock, cors_origins=APP_SETTINGS["http_api_cors_origins"]
+            )
+            self.api_server.start()
+            self.engine.subscribe(self.publish_to_api)
 
-        else:
-            self.text_color = COLOR_SETTINGS["light"]["text_color"]
-            self.background_color = COLOR_SETTINGS["light"]["background_color"]
-            self.date_frame_color = COLOR_SETTINGS["light"]["date_frame_color"]
-            self.highlight_color = COLOR_SETTINGS["light"]["highlight_color"]
-            #ctk.set_appearance_mode("light")
+    def populate_file_menu(self, file_dropdown):
+        file_dropdown.add_option(option=t_path("menubar.file.load_file"), command=lambda: load_file_dialog(self))
+        file_dropdown.add_option(option=t_path("menubar.file.save_file"), command=lambda: save_file(self))
+        file_dropdown.add_separator()
+        file_dropdown.add_option(option=t_path("menubar.file.save_as"), command=lambda: save_file_as(self))
+        file_dropdown.add_option(option=t_path("menubar.file.import_ics"), command=lambda: import_ics_dialog(self))
+        file_dropdown.add_option(option=t_path("menubar.file.export"), command=lambda: export_file_dialog(self))
+        file_dropdown.add_separator()
+        file_dropdown.add_option(option=t_path("menubar.file.exit"), command=lambda: self.on_close())
+
+    def populate_appearance_menu(self, appearance_dropdown):
+        appearance_dropdown.add_option(option=t_path("menubar.appearance.dark_mode"), command=lambda: self.set_app_appearance_mode("dark"))
+        appearance_dropdown.add_option(option=t_path("menubar.appearance.light_mode"), command=lambda: self.set_app_appearance_mode("light"))
+        appearance_dropdown.add_separator()
+        appearance_dropdown.add_option(option=t_path("menubar.appearance.zoom_in"), command=lambda: self.zoom.request(1))
+        appearance_dropdown.add_option(option=t_path("menubar.appearance.zoom_out"), command=lambda: self.zoom.request(-1))
+        appearance_dropdown.add_separator()
+        appearance_dropdown.add_option(option=t_path("menubar.appearance.mini_window"), command=lambda: self.open_mini_window())
+        lines_submenu = appearance_dropdown.add_submenu(t_path("menubar.appearance.lines"))
+        for name in DISPLAY_LINES:
+            self.display_line_options[name] = lines_submenu.add_option(
+                option=self.display_line_option_text(name), command=lambda name=name: self.toggle_display_line(name)
+            )
+
+    def populate_repeat_menu(self, repeat_dropdown):
+        for preset in RECURRENCE_PRESETS:
+            repeat_dropdown.add_option(option=t_path(f"menubar.repeat.{preset}"), command=lambda preset=preset: self.set_recurrence(preset))
+
+    def populate_settings_menu(self, settings_dropdown):
+        settings_dropdown.add_option(option=t_path("menubar.settings.open_config_file"), command=lambda: open_settings_file_for_editing())
+        #settings_dropdown.add_option(option=t_path("menubar.settings.update"), command=lambda: print("Update"))
+
+    def populate_about_menu(self, about_dropdown):
+        about_dropdown.add_option(option=t_path("menubar.about.about_this_app"), command=lambda: self.open_about_window())
+        about_dropdown.add_separator()
+        about_dropdown.add_option(option=t_path("menubar.about.get_program_path_debug"), command=lambda: get_program_path(True))
+        about_dropdown.add_option(option=t_path("menubar.about.get_cache_info"), command=lambda: get_cache_info())
+
+    def restore_session_target(self, session):
+        """Restores target, repeat rule and file path from the session snapshot. Returns the target or None."""
+        global current_file_path
+        try:
+            target = datetime.strptime(session["target"], "%Y-%m-%d %H:%M:%S")
+        except (KeyError, TypeError, ValueError):
+            return None
+        rule_text = session.get("recurrence")
+        if rule_text:
+            try:
+                self.updater.recurrence = RecurringTarget(rule_text, target)
+            except ValueError as e:
+                print(f"[WARNING]: Ignoring stored repeat rule '{rule_text}': {e}")
+        current_file_path = session.get("file_path", "")
+        print(f"[INFO]: Restored last session target: {target} {current_file_path}")
+        return target
+
+    def save_session(self):
+        """Stores a compact snapshot of the current state for the next start."""
+        target_date, _ = self.get_target_date()
+        save_session({
+            "target": target_date.strftime("%Y-%m-%d %H:%M:%S") if target_date else None,
+            "recurrence": self.updater.recurrence.rule_text if self.updater.recurrence else None,
+            "file_path": current_file_path,
+            "geometry": self.root.geometry(),
+        })
+
+    def open_about_window(self):
+        """Shows the About window, reusing the open one instead of stacking a new Toplevel per click."""
+        if self.about_window is not None and self.about_window.winfo_exists():
+            self.about_window.deiconify()
+            self.about_window.lift()
+            self.about_window.focus()
+            return self.about_window
+        self.about_window = AboutWindow(self.root, APP_SETTINGS, APP_VERSION, t_path)
+        return self.about_window
+
+    def on_close(self):
+        self.save_session()
+        # Pending setting changes are written now instead of being lost with the timer thread
+        settings_writer.flush()
+        if self.event_log is not None:
+            self.event_log.close()
+        if self.api_server is not None:
+            self.api_server.stop()
+        self.root.destroy()
 
     def set_app_appearance_mode(self, theme):
-        ctk.set_appearance_mode(theme)
-        self.set_theme_colors()
-
-        self.main_frame.configure(fg_color = self.background_color)
-        self.current_date_label.configure(text_color = self.text_color)
-        self.time_left_label.configure(text_color = self.text_color)
-        self.total_time_label.configure(text_color = self.text_color)
-        self.warning_label.configure(text_color = self.text_color)
-        self.date_frame.configure(fg_color = self.date_frame_color)
-        self.calculate_date.configure(text_color=self.highlight_color)
+        """
+        Switches dark/light mode in one pass. Registered widgets hold (light, dark)
+        color pairs, so CustomTkinter recolors them during its own redraw.
+        """
+        start = time.perf_counter()
+        APP_SETTINGS["appearance_mode"] = theme
+        settings_writer.update({"APP_SETTINGS": {"appearance_mode": theme}})
+        self.theme.apply_mode(theme)
         if APP_SETTINGS["SetIcon"]:
             set_app_icon(self)
+        print(f"[INFO]: Theme switched to {theme} in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def display_line_option_text(self, name):
+        mark = "   " if name in APP_SETTINGS["hidden_breakdown_lines"] else "✓"
+        return f"{mark} {t_path(f'main_window.display_lines.{name}')}"
+
+    def toggle_display_line(self, name):
+        """Shows/hides one breakdown line. The templates are recompiled, hidden lines are never computed."""
+        global DISPLAY_FORMATTER
+        hidden = APP_SETTINGS["hidden_breakdown_lines"]
+        hidden = [line for line in hidden if line != name] if name in hidden else hidden + [name]
+        APP_SETTINGS["hidden_breakdown_lines"] = hidden
+        settings_writer.update({"APP_SETTINGS": {"hidden_breakdown_lines": hidden}})
+        DISPLAY_FORMATTER = build_display_formatter()
+        self.display_line_options[name].configure(text=self.display_line_option_text(name))
+
+        self.engine.tick()
 
+    def set_recurrence(self, preset):
+        """
+        Sets the repeat rule for the current target (RECURRENCE_PRESETS key).
+        The target entered in the fields becomes the first occurrence.
+        """
+        rule_text = RECURRENCE_PRESETS.get(preset)
+        if rule_text is None:
+            self.updater.recurrence = None
+            self.updater.commit()
+            print("[INFO]: Recurrence disabled.")
+            return
+        target_date, error_msg = self.get_target_date()
+        if target_date is None:
+            messagebox.showerror("Error", f"{t_path('main_window.invalid_date')}\n{error_msg}")
+            return
+        self.updater.recurrence = RecurringTarget(rule_text, target_date)
+        # A menu action commits the entered date like leaving the field does
+        self.updater.commit()
+        print(f"[INFO]: Recurrence set to {rule_text}")
+
+    def target_label(self):
+        return countdown_label(current_file_path) if current_file_path else APP_SETTINGS["title"]
+
+    def store_target(self, target_date, label=None):
+        """Mirrors the target from the entry fields into self.targets. Returns True if it changed."""
+        return self.updater.store(target_date, label)
+
+    def log_event(self, kind, target, label=None):
+        if self.event_log is None:
+            return
+        try:
+            self.event_log.append(kind, target, label or self.targets.label(MAIN_TARGET))
+        except OSError as e:
+            print(f"[ERROR]: Could not write to the event log: {e}")
+
+    def on_target_reached(self, key, deadline):
+        """Called by the DeadlineScheduler when a countdown reaches zero."""
+        print(f"[INFO]: Target reached ({key}): {deadline}")
+        self.log_event(EVENT_REACHED, deadline)
+        # A recurring target may already have moved on to its next occurrence
+        if self.targets.target(MAIN_TARGET) == deadline:
+            self.targets.set_flag(MAIN_TARGET, FLAG_REACHED)
+        notify_target_reached(
+            self.root,
+            APP_SETTINGS,
+            APP_SETTINGS["title"],
+            f"{t_path('main_window.target_reached')} {deadline.strftime('%d.%m.%Y %H:%M:%S')}",
+            deadline
+        )
 
     def create_target_entry(self, frame, default_value, column, label_text, field_type=None):
         """Creates a validated datetime entry field with label.
@@ -656,7 +962,7 @@ class CountdownApp:
             field_type: Used for range validation (matches FIELD_RANGES keys)
         
         Validation:
-            Uses validate_range() to ensure proper numeric input format
+            Uses validate_range() (registered once as self.validate_command) to ensure proper numeric input format
         """
 
         entry = ctk.CTkEntry(
@@ -665,10 +971,13 @@ class CountdownApp:
             font=FONT_SETTINGS["units"],
             justify="center",
             validate="key",
-            validatecommand=(self.root.register(lambda val: self.validate_range(val, field_type)), '%P')
+            validatecommand=(self.validate_command, '%P', field_type or "")
         )
         entry.insert(0, default_value)
         entry.grid(row=0, column=column, padx=(5,5), pady=(5,0))
+        # An edit is committed when the field loses focus or Return is pressed
+        entry.bind("<FocusOut>", lambda e: self.commit_target_edit(), add="+")
+        entry.bind("<Return>", lambda e: self.commit_target_edit(), add="+")
         ctk.CTkLabel(frame, text=label_text, font=FONT_SETTINGS["units"]).grid(row=1,pady=(0,3), column=column)
         return entry
 
@@ -681,126 +990,137 @@ class CountdownApp:
 
         if field_type and value:
             min_val, max_val = FIELD_RANGES.get(field_type, (0, 9999))
-            return min_val <= int(value) <= max_val
+            if not min_val <= int(value) <= max_val:
+                return False
+
+        # Cross-field check: the day must exist in the entered month (31.02 is rejected)
+        if field_type == "day":
+            year = self.target_year.get()
+            month = self.target_month.get()
+            if year.isdigit() and month.isdigit() and 1 <= int(month) <= 12:
+                return int(value) <= days_in_month(int(year), int(month))
 
         return True
 
-    def update_time(self):
+    def clamp_target_day(self):
         """
-        Updates current time display and calculates time difference to target.
-        Shows remaining time (future) or elapsed time (past).
-        Auto-refreshes at configured interval.
-        Handles invalid inputs with error messages.
+        Limits the day field to the last day of the entered month/year,
+        e.g. 31 -> 30 after switching to November, 29 -> 28 in a common year.
         """
+        year = self.target_year.get()
+        month = self.target_month.get()
+        day = self.target_day.get()
+        if not (year.isdigit() and month.isdigit() and day.isdigit()) or not 1 <= int(month) <= 12:
+            return
+        clamped = clamp_day(int(year), int(month), int(day))
+        if clamped != int(day):
+            self.target_day.delete(0, ctk.END)
+            self.target_day.insert(0, str(clamped))
 
-        now = datetime.now()
-        self.current_date_label.configure(text=f"{t_path('main_window.current_date_label')} {now.strftime('%d.%m.%Y %H:%M:%S')}")
-
-        # Check that all fields are filled in before converting to int
+    def commit_target_edit(self):
+        """
+        Called when an entry field loses focus, Return is pressed or a menu action uses
+        the date. Clamps the day, restarts the repeat rule from the entered date and
+        logs EVENT_SET; half-typed values seen by the ticks in between never become
+        the rule's anchor or an event log record.
+        """
+        self.clamp_target_day()
+        rule = self.updater.recurrence
+        self.updater.commit()
+        if self.updater.recurrence is not rule:
+            self.engine.tick()
+
+    def editing_target(self):
+        """True while the keyboard focus is in one of the target entry fields."""
         try:
-            year = self.target_year.get()
-            month = self.target_month.get()
-            day = self.target_day.get()
-            hour = self.target_hour.get()
-            minute = self.target_minute.get()
-            second = self.target_second.get()
-
-            if not all([year, month, day, hour, minute, second]):
-                raise ValueError(t_path("main_window.empty_input"))
-
-            # Conversion to int
-            target_date = datetime(
-                int(year), int(month), int(day),
-                int(hour), int(minute), int(second)
-            )
-
-            # Checking whether the date is in the future or in the past
-            if now < target_date:
-                self.display_time(now, target_date, mode="remaining")
-            else:
-                self.display_time(now, target_date, mode="elapsed")
-
-        except ValueError as error_msg:
-            self.time_left_label.configure(text=t_path("main_window.invalid_date"))
-            self.total_time_label.configure(text=error_msg)
+            focus = self.root.focus_get()
+        except KeyError:
+            # Focus in a widget tkinter does not know (e.g. a native dialog)
+            return False
+        if focus is None:
+            return False
+        # The focus is on the tk entry inside the CTkEntry frame
+        focus_path = str(focus)
+        return any(focus_path == str(entry) or focus_path.startswith(f"{entry}.") for entry in self.target_entries)
+
+    def get_target_date(self):
+        """
+        Reads the six entry fields and returns (target_datetime, None).
+        If the fields are empty or form an impossible date returns (None, translated message).
+        Checked against precomputed calendar tables, so nothing raises on the tick path.
+        """
+        year = self.target_year.get()
+        month = self.target_month.get()
+        day = self.target_day.get()
+        hour = self.target_hour.get()
+        minute = self.target_minute.get()
+        second = self.target_second.get()
 
-        self.root.after(APP_SETTINGS["refresh_interval"], self.update_time)
+        # Check that all fields are filled in before converting to int
+        if not all([year, month, day, hour, minute, second]):
+            return None, t_path("main_window.empty_input")
 
-    # This function is a bit chaotic, but it gets the job done. Needs refactoring and optimization later.
-    def display_time(self, now, target_date, mode="remaining"):
+        # Conversion to int (the entries only accept digits)
+        fields = (int(year), int(month), int(day), int(hour), int(minute), int(second))
+        if not is_valid_date(*fields):
+            return None, t_path("main_window.day_out_of_range")
+        return datetime(*fields), None
 
-        # Calculating the difference
-        if mode == "remaining":
-            diff = relativedelta(target_date, now)
-            total_days = (target_date - now).total_seconds() / 86400  # Calculate total days including fractional days
-            weeks = int(total_days // 7)  # Calculate full weeks
-            days = total_days % 7  # Remaining days after full weeks
-            total_seconds = (target_date - now).total_seconds()
-        else:
-            diff = relativedelta(now, target_date)
-            total_seconds = (now - target_date).total_seconds()
-
-        total_days = (target_date - now).days if mode == "remaining" else (now - target_date).days
-        weeks = total_days // 7
-        years = int(diff.years)
-        months = int(diff.months)
-        weeks = diff.days // 7
-        days = diff.days % 7
-        hours = int(diff.hours)
-        minutes = int(diff.minutes)
-        seconds = int(diff.seconds)
-
-        # Text generation for 'time_left_label'
-        year_text, months_text, weeks_text, days_text, hours_text, minutes_text, seconds_text = generate_time_texts(
-            years, months, weeks, days, hours, minutes, seconds
-        )
+    def sync_event_log(self, now):
+        """Tick updater: lets the event log run its batched fsync."""
+        if self.event_log is not None:
+            self.event_log.maybe_sync()
 
-        # Setting the label “time_left_label”
-        if mode == "remaining":
-            self.time_left_label.configure(
-                text=f"{t_path('main_window.remaining_text')} {year_text}, {months_text}, {weeks_text}, {days_text}, {hours_text}, {minutes_text} {t_path('main_window.and')} {seconds_text}"
-            )
-        else:
-            self.time_left_label.configure(
-                text=f"{t_path('main_window.elapsed_text')} {year_text}, {months_text}, {weeks_text}, {days_text}, {hours_text}, {minutes_text} {t_path('main_window.and')} {seconds_text}"
-            )
-
-        total_days = total_seconds / 86400 # 1 Day (24 * 60 * 60)
-        
-        # Alternative calculations using relativedelta for accurate month calculation
-        diff = relativedelta(target_date, now) if mode == "remaining" else relativedelta(now, target_date)
-        approx_months = diff.years * 12 + diff.months
-        remaining_days_after_months = diff.days
-        total_weeks_approx = (total_days / 7)
-        remaining_days_after_weeks = (total_days % 7)
-        total_hours_approx = int(total_seconds // 3600)
-        remaining_minutes_after_hours = int((total_seconds // 60) % 60)
-        total_minutes_approx = int(total_seconds // 60)
-        remaining_seconds_after_minutes = int(total_seconds % 60)
-
-        # Set the “total_time_label” with the correct variation and formatting
-        self.total_time_label.configure(
-            text=( 
-                f"{t_path('main_window.in_other_words')} {t_path('main_window.remaining_text') if mode == 'remaining' else t_path('main_window.elapsed_text')}\n"
-                f"{pluralize_time_unit(years, *get_plural_form_list('main_window.plural_forms.year'))}, "
-                f"{pluralize_time_unit(months, *get_plural_form_list('main_window.plural_forms.month'))}, "
-                f"{pluralize_time_unit(weeks, *get_plural_form_list('main_window.plural_forms.week'))}, "
-                f"{pluralize_time_unit(days, *get_plural_form_list('main_window.plural_forms.day'))}\n"
-                f"{pluralize_time_unit(int(approx_months), *get_plural_form_list('main_window.plural_forms.month'))}, "
-                f"{pluralize_time_unit(remaining_days_after_months, *get_plural_form_list('main_window.plural_forms.day'))}\n"
-                f"{pluralize_time_unit(total_weeks_approx, *get_plural_form_list('main_window.plural_forms.week'))}, "
-                f"{pluralize_time_unit(int(remaining_days_after_weeks), *get_plural_form_list('main_window.plural_forms.day'))}\n"
-                f"{pluralize_time_unit(int(total_days), *get_plural_form_list('main_window.plural_forms.day'))}, "
-                f"{pluralize_time_unit(hours, *get_plural_form_list('main_window.plural_forms.hour'))}\n"
-                f"{pluralize_time_unit(total_hours_approx, *get_plural_form_list('main_window.plural_forms.hour'))}, "
-                f"{pluralize_time_unit(remaining_minutes_after_hours, *get_plural_form_list('main_window.plural_forms.minute'))}\n"
-                f"{pluralize_time_unit(total_minutes_approx, *get_plural_form_list('main_window.plural_forms.minute'))}, "
-                f"{pluralize_time_unit(remaining_seconds_after_minutes, *get_plural_form_list('main_window.plural_forms.second'))}\n"
-                f"{pluralize_time_unit(int(total_seconds), *get_plural_form_list('main_window.plural_forms.second'))}"
-            )
+    def render(self, tick):
+        """
+        Main window view of the tick engine: current time and the breakdown of the main target.
+        Shows remaining time (future) or elapsed time (past), or the error for invalid fields.
+        """
+        self.current_date_label.configure(text=f"{t_path('main_window.current_date_label')} {tick.now.strftime('%d.%m.%Y %H:%M:%S')}")
+        if self.updater.error is not None:
+            self.time_left_label.configure(text=t_path("main_window.invalid_date"))
+            self.total_time_label.configure(text=self.updater.error)
+            return
+        time_left_text, total_time_text = tick[MAIN_TARGET].texts
+        self.time_left_label.configure(text=time_left_text)
+        self.total_time_label.configure(text=total_time_text)
+
+    def publish_to_api(self, tick):
+        """Headless view: hands the HTTP API a copy of the targets whenever they change."""
+        if self.targets.version != self.published_version:
+            self.published_version = self.targets.version
+            self.api_server.publish_targets(self.targets)
+
+    def open_mini_window(self):
+        """Opens another compact always-on-top view of the main target (one per monitor, if wanted)."""
+        return MiniWindow(
+            self.root,
+            self.engine,
+            self.theme,
+            (FONT_SETTINGS["units"], FONT_SETTINGS["countdown"]),
+            t_path("mini_window.compact"),
+            index=MAIN_TARGET,
+            title=APP_SETTINGS["title"],
         )
 
-# Run the application
-root = ctk.CTk()
-app = CountdownApp(root)
-root.mainloop()
+# Worker processes of the batch report (spawn on Windows/macOS) re-import this file as
+# "__mp_main__", they must neither run the command again nor open a window
+if __name__ == "__main__":
+    # Needed by process pools in PyInstaller/Nuitka builds
+    multiprocessing.freeze_support()
+
+    # Command line tools (e.g. "main.py export report.csv a.countdown") run without the window
+    if CLI_MODE:
+        sys.stdout = CLI_STDOUT
+        sys.exit(run_cli(sys.argv[1:], app_context={
+            "labels": overlay_labels,
+            "build_display_formatter": build_display_formatter,
+            "font_settings": FONT_SETTINGS,
+            "color_settings": COLOR_SETTINGS,
+            "appearance_mode": APP_SETTINGS["appearance_mode"],
+        }))
+
+    # Run the application
+    root = ctk.CTk()
+    app = CountdownApp(root)
+    root.mainloop()
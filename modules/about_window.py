@@ -27,6 +27,7 @@ try:
 except ImportError:
     Image = None
 import customtkinter as ctk
+from modules import assets
 from modules.utils import set_app_icon
 
 class AboutWindow(ctk.CTkToplevel):
@@ -59,7 +60,7 @@ class AboutWindow(ctk.CTkToplevel):
         
         if Image and app_icon_path:
             try:
-                app_icon_image = Image.open(app_icon_path)
+                app_icon_image = assets.open_image(app_icon_path)
                 self.app_icon = ctk.CTkImage(
                     light_image=app_icon_image,
                     dark_image=app_icon_image,
@@ -179,8 +180,8 @@ class AboutWindow(ctk.CTkToplevel):
         """Helper function to create clickable link label with optional icon"""
         if Image:
             try:
-                icon_light = Image.open(icon_light_path)
-                icon_dark = Image.open(icon_dark_path)
+                icon_light = assets.open_image(icon_light_path)
+                icon_dark = assets.open_image(icon_dark_path)
                 icon = ctk.CTkImage(
                     light_image=icon_light,
                     dark_image=icon_dark,
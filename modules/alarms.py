@@ -0,0 +1,145 @@
+"""
+Target-reached notifications driven by a min-heap of upcoming deadlines.
+
+Instead of checking every countdown on every tick, all deadlines live in a
+priority queue and only the nearest one is armed as a single root.after
+timer. Scheduling, replacing or firing a deadline costs O(log n) no matter
+how many targets are registered.
+
+Usage:
+    from modules.alarms import DeadlineScheduler, notify_target_reached
+    ...
+    scheduler = DeadlineScheduler(root, on_deadline)
+    scheduler.schedule("main", target_date)
+"""
+import heapq
+import itertools
+import os
+import shlex
+import subprocess
+from datetime import datetime
+from tkinter import messagebox
+
+# Tcl timers take a C int of milliseconds, long waits are split into hops
+MAX_TIMER_DELAY_MS = 3_600_000
+
+
+class DeadlineScheduler:
+    """
+    Keeps deadlines in a heap and arms one Tk timer for the nearest of them.
+
+    Args:
+        widget: Any Tk widget, used for after()/after_cancel()
+        on_deadline: Callback called as on_deadline(key, deadline)
+        clock: Callable returning the current naive datetime
+    """
+
+    def __init__(self, widget, on_deadline, clock=datetime.now):
+        self.widget = widget
+        self.on_deadline = on_deadline
+        self.clock = clock
+        self._heap = []
+        self._entries = {}  # key -> (deadline, seq) of the live entry
+        self._seq = itertools.count()
+        self._timer_id = None
+        self._armed_for = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def schedule(self, key, deadline):
+        """
+        Registers (or moves) the deadline for key. Deadlines that are already
+        in the past are not armed, so loading an old target stays silent.
+        """
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= now:
+            # Due but its timer has not fired yet: the timer counts elapsed time, so it runs
+            # late when the wall clock jumps forward (DST) or the deadline just moved past it
+            self._dispatch_due(now)
+            entry = None
+        if entry is not None and entry[0] == deadline:
+            return
+        if deadline <= now:
+            self._entries.pop(key, None)
+            self._rearm()
+            return
+        entry = (deadline, next(self._seq))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], key))
+        self._rearm()
+
+    def cancel(self, key):
+        # Stale heap items are skipped lazily when they reach the top
+        if self._entries.pop(key, None) is not None:
+            self._rearm()
+
+    def next_deadline(self):
+        """Returns (deadline, key) of the nearest live deadline, or None."""
+        self._drop_stale()
+        if not self._heap:
+            return None
+        deadline, _, key = self._heap[0]
+        return deadline, key
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and self._entries.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+
+    def _rearm(self):
+        nearest = self.next_deadline()
+        target = nearest[0] if nearest else None
+        if target == self._armed_for and self._timer_id is not None:
+            return
+        if self._timer_id is not None:
+            self.widget.after_cancel(self._timer_id)
+            self._timer_id = None
+        self._armed_for = target
+        if target is None:
+            return
+        delay_ms = (target - self.clock()).total_seconds() * 1000
+        delay_ms = max(0, min(MAX_TIMER_DELAY_MS, int(delay_ms) + 1))
+        self._timer_id = self.widget.after(delay_ms, self._on_timer)
+
+    def _on_timer(self):
+        self._timer_id = None
+        self._armed_for = None
+        self._dispatch_due(self.clock())
+        self._rearm()
+
+    def _dispatch_due(self, now):
+        heap = self._heap
+        while True:
+            self._drop_stale()
+            if not heap or heap[0][0] > now:
+                break
+            deadline, _, key = heapq.heappop(heap)
+            del self._entries[key]
+            try:
+                self.on_deadline(key, deadline)
+            except Exception as e:
+                print(f"[ERROR] Deadline callback failed for {key}: {e}")
+
+
+def notify_target_reached(window, app_settings, title, message, target):
+    """
+    Runs the notifications enabled in APP_SETTINGS:
+    - alarm_bell: system bell
+    - alarm_popup: message box
+    - alarm_command: local command, started with COUNTDOWN_TARGET in its environment
+    """
+    if app_settings.get("alarm_bell", True):
+        window.bell()
+
+    command = app_settings.get("alarm_command", "")
+    if command:
+        env = dict(os.environ, COUNTDOWN_TARGET=target.strftime("%Y-%m-%d %H:%M:%S"))
+        try:
+            subprocess.Popen(shlex.split(command), env=env)
+        except Exception as e:
+            print(f"[ERROR] Failed to run alarm command '{command}': {e}")
+
+    if app_settings.get("alarm_popup", True):
+        messagebox.showinfo(title, message, parent=window)
@@ -0,0 +1,165 @@
+"""
+Resource access for settings, translations and icons.
+
+Files are asked for by their usual relative path
+("Assets/Countdown/Icons/white_icon1.png") and come from the packed asset
+bundle when there is one, otherwise from the loose file. Frozen onefile
+builds and installs on network drives then read one file at startup
+instead of a dozen.
+
+The bundle (ASSET_BUNDLE_FILE, built by tools/build_asset_bundle.py) is
+memory-mapped once on first use:
+
+    magic    8 bytes  b"CDASSET1"
+    length   uint32   size of the index that follows
+    index    JSON     {"files": {path: [offset, size]}, "images": {path: [offset, size, width, height, mode]}}
+    data              file contents and pre-decoded icon pixels, 8-byte aligned
+
+Icons are stored as raw pixels, so open_image() wraps them without
+decoding a PNG. Writable files (the settings) are read from disk first
+and only fall back to the bundled copy, so user edits always win.
+
+Usage:
+    from modules import assets
+    ...
+    settings = assets.load_json("Assets/Countdown/settingsV2.json", prefer_file=True)
+    image = assets.open_image("Assets/Countdown/Icons/dark_icon1.png")
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+
+ASSET_BUNDLE_FILE = "Assets/countdown.assets"
+BUNDLE_MAGIC = b"CDASSET1"
+BUNDLE_HEADER = struct.Struct("<8sI")
+ALIGNMENT = 8
+
+_bundle = None
+_bundle_checked = False
+
+
+class AssetBundle:
+    """Read-only view of a bundle file. Paths use forward slashes, as written by the build script."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, index_size = BUNDLE_HEADER.unpack_from(self._map, 0)
+            if magic != BUNDLE_MAGIC:
+                raise ValueError(f"'{file_path}' is not an asset bundle")
+            index = json.loads(self._map[BUNDLE_HEADER.size:BUNDLE_HEADER.size + index_size])
+        except (struct.error, ValueError):
+            self._map.close()
+            raise
+        self.files = index.get("files", {})
+        self.images = index.get("images", {})
+
+    def __contains__(self, path):
+        key = normalize_path(path)
+        return key in self.files or key in self.images
+
+    def read(self, path):
+        """File contents as bytes, or None if the bundle does not have it."""
+        entry = self.files.get(normalize_path(path))
+        if entry is None:
+            return None
+        offset, size = entry
+        return self._map[offset:offset + size]
+
+    def image(self, path):
+        """PIL Image from the pre-decoded pixels, or None."""
+        entry = self.images.get(normalize_path(path))
+        if entry is None:
+            return None
+        from PIL import Image
+        offset, size, width, height, mode = entry
+        return Image.frombytes(mode, (width, height), self._map[offset:offset + size])
+
+    def close(self):
+        self._map.close()
+
+
+def normalize_path(path):
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def bundle_candidates():
+    """Where a bundle is looked for: the working directory, then next to a frozen executable."""
+    candidates = [ASSET_BUNDLE_FILE]
+    if getattr(sys, "frozen", False) or "__compiled__" in globals():
+        candidates.append(os.path.join(os.path.dirname(sys.executable), ASSET_BUNDLE_FILE))
+    if hasattr(sys, "_MEIPASS"):
+        # PyInstaller onefile extracts data files here
+        candidates.append(os.path.join(sys._MEIPASS, ASSET_BUNDLE_FILE))
+    return candidates
+
+
+def get_bundle():
+    """The bundle, opened on first use, or None when there is none (loose files only)."""
+    global _bundle, _bundle_checked
+    if not _bundle_checked:
+        _bundle_checked = True
+        for candidate in bundle_candidates():
+            if os.path.isfile(candidate):
+                try:
+                    _bundle = AssetBundle(candidate)
+                    print(f"[INFO]: Using asset bundle {candidate}")
+                    break
+                except (OSError, ValueError) as e:
+                    print(f"[WARNING]: Ignoring asset bundle {candidate}: {e}")
+    return _bundle
+
+
+def exists(path):
+    bundle = get_bundle()
+    return (bundle is not None and path in bundle) or os.path.isfile(path)
+
+
+def read_bytes(path, prefer_file=False):
+    """
+    Contents of path from the bundle or the loose file.
+    prefer_file=True reads the loose file first (for files the user may edit).
+    Raises FileNotFoundError when neither has it.
+    """
+    bundle = get_bundle()
+    if prefer_file or bundle is None:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            if bundle is None:
+                raise
+    data = bundle.read(path)
+    if data is not None:
+        return data
+    if prefer_file:
+        raise FileNotFoundError(f"No such file or bundled asset: '{path}'")
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_text(path, prefer_file=False):
+    return read_bytes(path, prefer_file).decode("utf-8-sig")
+
+
+def load_json(path, prefer_file=False):
+    """Parsed JSON; raises FileNotFoundError or json.JSONDecodeError like json.load on the file would."""
+    return json.loads(read_text(path, prefer_file))
+
+
+def open_image(path):
+    """PIL Image of an icon: bundled pixels if available, else the decoded loose file."""
+    bundle = get_bundle()
+    if bundle is not None:
+        image = bundle.image(path)
+        if image is not None:
+            return image
+    from PIL import Image
+    image = Image.open(path)
+    # Decode now, so the file handle is closed right away
+    image.load()
+    return image
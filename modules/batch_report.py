@@ -0,0 +1,104 @@
+"""
+Parallel breakdown report for very large target lists.
+
+The TargetStore's epoch column is cut into chunks and each chunk is sent
+to a ProcessPoolExecutor worker as raw bytes (8 bytes per target), not as
+a pickled list of datetimes. A worker answers with two flat buffers: the
+breakdown integers (array "q") and the fixed-width target strings. The
+parent decodes them back into export rows in the original order, so the
+output is identical to modules/export.py.
+
+Usage:
+    from modules.batch_report import write_report
+    ...
+    write_report(store, "report.csv", workers=8)
+    run "python tools/report_benchmark.py" for the speedup curve
+"""
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from modules.breakdown import compute_breakdown, Breakdown
+from modules.countdown_file import DATE_FORMAT
+from modules.export import export_rows
+from modules.targets import to_epoch, from_epoch
+
+CHUNK_SIZE = 20_000
+# Chunks submitted per worker before the oldest result is consumed: keeps every worker
+# busy while the parent decodes, and bounds memory by the chunk size, not the report size
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+# Every Breakdown field except mode is an integer; mode travels as 1 (remaining) / 0 (elapsed)
+VALUES_PER_ROW = len(Breakdown._fields)
+TARGET_TEXT_WIDTH = len("2025-01-01 00:00:00")
+
+
+def compute_chunk(epochs_bytes, now_epoch):
+    """
+    Worker: breakdowns for a chunk of epoch seconds.
+    Returns (breakdown values as array("q") bytes, concatenated ASCII target strings).
+    """
+    epochs = array("q")
+    epochs.frombytes(epochs_bytes)
+    now = from_epoch(now_epoch)
+    values = array("q")
+    texts = []
+    for epoch in epochs:
+        target = from_epoch(epoch)
+        breakdown = compute_breakdown(now, target)
+        values.append(breakdown.mode == "remaining")
+        values.extend(breakdown[1:])
+        texts.append(target.strftime(DATE_FORMAT))
+    return values.tobytes(), "".join(texts).encode("ascii")
+
+
+def _decode_chunk(store, start, values_bytes, texts_bytes):
+    values = array("q")
+    values.frombytes(values_bytes)
+    texts = texts_bytes.decode("ascii")
+    labels, label_ids = store.labels, store.label_ids
+    for row in range(len(values) // VALUES_PER_ROW):
+        offset = row * VALUES_PER_ROW
+        text_offset = row * TARGET_TEXT_WIDTH
+        yield (
+            labels.get(label_ids[start + row]),
+            texts[text_offset:text_offset + TARGET_TEXT_WIDTH],
+            "remaining" if values[offset] else "elapsed",
+            *values[offset + 1:offset + VALUES_PER_ROW],
+        )
+
+
+def iter_report_rows(store, now=None, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Yields export rows (see modules.export.ROW_FIELDS) for every target in store, in order.
+    workers=1 computes in this process; None uses one worker per CPU.
+    """
+    now_epoch = to_epoch(now or datetime.now())
+    workers = workers or os.cpu_count() or 1
+    starts = range(0, len(store), chunk_size)
+    chunks = (store.epochs[start:start + chunk_size].tobytes() for start in starts)
+
+    if workers == 1:
+        for start, chunk in zip(starts, chunks):
+            yield from _decode_chunk(store, start, *compute_chunk(chunk, now_epoch))
+        return
+
+    # Not pool.map(): it submits every chunk up front and holds all results until they are read
+    in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start, chunk in zip(starts, chunks):
+            pending.append((start, pool.submit(compute_chunk, chunk, now_epoch)))
+            if len(pending) >= in_flight:
+                # Oldest first, so chunks come back merged in order
+                start, future = pending.popleft()
+                yield from _decode_chunk(store, start, *future.result())
+        while pending:
+            start, future = pending.popleft()
+            yield from _decode_chunk(store, start, *future.result())
+
+
+def write_report(store, output_path, fmt=None, now=None, workers=None, chunk_size=CHUNK_SIZE):
+    """Writes the report for store to output_path (.csv/.ics/.jsonl). Returns the number of rows."""
+    now = now or datetime.now()
+    return export_rows(iter_report_rows(store, now, workers, chunk_size), output_path, fmt, now)
@@ -0,0 +1,114 @@
+"""
+Time breakdowns shown by the countdown.
+
+compute_breakdown() returns every number the main window puts on screen
+(calendar years/months/weeks/days, total weeks, days, hours, minutes,
+seconds) from a single calendar difference (relativedelta semantics,
+computed with integer arithmetic by calendar_difference()), so the GUI,
+exports and other batch paths all show the same values.
+
+Usage:
+    from modules.breakdown import compute_breakdown
+    ...
+    breakdown = compute_breakdown(datetime.now(), target)
+    print(breakdown.mode, breakdown.years, breakdown.total_seconds)
+"""
+from typing import NamedTuple
+from modules.calendar_tables import days_in_month
+
+
+class Breakdown(NamedTuple):
+    mode: str                    # "remaining" (target in the future) or "elapsed"
+    # Calendar difference (relativedelta semantics), days split into weeks + days
+    years: int
+    months: int
+    weeks: int
+    days: int
+    hours: int
+    minutes: int
+    seconds: int
+    # "In other words" lines
+    total_months: int
+    days_after_months: int
+    total_weeks: int
+    days_after_weeks: int
+    total_days: int
+    total_hours: int
+    minutes_after_hours: int
+    total_minutes: int
+    seconds_after_minutes: int
+    total_seconds: int
+
+
+BREAKDOWN_FIELDS = Breakdown._fields
+# Fields that need the calendar difference; the rest follow from the total seconds
+CALENDAR_FIELDS = frozenset(("years", "months", "weeks", "days", "total_months", "days_after_months"))
+
+
+def calendar_difference(start, end):
+    """
+    (years, months, days, hours, minutes, seconds) from start to end (start <= end), the same
+    values as relativedelta(end, start) for naive datetimes, without building relativedelta objects.
+    Month ends are clamped like relativedelta does (31.01 + 1 month = 28/29.02).
+    """
+    months = (end.year - start.year) * 12 + end.month - start.month
+    start_month = start.year * 12 + start.month - 1
+    while True:
+        year, month = divmod(start_month + months, 12)
+        month += 1
+        day = start.day
+        if day > 28:
+            day = min(day, days_in_month(year, month))
+        shifted = start.replace(year=year, month=month, day=day)
+        if shifted <= end:
+            break
+        months -= 1
+    rest = end - shifted
+    days = rest.days
+    hours, seconds = divmod(rest.seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return months // 12, months % 12, days, hours, minutes, seconds
+
+
+def compute_breakdown(now, target, calendar=True):
+    """
+    Breakdown of the time between now and target (remaining if target > now, else elapsed).
+    calendar=False skips the calendar difference and leaves CALENDAR_FIELDS at 0.
+    """
+    if now < target:
+        mode, start, end = "remaining", now, target
+    else:
+        mode, start, end = "elapsed", target, now
+
+    total_seconds = (end - start).total_seconds()
+    total_days = total_seconds / 86400  # 1 Day (24 * 60 * 60)
+
+    if calendar:
+        years, months, days, hours, minutes, seconds = calendar_difference(start, end)
+    else:
+        # Whole months/years are whole days, so the time of day part is the same either way
+        years = months = days = 0
+        hours = int(total_seconds // 3600 % 24)
+        minutes = int(total_seconds // 60 % 60)
+        seconds = int(total_seconds % 60)
+
+    return Breakdown(
+        mode,
+        years,
+        months,
+        days // 7,
+        days % 7,
+        hours,
+        minutes,
+        seconds,
+        years * 12 + months,
+        days,
+        int(total_days / 7),
+        int(total_days % 7),
+        int(total_days),
+        int(total_seconds // 3600),
+        int((total_seconds // 60) % 60),
+        int(total_seconds // 60),
+        int(total_seconds % 60),
+        int(total_seconds),
+    )
@@ -0,0 +1,50 @@
+"""
+Precomputed calendar tables for cross-field date validation.
+
+The entry fields are validated per key stroke against FIELD_RANGES, which
+allows 31 days in every month. These tables let the app check the whole
+date (31 February, 29 February in common years, year 0) with two list
+lookups, so impossible dates are caught at entry time instead of by
+datetime() raising ValueError on every tick.
+
+Usage:
+    from modules.calendar_tables import days_in_month, is_valid_date
+"""
+MIN_YEAR = 1      # datetime.MINYEAR
+MAX_YEAR = 9999   # datetime.MAXYEAR
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+# LEAP_TABLE[year] is 1 for leap years (year 0 counts as leap, like the proleptic calendar)
+LEAP_TABLE = bytes(1 if _is_leap(year) else 0 for year in range(MAX_YEAR + 1))
+
+# DAYS_IN_MONTH[leap][month], index 0 is unused so months can be used directly
+DAYS_IN_MONTH = (
+    (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+
+
+def days_in_month(year, month):
+    """Number of days in the month (year 0..9999, month 1..12)."""
+    return DAYS_IN_MONTH[LEAP_TABLE[year]][month]
+
+
+def is_valid_date(year, month, day, hour=0, minute=0, second=0):
+    """True if datetime(year, month, day, hour, minute, second) would succeed."""
+    return (
+        MIN_YEAR <= year <= MAX_YEAR
+        and 1 <= month <= 12
+        and 1 <= day <= DAYS_IN_MONTH[LEAP_TABLE[year]][month]
+        and 0 <= hour <= 23
+        and 0 <= minute <= 59
+        and 0 <= second <= 59
+    )
+
+
+def clamp_day(year, month, day):
+    """Returns day limited to the last day of the month (e.g. 31.02 -> 28/29)."""
+    return min(day, DAYS_IN_MONTH[LEAP_TABLE[year]][month])
@@ -0,0 +1,285 @@
+"""
+Command line tools that run without opening the window.
+
+    python main.py export report.csv a.countdown b.countdown
+    find . -name "*.countdown" | python main.py export report.jsonl -
+    python main.py import-ics calendar.ics --from 2025-01-01 --to 2026-01-01 --output-dir countdowns
+    python main.py serve a.countdown b.countdown --port 8765
+    python main.py render-overlay target.countdown --output overlay.png --size 1920x1080
+    python main.py report report.csv huge_list.ics --workers 8
+    python main.py events --from 2025-01-01 --list
+    python main.py calc --format json < targets.txt > breakdowns.jsonl
+
+main.py dispatches to run_cli() when the first argument is one of CLI_COMMANDS.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from modules.export import export_targets, iter_countdown_files, iter_countdown_rules, WRITERS
+from modules.ics_import import iter_ics_targets
+from modules.countdown_file import read_countdown_file, write_countdown_file, DATE_FORMAT
+from modules.http_api import CountdownApiServer
+from modules.recurrence import RecurringTarget
+from modules.targets import TargetStore
+from modules.batch_report import write_report, CHUNK_SIZE
+from modules.event_log import EventLogReader, EVENT_LOG_FILE, EVENT_NAMES
+from modules.display_templates import DISPLAY_LINES
+from modules.stream_calc import calc_stream, parse_target, CALC_FORMATS
+from modules.export import OUTPUT_BUFFER_SIZE
+
+CLI_COMMANDS = ("export", "import-ics", "serve", "render-overlay", "report", "events", "calc")
+
+
+def _cmd_export(args):
+    # "-" reads one path per line from stdin, so huge file lists are never held in memory
+    paths = (line.rstrip("\r\n") for line in sys.stdin) if args.inputs == ["-"] else args.inputs
+    # One reference time for advancing repeat rules and for the breakdowns
+    now = datetime.now()
+    export_targets(iter_countdown_files(paths, now), args.output, fmt=args.format, now=now)
+    return 0
+
+
+def _cmd_report(args):
+    paths = (line.rstrip("\r\n") for line in sys.stdin) if args.inputs == ["-"] else args.inputs
+    now = datetime.now()
+    store = TargetStore.from_pairs(iter_countdown_files(paths, now))
+    print(f"[INFO]: Loaded {len(store)} target(s)", file=sys.stderr)
+    write_report(store, args.output, fmt=args.format, now=now, workers=args.workers, chunk_size=args.chunk_size)
+    return 0
+
+
+def _format_duration(seconds):
+    days, rest = divmod(int(seconds), 86400)
+    hours, rest = divmod(rest, 3600)
+    return f"{days}d {hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+
+
+def _cmd_events(args):
+    start = args.start.timestamp() if args.start else None
+    end = args.end.timestamp() if args.end else None
+    with EventLogReader(args.log) as reader:
+        write = sys.stdout.write
+        if args.list:
+            for record in reader.iter_range(start, end):
+                when, name, target, label = reader.describe(record)
+                write(f"{when.strftime(DATE_FORMAT)}\t{name}\t{target.strftime(DATE_FORMAT)}\t{label or ''}\n")
+        counts = {}
+        for record in reader.iter_range(start, end):
+            counts[record[3]] = counts.get(record[3], 0) + 1
+        write(f"{sum(counts.values())} event(s) of {len(reader)} in the log\n")
+        for kind, name in EVENT_NAMES.items():
+            since = reader.time_since(kind)
+            last = f", last {_format_duration(since)} ago" if since is not None else ""
+            write(f"  {name:<9} {counts.get(kind, 0):>10}{last}\n")
+    return 0
+
+
+def _cmd_calc(args, app_context):
+    formatter = None
+    if args.format == "text" and app_context is not None:
+        # Only the printed lines are compiled (and computed), whatever the window hides
+        formatter = app_context["build_display_formatter"](hidden_lines=() if args.total else DISPLAY_LINES[1:])
+    sys.stdout.flush()
+    # A large buffer on the same file descriptor; sys.stdout would flush much more often
+    out = open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE, closefd=False)
+    try:
+        count, invalid = calc_stream(sys.stdin, out, now=args.now, fmt=args.format, formatter=formatter, total=args.total)
+        out.flush()
+    except BrokenPipeError:
+        # The reader quit early (e.g. "| head"), that is not an error; the rest of the output goes nowhere
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    if invalid:
+        print(f"[WARNING]: {invalid} of {count} line(s) are not valid timestamps", file=sys.stderr)
+    return 0
+
+
+def _unique_countdown_path(directory, summary):
+    name = re.sub(r"[^\w\- ]+", "_", summary).strip()[:80] or "event"
+    path = os.path.join(directory, f"{name}.countdown")
+    counter = 2
+    while os.path.exists(path):
+        path = os.path.join(directory, f"{name} ({counter}).countdown")
+        counter += 1
+    return path
+
+
+def _cmd_import_ics(args):
+    events = iter_ics_targets(args.calendar, start=args.start, end=args.end)
+    count = 0
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for summary, target, rule_text in events:
+            write_countdown_file(_unique_countdown_path(args.output_dir, summary), target, rule_text)
+            count += 1
+    else:
+        # One "target<TAB>summary" line per event
+        write = sys.stdout.write
+        for summary, target, _ in events:
+            write(f"{target.strftime(DATE_FORMAT)}\t{summary.replace(chr(10), ' ')}\n")
+            count += 1
+    print(f"[INFO]: Imported {count} event(s) from {args.calendar}", file=sys.stderr)
+    return 0
+
+
+def _advance_served(targets, recurrences, now):
+    """Moves recurring targets that passed to their next occurrence. Returns True if any moved."""
+    changed = False
+    for index, recurrence in recurrences.items():
+        if now >= targets.target(index):
+            upcoming = recurrence.next_occurrence(now)
+            if upcoming is not None:
+                changed |= targets.put(index, targets.label(index), upcoming, recurrence.rule_text)
+    return changed
+
+
+def _cmd_serve(args):
+    targets = TargetStore()
+    recurrences = {}
+    for label, target, rule_text in iter_countdown_rules(args.inputs):
+        recurrence = None
+        if rule_text:
+            try:
+                recurrence = RecurringTarget(rule_text, target)
+            except (ValueError, TypeError) as e:
+                print(f"[WARNING]: Repeat rule of '{label}' ignored: {e}", file=sys.stderr)
+        index = targets.append(label, target, recurrence.rule_text if recurrence is not None else None)
+        if recurrence is not None:
+            recurrences[index] = recurrence
+    _advance_served(targets, recurrences, datetime.now())
+
+    server = CountdownApiServer(host=args.host, port=args.port, cors_origins=args.cors_origins)
+    server.publish_targets(targets)
+    server.start()
+    if not server.is_running():
+        return 1
+    try:
+        # Like the window: a recurring target that passes is re-published at its next occurrence
+        while server.is_running():
+            time.sleep(1 - (time.time() % 1))
+            if _advance_served(targets, recurrences, datetime.now()):
+                server.publish_targets(targets)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+def _parse_size(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def _cmd_render_overlay(args, app_context):
+    # Pillow is only needed by this command
+    from modules.overlay_renderer import OverlayRenderer
+
+    if app_context is None:
+        raise ValueError("render-overlay needs the label formatter from main.py")
+    target, rule_text = read_countdown_file(args.input)
+    recurrence = RecurringTarget(rule_text, target) if rule_text else None
+    mode = args.theme or (app_context["appearance_mode"] if app_context["appearance_mode"] in ("dark", "light") else "dark")
+    renderer = OverlayRenderer(
+        args.size, app_context["font_settings"], app_context["color_settings"][mode], transparent=args.transparent
+    )
+    if args.frames_dir:
+        os.makedirs(args.frames_dir, exist_ok=True)
+
+    frame = 0
+    try:
+        while args.frames is None or frame < args.frames:
+            now = datetime.now()
+            if recurrence is not None and now >= target:
+                target = recurrence.next_occurrence(now) or target
+            renderer.render(app_context["labels"](now, target))
+            if args.frames_dir:
+                # A frame sequence needs every frame, even an unchanged one
+                renderer.save_png(os.path.join(args.frames_dir, f"frame_{frame:06d}.png"), force=True)
+            else:
+                renderer.save_png(args.output, force=frame == 0)
+            frame += 1
+            if args.frames is None or frame < args.frames:
+                # Wake up on the second boundary so the image changes together with the clock
+                time.sleep(args.interval - (time.time() % args.interval))
+    except KeyboardInterrupt:
+        pass
+    print(f"[INFO]: Rendered {renderer.frames_rendered} frame(s), encoded {renderer.frames_encoded}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Countdown command line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export countdown breakdowns to CSV/ICS/JSON Lines")
+    export_parser.add_argument("output", help="Output file (.csv, .ics, .jsonl)")
+    export_parser.add_argument("inputs", nargs="+", help=".countdown files, or - to read paths from stdin")
+    export_parser.add_argument("--format", choices=sorted(WRITERS), help="Output format (default: from the extension)")
+    export_parser.set_defaults(handler=_cmd_export)
+
+    report_parser = subparsers.add_parser("report", help="Like export, but computes breakdowns in parallel worker processes")
+    report_parser.add_argument("output", help="Output file (.csv, .ics, .jsonl)")
+    report_parser.add_argument("inputs", nargs="+", help=".countdown or .ics files, or - to read paths from stdin")
+    report_parser.add_argument("--format", choices=sorted(WRITERS), help="Output format (default: from the extension)")
+    report_parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    report_parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"Targets per work item (default: {CHUNK_SIZE})")
+    report_parser.set_defaults(handler=_cmd_report)
+
+    events_parser = subparsers.add_parser("events", help="Summarize (or list) the countdown event log")
+    events_parser.add_argument("--log", default=EVENT_LOG_FILE, help=f"Event log file (default: {EVENT_LOG_FILE})")
+    events_parser.add_argument("--from", dest="start", type=datetime.fromisoformat, help="Only events from this local time on")
+    events_parser.add_argument("--to", dest="end", type=datetime.fromisoformat, help="Only events before this local time")
+    events_parser.add_argument("--list", action="store_true", help="Print every event as time, event, target, label")
+    events_parser.set_defaults(handler=_cmd_events)
+
+    calc_parser = subparsers.add_parser("calc", help="Breakdown for every timestamp read from stdin, one line per input line")
+    calc_parser.add_argument("--format", choices=CALC_FORMATS, default="text", help="Pluralized text like the window (default) or JSON numbers")
+    calc_parser.add_argument("--now", type=parse_target, help="Reference time instead of the current time")
+    calc_parser.add_argument("--total", action="store_true", help="Text format: also print the \"in other words\" lines")
+    calc_parser.set_defaults(handler=_cmd_calc, needs_app_context=True)
+
+    import_parser = subparsers.add_parser("import-ics", help="Turn iCalendar events into countdown targets")
+    import_parser.add_argument("calendar", help=".ics file")
+    import_parser.add_argument("--from", dest="start", type=datetime.fromisoformat, help="Skip events before this date (YYYY-MM-DD[ HH:MM:SS])")
+    import_parser.add_argument("--to", dest="end", type=datetime.fromisoformat, help="Skip events from this date on")
+    import_parser.add_argument("--output-dir", help="Write one .countdown file per event (default: list events on stdout)")
+    import_parser.set_defaults(handler=_cmd_import_ics)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve countdowns over the local HTTP/JSON API without the window")
+    serve_parser.add_argument("inputs", nargs="+", help=".countdown or .ics files")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--cors-origin", dest="cors_origins", action="append", default=[],
+                              help="Let web pages from this origin read the API (repeatable, default: none)")
+    serve_parser.set_defaults(handler=_cmd_serve)
+
+    overlay_parser = subparsers.add_parser("render-overlay", help="Render the countdown to PNG images for streaming/signage overlays")
+    overlay_parser.add_argument("input", help=".countdown file")
+    output_group = overlay_parser.add_mutually_exclusive_group(required=True)
+    output_group.add_argument("--output", help="Image file rewritten in place on every change")
+    output_group.add_argument("--frames-dir", help="Write numbered PNG frames into this directory")
+    overlay_parser.add_argument("--size", type=_parse_size, default=(1920, 1080), help="WIDTHxHEIGHT (default: 1920x1080)")
+    overlay_parser.add_argument("--interval", type=float, default=1.0, help="Seconds between frames (default: 1)")
+    overlay_parser.add_argument("--frames", type=int, help="Stop after this many frames (default: run until Ctrl+C)")
+    overlay_parser.add_argument("--theme", choices=("dark", "light"), help="Color palette (default: appearance_mode)")
+    overlay_parser.add_argument("--transparent", action="store_true", help="Transparent background for compositing")
+    overlay_parser.set_defaults(handler=_cmd_render_overlay, needs_app_context=True)
+
+    return parser
+
+
+def run_cli(argv, app_context=None):
+    """
+    Runs a CLI command and returns the process exit code.
+    app_context carries the label formatters and FONT_SETTINGS/COLOR_SETTINGS from main.py.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        if getattr(args, "needs_app_context", False):
+            return args.handler(args, app_context)
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR]: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,94 @@
+"""
+Clocks for the countdown.
+
+A clock is any zero-argument callable returning the current naive local
+datetime; datetime.now is the real one. CountdownApp, DeadlineScheduler,
+the HTTP API and the batch tools take a clock argument instead of calling
+datetime.now() themselves, so they can run on simulated time.
+
+VirtualClock is a simulated clock with a Tk-compatible after() /
+after_cancel() timer queue. Timers run on elapsed (UTC) time like Tk's do,
+while the clock itself returns the wall-clock time of a time zone, so a
+simulation sees DST jumps exactly like the real app would.
+
+Usage:
+    from modules.clock import VirtualClock, epoch_clock
+    ...
+    clock = VirtualClock(datetime(2025, 3, 29, 12, 0), zone="Europe/Warsaw")
+    scheduler = DeadlineScheduler(clock, on_deadline, clock=clock)
+    clock.run_for(timedelta(days=2))
+    log = EventLog(clock=epoch_clock(clock))
+"""
+import heapq
+import itertools
+from datetime import timedelta, timezone
+from dateutil import tz
+
+
+class VirtualClock:
+    """
+    Args:
+        start: Naive local start time (interpreted in zone)
+        zone: IANA time zone name (e.g. "Europe/Warsaw"); None uses a fixed UTC offset (no DST)
+    """
+
+    def __init__(self, start, zone=None):
+        self.zone = tz.gettz(zone) if zone else timezone.utc
+        if self.zone is None:
+            raise ValueError(f"Unknown time zone '{zone}'")
+        self._utc = start.replace(tzinfo=self.zone).astimezone(timezone.utc)
+        self._timers = []
+        self._seq = itertools.count()
+        self._cancelled = set()
+        self.timers_run = 0
+
+    def __call__(self):
+        return self._utc.astimezone(self.zone).replace(tzinfo=None)
+
+    @property
+    def utc(self):
+        return self._utc
+
+    def advance(self, delta):
+        """Moves the clock forward without running timers."""
+        self._utc += delta
+
+    # --- Tk-compatible timer API (used as the "widget" of DeadlineScheduler and co.) ---
+
+    def after(self, ms, callback, *args):
+        timer_id = next(self._seq)
+        heapq.heappush(self._timers, (self._utc + timedelta(milliseconds=ms), timer_id, callback, args))
+        return timer_id
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, timer_id):
+        self._cancelled.add(timer_id)
+
+    def run_until(self, end_utc):
+        """Runs every timer due before end_utc (aware datetime) in order, moving the clock to each one."""
+        timers = self._timers
+        while timers and timers[0][0] <= end_utc:
+            due, timer_id, callback, args = heapq.heappop(timers)
+            if timer_id in self._cancelled:
+                self._cancelled.discard(timer_id)
+                continue
+            self._utc = max(self._utc, due)
+            self.timers_run += 1
+            callback(*args)
+        self._utc = max(self._utc, end_utc)
+
+    def run_for(self, duration):
+        self.run_until(self._utc + duration)
+
+
+def epoch_clock(clock):
+    """
+    time.time-style clock (UTC seconds since 1970) following a datetime clock,
+    for code that stores UTC times such as EventLog.
+    """
+    if isinstance(clock, VirtualClock):
+        return lambda: clock.utc.timestamp()
+    # Naive local datetimes, timestamp() applies the system time zone
+    return lambda: clock().timestamp()
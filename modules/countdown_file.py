@@ -0,0 +1,57 @@
+"""
+Reading and writing .countdown files.
+
+Format (UTF-8 text):
+    2025-10-14 00:00:00      <- target, %Y-%m-%d %H:%M:%S
+    RRULE:FREQ=YEARLY        <- optional repeat rule (see modules/recurrence.py)
+"""
+import os
+from datetime import datetime
+from modules.recurrence import RRULE_PREFIX, normalize_rule
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_countdown(content):
+    """Returns (target_datetime, rule_text or None) parsed from the file content."""
+    lines = content.strip().splitlines()
+    if not lines:
+        raise ValueError("Empty countdown file")
+    target = datetime.strptime(lines[0].strip(), DATE_FORMAT)
+    rule_lines = [line for line in lines[1:] if line.strip().upper().startswith(RRULE_PREFIX)]
+    return target, normalize_rule(rule_lines[0]) if rule_lines else None
+
+
+def format_countdown(target, rule_text=None):
+    content = target.strftime(DATE_FORMAT)
+    if rule_text:
+        content += f"\n{RRULE_PREFIX}{rule_text}"
+    return content
+
+
+def read_countdown_file(file_path):
+    with open(file_path, "r", encoding="utf-8") as file:
+        return parse_countdown(file.read())
+
+
+def write_countdown_file(file_path, target, rule_text=None):
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(format_countdown(target, rule_text))
+
+
+def read_countdown_target(file_path, store, index=None):
+    """Reads a .countdown file into a TargetStore (appended, or stored at index). Returns the index."""
+    target, rule_text = read_countdown_file(file_path)
+    if index is None:
+        return store.append(countdown_label(file_path), target, rule_text)
+    store.put(index, countdown_label(file_path), target, rule_text)
+    return index
+
+
+def write_countdown_target(file_path, store, index):
+    write_countdown_file(file_path, store.target(index), store.rule_text(index))
+
+
+def countdown_label(file_path):
+    """Display name of a countdown file (file name without extension)."""
+    return os.path.splitext(os.path.basename(file_path))[0]
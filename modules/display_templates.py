@@ -0,0 +1,166 @@
+"""
+Compiled display templates for time_left_label and total_time_label.
+
+Each language declares its word order and separators in the translation
+JSON (main_window.display_templates), for example
+
+    "time_left": "{prefix} {years}, {months}, ... {and} {seconds}",
+    "total_time": {"header": "{in_other_words} {prefix}", "months": "{total_months}, {days_after_months}", ...}
+
+The templates are compiled once into plain str.format strings: words such
+as {prefix} and {and} are looked up and baked in for both modes, and every
+number placeholder is tied to its Breakdown index and plural forms. Numbers
+below SMALL_VALUES are pluralized in advance, so a tick mostly does table
+lookups and one format() per label. Hidden lines are left out
+at compile time, and the calendar part of the breakdown (relativedelta) is
+skipped when no visible line needs it.
+
+Usage:
+    from modules.display_templates import DisplayFormatter
+    ...
+    formatter = DisplayFormatter(templates, t_path, get_plural_form_list, pluralize_time_unit)
+    time_left_text, total_time_text = formatter.format(now, target)
+    time_left_text, total_time_text = formatter.format_frame(frame)   (shared tick, see modules/tick_engine.py)
+"""
+from string import Formatter
+from modules.breakdown import BREAKDOWN_FIELDS, CALENDAR_FIELDS, compute_breakdown
+
+# Number placeholder -> plural_forms entry of its unit
+FIELD_UNITS = {
+    "years": "year",
+    "months": "month",
+    "weeks": "week",
+    "days": "day",
+    "hours": "hour",
+    "minutes": "minute",
+    "seconds": "second",
+    "total_months": "month",
+    "days_after_months": "day",
+    "total_weeks": "week",
+    "days_after_weeks": "day",
+    "total_days": "day",
+    "total_hours": "hour",
+    "minutes_after_hours": "minute",
+    "total_minutes": "minute",
+    "seconds_after_minutes": "second",
+    "total_seconds": "second",
+}
+
+# Word placeholders, resolved at compile time ({prefix} depends on the mode)
+TEXT_PLACEHOLDERS = {
+    "and": "main_window.and",
+    "in_other_words": "main_window.in_other_words",
+    "remaining_text": "main_window.remaining_text",
+    "elapsed_text": "main_window.elapsed_text",
+}
+PREFIX_TEXTS = {
+    "remaining": "main_window.remaining_text",
+    "elapsed": "main_window.elapsed_text",
+}
+
+# Used when a translation file has no (or a broken) display_templates section
+DEFAULT_TEMPLATES = {
+    "time_left": "{prefix} {years}, {months}, {weeks}, {days}, {hours}, {minutes} {and} {seconds}",
+    "total_time": {
+        "header": "{in_other_words} {prefix}",
+        "calendar": "{years}, {months}, {weeks}, {days}",
+        "months": "{total_months}, {days_after_months}",
+        "weeks": "{total_weeks}, {days_after_weeks}",
+        "days": "{total_days}, {hours}",
+        "hours": "{total_hours}, {minutes_after_hours}",
+        "minutes": "{total_minutes}, {seconds_after_minutes}",
+        "seconds": "{total_seconds}",
+    },
+}
+
+# Values below this are pluralized once per unit and looked up afterwards (seconds, minutes, hours, days, ...)
+SMALL_VALUES = 100
+
+# Names of the lines that can be hidden (APP_SETTINGS["hidden_breakdown_lines"])
+DISPLAY_LINES = ("time_left",) + tuple(DEFAULT_TEMPLATES["total_time"])
+
+
+def _escape(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class DisplayFormatter:
+    """
+    Args:
+        templates: {"time_left": str, "total_time": {line_name: str}}
+        text: Translation lookup for dot paths (t_path)
+        plural_forms: Plural forms lookup for dot paths (get_plural_form_list)
+        pluralize: pluralize(value, singular, plural, genitive) -> str
+        hidden_lines: Names from DISPLAY_LINES to leave out
+
+    Raises ValueError for unknown placeholders, so callers can fall back to DEFAULT_TEMPLATES.
+    """
+
+    def __init__(self, templates, text, plural_forms, pluralize, hidden_lines=()):
+        self.pluralize = pluralize
+        self._text = text
+        self._plural_forms = plural_forms
+        self._unit_forms = {}
+        self._small_texts = {}
+        hidden = set(hidden_lines)
+
+        time_left = templates.get("time_left", "") if "time_left" not in hidden else ""
+        total_lines = [line for name, line in templates.get("total_time", {}).items() if name not in hidden]
+
+        used_fields = set()
+        self._compiled = {}
+        for mode in PREFIX_TEXTS:
+            self._compiled[mode] = (
+                self._compile(time_left, mode, used_fields),
+                self._compile("\n".join(total_lines), mode, used_fields),
+            )
+        self.needs_calendar = bool(used_fields & CALENDAR_FIELDS)
+
+    def _forms(self, unit):
+        forms = self._unit_forms.get(unit)
+        if forms is None:
+            forms = list(self._plural_forms(f"main_window.plural_forms.{unit}"))
+            forms = tuple((forms + forms[-1:] * 3)[:3])
+            self._unit_forms[unit] = forms
+            self._small_texts[forms] = tuple(self.pluralize(value, *forms) for value in range(SMALL_VALUES))
+        return forms
+
+    def _compile(self, template, mode, used_fields):
+        """Returns (format_string, ((breakdown_index, forms, small_texts), ...)) with every word already substituted."""
+        parts = []
+        fields = []
+        for literal, name, format_spec, conversion in Formatter().parse(template):
+            parts.append(_escape(literal))
+            if name is None:
+                continue
+            if name == "prefix":
+                parts.append(_escape(self._text(PREFIX_TEXTS[mode])))
+            elif name in TEXT_PLACEHOLDERS:
+                parts.append(_escape(self._text(TEXT_PLACEHOLDERS[name])))
+            elif name in FIELD_UNITS:
+                parts.append(f"{{{len(fields)}}}")
+                forms = self._forms(FIELD_UNITS[name])
+                fields.append((BREAKDOWN_FIELDS.index(name), forms, self._small_texts[forms]))
+                used_fields.add(name)
+            else:
+                raise ValueError(f"Unknown placeholder '{{{name}}}' in display template '{template}'")
+        return "".join(parts), tuple(fields)
+
+    def format(self, now, target, mode=None):
+        """Returns (time_left_text, total_time_text); hidden parts are empty strings."""
+        return self.format_breakdown(compute_breakdown(now, target, calendar=self.needs_calendar), mode)
+
+    def format_frame(self, frame):
+        """Same as format() for a modules.tick_engine.TickFrame, reusing its breakdown."""
+        return self.format_breakdown(frame.breakdown(calendar=self.needs_calendar), frame.mode)
+
+    def format_breakdown(self, breakdown, mode=None):
+        pluralize = self.pluralize
+        texts = []
+        for format_string, fields in self._compiled[mode or breakdown.mode]:
+            values = []
+            for index, forms, small_texts in fields:
+                value = breakdown[index]
+                values.append(small_texts[value] if value < SMALL_VALUES else pluralize(value, *forms))
+            texts.append(format_string.format(*values))
+        return texts[0], texts[1]
@@ -0,0 +1,268 @@
+"""
+Append-only countdown event log.
+
+Every event (target set/loaded/saved/reached, repeat rule advanced) is one
+24-byte little-endian record after a 16-byte header:
+
+    time     int64   UTC seconds since 1970 when the event happened (never decreases)
+    target   int64   target as wall-clock seconds since 1970 (see modules/targets.py)
+    label    uint32  line number in the "<log>.labels" side file (0 = no label)
+    kind     uint8   EVENT_* constant
+    flags    uint8   reserved
+    unused   uint16
+
+Records are written to the OS right away, but fsync is batched: it runs
+after SYNC_EVERY_RECORDS records or SYNC_INTERVAL seconds, whichever comes
+first. The reader memory-maps the file; because times never decrease, a
+range query is a binary search plus one struct.iter_unpack over the slice,
+fast even with millions of records.
+
+Usage:
+    from modules.event_log import EventLog, EventLogReader, EVENT_SAVED
+    ...
+    log = EventLog("Assets/Countdown/events.log")
+    log.append(EVENT_SAVED, target, "Holidays")
+    with EventLogReader("Assets/Countdown/events.log") as reader:
+        print(reader.time_since(EVENT_REACHED))
+"""
+import mmap
+import os
+import struct
+import time
+from datetime import datetime
+from modules.targets import to_epoch, from_epoch
+
+EVENT_LOG_FILE = "Assets/Countdown/events.log"
+
+MAGIC = b"CDLOG\x00"
+LOG_VERSION = 1
+HEADER = struct.Struct("<6sHH6x")
+RECORD = struct.Struct("<qqIBBxx")
+
+EVENT_SET = 1        # Target entered/edited in the window
+EVENT_LOADED = 2     # Loaded from a .countdown/.ics file
+EVENT_SAVED = 3      # Saved to a .countdown file
+EVENT_REACHED = 4    # Countdown reached zero
+EVENT_ADVANCED = 5   # Repeat rule moved to the next occurrence
+
+EVENT_NAMES = {
+    EVENT_SET: "set",
+    EVENT_LOADED: "loaded",
+    EVENT_SAVED: "saved",
+    EVENT_REACHED: "reached",
+    EVENT_ADVANCED: "advanced",
+}
+
+SYNC_EVERY_RECORDS = 64
+SYNC_INTERVAL = 5.0
+
+
+def _labels_path(file_path):
+    return f"{file_path}.labels"
+
+
+def _read_labels(file_path):
+    try:
+        with open(_labels_path(file_path), "r", encoding="utf-8") as f:
+            return [None] + [line.rstrip("\n") for line in f]
+    except FileNotFoundError:
+        return [None]
+
+
+def _ends_without_newline(path):
+    """True if the file's last line was cut off (a crash while appending a label)."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except OSError:
+        # Missing or empty
+        return False
+
+
+class EventLog:
+    """
+    Writer side of the log.
+
+    Args:
+        file_path: Log file, created with its header when missing
+        clock: Callable returning UTC epoch seconds (time.time)
+    """
+
+    def __init__(self, file_path=EVENT_LOG_FILE, clock=time.time):
+        self.file_path = file_path
+        self.clock = clock
+        labels = _read_labels(file_path)
+        self._label_ids = {label: index for index, label in enumerate(labels) if label is not None}
+        # Ids are line numbers, so duplicate and torn lines still use one up
+        self._label_count = len(labels) - 1
+        self._labels_file = None
+
+        new_file = not os.path.exists(file_path) or os.path.getsize(file_path) < HEADER.size
+        self._file = open(file_path, "ab")
+        if new_file:
+            self._file.truncate(0)
+            self._file.write(HEADER.pack(MAGIC, LOG_VERSION, RECORD.size))
+        else:
+            # Drop a torn record left by a crash so every record stays aligned
+            size = os.path.getsize(file_path)
+            extra = (size - HEADER.size) % RECORD.size
+            if extra:
+                self._file.truncate(size - extra)
+        self._last_time = self._read_last_time()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _read_last_time(self):
+        size = os.path.getsize(self.file_path)
+        if size < HEADER.size + RECORD.size:
+            return 0
+        with open(self.file_path, "rb") as f:
+            f.seek(size - RECORD.size)
+            return RECORD.unpack(f.read(RECORD.size))[0]
+
+    def _label_id(self, label):
+        if not label:
+            return 0
+        label = label.replace("\n", " ")
+        label_id = self._label_ids.get(label)
+        if label_id is None:
+            if self._labels_file is None:
+                labels_path = _labels_path(self.file_path)
+                torn = _ends_without_newline(labels_path)
+                self._labels_file = open(labels_path, "a", encoding="utf-8")
+                if torn:
+                    # End the cut-off line, it keeps its line number
+                    self._labels_file.write("\n")
+            self._labels_file.write(label + "\n")
+            self._labels_file.flush()
+            self._label_count += 1
+            label_id = self._label_count
+            self._label_ids[label] = label_id
+        return label_id
+
+    def append(self, kind, target, label=None):
+        """Appends one event for target (naive datetime)."""
+        # Times never go backwards (clock adjustments), which keeps the file sorted for the reader
+        now = max(int(self.clock()), self._last_time)
+        self._last_time = now
+        self._file.write(RECORD.pack(now, to_epoch(target), self._label_id(label), kind, 0))
+        self._file.flush()
+        self._unsynced += 1
+        self.maybe_sync()
+
+    def maybe_sync(self):
+        """fsyncs when enough records are pending or the interval passed; cheap enough to call every tick."""
+        if self._unsynced and (self._unsynced >= SYNC_EVERY_RECORDS or time.monotonic() - self._last_sync >= SYNC_INTERVAL):
+            self.sync()
+
+    def sync(self):
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            if self._labels_file is not None:
+                os.fsync(self._labels_file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        self.sync()
+        self._file.close()
+        if self._labels_file is not None:
+            self._labels_file.close()
+
+
+class EventLogReader:
+    """
+    Memory-mapped, read-only view of the log. Records are (time, target_epoch, label_id, kind, flags);
+    use label() and from_epoch() to turn them into names and datetimes.
+    """
+
+    def __init__(self, file_path=EVENT_LOG_FILE):
+        self.file_path = file_path
+        self._labels = _read_labels(file_path)
+        self._file = open(file_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            raise ValueError(f"'{file_path}' is not an event log")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != LOG_VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"'{file_path}' is not a version {LOG_VERSION} event log")
+        # A record still being written by the app is ignored
+        self._count = (size - HEADER.size) // RECORD.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+
+    def label(self, label_id):
+        return self._labels[label_id] if label_id < len(self._labels) else None
+
+    def bisect(self, timestamp):
+        """Index of the first record with time >= timestamp."""
+        low, high = 0, self._count
+        unpack_time = struct.Struct("<q").unpack_from
+        while low < high:
+            middle = (low + high) // 2
+            if unpack_time(self._map, HEADER.size + middle * RECORD.size)[0] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def iter_range(self, start=None, end=None):
+        """Yields the records with start <= time < end (UTC epoch seconds, None = open)."""
+        first = self.bisect(start) if start is not None else 0
+        last = self.bisect(end) if end is not None else self._count
+        if first >= last:
+            return
+        # The views are released when the generator ends, otherwise the map could not be closed
+        with memoryview(self._map) as view, view[HEADER.size + first * RECORD.size:HEADER.size + last * RECORD.size] as records:
+            yield from RECORD.iter_unpack(records)
+
+    def count(self, kind=None, start=None, end=None):
+        if kind is None:
+            end_index = self.bisect(end) if end is not None else self._count
+            return end_index - (self.bisect(start) if start is not None else 0)
+        return sum(1 for record in self.iter_range(start, end) if record[3] == kind)
+
+    def last(self, kind=None, before=None):
+        """Newest record (of kind) with time < before, or None. Scans backwards from the end."""
+        index = (self.bisect(before) if before is not None else self._count) - 1
+        while index >= 0:
+            record = self[index]
+            if kind is None or record[3] == kind:
+                return record
+            index -= 1
+        return None
+
+    def time_since(self, kind=None, now=None):
+        """Seconds since the newest event of kind, or None if there is none."""
+        record = self.last(kind)
+        if record is None:
+            return None
+        return (time.time() if now is None else now) - record[0]
+
+    def describe(self, record):
+        """(event time as naive local datetime, event name, target datetime, label)"""
+        timestamp, target, label_id, kind, _ = record
+        return datetime.fromtimestamp(timestamp), EVENT_NAMES.get(kind, str(kind)), from_epoch(target), self.label(label_id)
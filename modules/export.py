@@ -0,0 +1,174 @@
+"""
+Streaming export of countdown tables to CSV, ICS or JSON Lines.
+
+The export is a generator pipeline:
+
+    iter_countdown_files(paths) -> iter_rows(targets, now) -> write_<format>(rows, file)
+
+Targets and rows are produced one at a time and written through a large
+output buffer, so memory stays constant no matter how many targets are
+exported. Every row carries the same breakdowns the main window shows.
+
+Usage:
+    from modules.export import export_targets, iter_countdown_files
+    ...
+    export_targets(iter_countdown_files(paths, now), "report.csv", now=now)
+"""
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from modules.breakdown import compute_breakdown, BREAKDOWN_FIELDS
+from modules.countdown_file import read_countdown_file, countdown_label, DATE_FORMAT
+from modules.ics_import import iter_ics_targets
+from modules.recurrence import RecurringTarget
+
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".ics": "ics",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# Rows are collected in a 1 MiB buffer before each write to the file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+ROW_FIELDS = ("label", "target") + BREAKDOWN_FIELDS
+
+
+def current_occurrence(target, rule_text, now):
+    """The target the window would show at now: recurring targets that passed move to their next occurrence."""
+    if rule_text and now >= target:
+        return RecurringTarget(rule_text, target).next_occurrence(now) or target
+    return target
+
+
+def iter_countdown_rules(paths):
+    """
+    Yields (label, target, rule_text) for every readable .countdown file, targets as stored
+    (rule_text is None for one-shot targets); unreadable files are reported and skipped.
+    .ics files contribute one row per event (streamed, see modules/ics_import.py).
+    """
+    for path in paths:
+        path = path.strip()
+        if not path:
+            continue
+        if path.lower().endswith(".ics"):
+            yield from iter_ics_targets(path)
+            continue
+        try:
+            target, rule_text = read_countdown_file(path)
+        except Exception as e:
+            print(f"[WARNING]: Skipping '{path}': {e}")
+            continue
+        yield countdown_label(path), target, rule_text
+
+
+def iter_countdown_files(paths, now=None):
+    """
+    Yields (label, target) for every row of iter_countdown_rules(paths).
+    Recurring targets are advanced to their next occurrence after now (default: datetime.now() once).
+    """
+    now = now or datetime.now()
+    for label, target, rule_text in iter_countdown_rules(paths):
+        try:
+            yield label, current_occurrence(target, rule_text, now)
+        except (ValueError, TypeError) as e:
+            # A rule dateutil cannot read, the target stays where it is
+            print(f"[WARNING]: Repeat rule of '{label}' ignored: {e}")
+            yield label, target
+
+
+def iter_rows(targets, now=None):
+    """Yields one tuple per (label, target), ordered like ROW_FIELDS."""
+    now = now or datetime.now()
+    for label, target in targets:
+        yield (label, target.strftime(DATE_FORMAT)) + compute_breakdown(now, target)
+
+
+def write_csv(rows, file, now=None):
+    writer = csv.writer(file)
+    writer.writerow(ROW_FIELDS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows, file, now=None):
+    count = 0
+    for row in rows:
+        file.write(json.dumps(dict(zip(ROW_FIELDS, row)), ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def _ics_escape(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_line(line):
+    """Folds a content line at 75 characters (RFC 5545 3.1) and terminates it with CRLF."""
+    if len(line) <= 75:
+        return line + "\r\n"
+    parts = [line[:75]]
+    parts.extend(" " + line[index:index + 74] for index in range(75, len(line), 74))
+    return "\r\n".join(parts) + "\r\n"
+
+
+def write_ics(rows, file, now=None):
+    """now (naive local, the time the breakdowns were computed for) becomes every event's DTSTAMP, in UTC."""
+    file.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//CustomTkinter-Countdown//Export//EN\r\n")
+    stamp = (now or datetime.now()).astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    count = 0
+    for row in rows:
+        values = dict(zip(ROW_FIELDS, row))
+        # "2025-10-14 00:00:00" -> "20251014T000000"
+        start = values["target"].replace("-", "").replace(":", "").replace(" ", "T")
+        description = ", ".join(f"{field}={values[field]}" for field in BREAKDOWN_FIELDS)
+        file.write("BEGIN:VEVENT\r\n")
+        file.write(_ics_line(f"UID:countdown-{count}-{start}"))
+        file.write(f"DTSTAMP:{stamp}\r\n")
+        file.write(f"DTSTART:{start}\r\n")
+        file.write(_ics_line(f"SUMMARY:{_ics_escape(values['label'])}"))
+        file.write(_ics_line(f"DESCRIPTION:{_ics_escape(description)}"))
+        file.write("END:VEVENT\r\n")
+        count += 1
+    file.write("END:VCALENDAR\r\n")
+    return count
+
+
+WRITERS = {
+    "csv": write_csv,
+    "ics": write_ics,
+    "jsonl": write_jsonl,
+}
+
+
+def detect_format(output_path):
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{extension}' (use {', '.join(EXPORT_FORMATS)})")
+    return EXPORT_FORMATS[extension]
+
+
+def export_rows(rows, output_path, fmt=None, now=None):
+    """
+    Streams rows (ordered like ROW_FIELDS) into output_path. fmt defaults to the file extension,
+    now is the reference time of the rows (ICS DTSTAMP). Returns the number of exported rows.
+    """
+    fmt = fmt or detect_format(output_path)
+    writer = WRITERS[fmt]
+    # csv and ics handle line endings themselves
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_SIZE) as file:
+        count = writer(rows, file, now)
+    print(f"[INFO]: Exported {count} countdown(s) to {output_path} ({fmt})")
+    return count
+
+
+def export_targets(targets, output_path, fmt=None, now=None):
+    """Streams (label, target) pairs into output_path. Returns the number of exported rows."""
+    now = now or datetime.now()
+    return export_rows(iter_rows(targets, now), output_path, fmt, now)
@@ -0,0 +1,232 @@
+"""
+Local HTTP/JSON countdown API.
+
+An asyncio server bound to localhost runs in its own daemon thread next to
+the Tk main loop:
+
+    GET /api/targets   -> JSON with the breakdown of every loaded target
+    GET /api/events    -> Server-Sent Events stream, one message per second
+
+Breakdowns are computed at most once per second and the encoded response
+is shared by every client, so 1,000 polling clients cost about as much as
+one. The Tk thread only hands over a private copy of its TargetStore.
+
+Browsers only get CORS headers for origins in cors_origins (empty by
+default), so other web pages cannot read the countdowns through the user's
+browser. An allowed Origin is echoed back together with "Vary: Origin".
+
+Usage:
+    from modules.http_api import CountdownApiServer
+    ...
+    server = CountdownApiServer(port=8765, cors_origins=["http://localhost:3000"])
+    server.start()
+    server.publish_targets((("Countdown", target),))
+"""
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+from modules.breakdown import compute_breakdown
+from modules.countdown_file import DATE_FORMAT
+from modules.targets import TargetStore
+
+MAX_HEADER_BYTES = 16 * 1024
+
+
+class CountdownApiServer:
+    """
+    Args:
+        host: Interface to bind (keep it on localhost, there is no authentication)
+        port: TCP port
+        clock: Callable returning the current naive datetime
+        cors_origins: Origins (e.g. "http://localhost:3000") allowed to read the API from a browser
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765, clock=datetime.now, cors_origins=()):
+        self.host = host
+        self.port = port
+        self.clock = clock
+        self.cors_origins = frozenset(origin.rstrip("/") for origin in cors_origins)
+        self._targets = TargetStore()
+        self._cache_now = None
+        self._cache_targets = None
+        self._json_head = b""
+        self._json_body = b""
+        self._sse_message = b""
+        self._tick = None           # asyncio.Event replaced every second, awaited by SSE clients
+        self._sse_clients = 0
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self.requests_served = 0
+        self.snapshots_built = 0
+
+    # --- called from the Tk thread ---
+
+    def publish_targets(self, targets):
+        """Replaces the served targets with a TargetStore (copied) or an iterable of (label, target) pairs."""
+        self._targets = targets.copy() if isinstance(targets, TargetStore) else TargetStore.from_pairs(targets)
+
+    def start(self):
+        """Starts the server thread. Errors (e.g. port in use) are reported, not raised."""
+        if self._thread is not None:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="countdown-http-api", daemon=True)
+        self._thread.start()
+        ready.wait(5)
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self):
+        """Blocks until the server thread ends (used by the headless 'serve' command)."""
+        if self._thread is not None:
+            self._thread.join()
+
+    def stop(self):
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    # --- server thread ---
+
+    def _run(self, ready):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_connection, self.host, self.port)
+            )
+        except OSError as e:
+            print(f"[ERROR] HTTP API could not listen on {self.host}:{self.port}: {e}")
+            ready.set()
+            return
+        self._tick = asyncio.Event()
+        self._loop.create_task(self._ticker())
+        print(f"[INFO]: HTTP API listening on http://{self.host}:{self.port}/api/targets")
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    def _snapshot(self):
+        """
+        Returns the cached (json_head, json_body, sse_message), rebuilt once per second or when
+        targets change. json_head ends before the blank line, so CORS headers can follow it.
+        """
+        now = self.clock().replace(microsecond=0)
+        targets = self._targets
+        if now != self._cache_now or targets is not self._cache_targets:
+            body = json.dumps({
+                "now": now.strftime(DATE_FORMAT),
+                "targets": [
+                    dict(compute_breakdown(now, target)._asdict(), label=label, target=target.strftime(DATE_FORMAT))
+                    for label, target in targets.iter_pairs()
+                ],
+            }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            self._json_head = (
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json; charset=utf-8\r\n"
+                b"Cache-Control: no-store\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+            )
+            self._json_body = b"\r\n" + body
+            self._sse_message = b"data: " + body + b"\n\n"
+            self._cache_now, self._cache_targets = now, targets
+            self.snapshots_built += 1
+        return self._json_head, self._json_body, self._sse_message
+
+    def _cors_headers(self, headers):
+        """CORS header lines for the request's Origin, empty unless it is in cors_origins."""
+        if not self.cors_origins:
+            return b""
+        for line in headers.split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "origin":
+                origin = value.strip()
+                if origin in self.cors_origins:
+                    return f"Access-Control-Allow-Origin: {origin}\r\nVary: Origin\r\n".encode("latin-1")
+                break
+        return b"Vary: Origin\r\n"
+
+    async def _ticker(self):
+        while True:
+            await asyncio.sleep(1 - (time.time() % 1))
+            if self._sse_clients:
+                self._snapshot()
+                # Wake every SSE client at once, they all send the same cached bytes
+                tick, self._tick = self._tick, asyncio.Event()
+                tick.set()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                if len(head) > MAX_HEADER_BYTES:
+                    return
+                request_line, _, headers = head.decode("latin-1").partition("\r\n")
+                parts = request_line.split(" ")
+                if len(parts) != 3:
+                    return
+                method, path, version = parts
+                path = path.split("?", 1)[0]
+                keep_alive = version == "HTTP/1.1" and "connection: close" not in headers.lower()
+                self.requests_served += 1
+
+                if method != "GET":
+                    writer.write(_plain_response(405, "Method Not Allowed"))
+                elif path == "/api/targets":
+                    json_head, json_body, _ = self._snapshot()
+                    writer.writelines((json_head, self._cors_headers(headers), json_body))
+                elif path == "/api/events":
+                    await self._stream_events(writer, self._cors_headers(headers))
+                    return
+                else:
+                    writer.write(_plain_response(404, "Not Found"))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _stream_events(self, writer, cors_headers=b""):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-store\r\n"
+            + cors_headers +
+            b"Connection: keep-alive\r\n\r\n"
+        )
+        self._sse_clients += 1
+        try:
+            writer.write(self._snapshot()[2])
+            await writer.drain()
+            while True:
+                await self._tick.wait()
+                writer.write(self._sse_message)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._sse_clients -= 1
+
+
+def _plain_response(status, reason):
+    body = reason.encode()
+    return (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        f"Content-Type: text/plain\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
@@ -0,0 +1,203 @@
+"""
+Streaming import of iCalendar (.ics) events as countdown targets.
+
+The file is read line by line: a generator unfolds continuation lines,
+another one collects only DTSTART / SUMMARY / RRULE of each VEVENT, and
+events outside the requested date window are dropped before anything is
+kept. A 100 MB calendar is processed in constant memory.
+
+Usage:
+    from modules.ics_import import iter_ics_targets
+    ...
+    for summary, target, rule_text in iter_ics_targets("calendar.ics", start=datetime.now()):
+        ...
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from dateutil import tz
+from modules.recurrence import RecurringTarget
+
+_TZ_CACHE = {}
+_UTC_UNTIL = re.compile(r"UNTIL=(\d{8}T\d{6})Z", re.IGNORECASE)
+_COUNT = re.compile(r"(?<![A-Z])COUNT=(\d+)", re.IGNORECASE)
+
+
+def iter_unfolded_lines(file):
+    """Yields logical content lines, joining folded lines (RFC 5545 3.1: CRLF + space/tab)."""
+    parts = None
+    for raw_line in file:
+        line = raw_line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if parts is not None:
+                parts.append(line[1:])
+            continue
+        if parts is not None:
+            yield "".join(parts)
+        parts = [line]
+    if parts is not None:
+        yield "".join(parts)
+
+
+def _split_property(line):
+    """'DTSTART;TZID=Europe/Warsaw:20250101T090000' -> ('DTSTART', {'TZID': 'Europe/Warsaw'}, '20250101T090000')"""
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    return name.upper(), dict(param.partition("=")[::2] for param in params), value
+
+
+def _unescape(text):
+    return text.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+
+def _get_tz(tzid):
+    if tzid not in _TZ_CACHE:
+        _TZ_CACHE[tzid] = tz.gettz(tzid.strip('"'))
+    return _TZ_CACHE[tzid]
+
+
+def source_zone(value, params):
+    """Zone name of a DTSTART value ("UTC", its TZID), or None for floating/DATE values and unknown TZIDs."""
+    value = value.strip()
+    if len(value) == 8 or params.get("VALUE") == "DATE":
+        return None
+    if value.endswith("Z"):
+        return "UTC"
+    if "TZID" in params and _get_tz(params["TZID"]) is not None:
+        return params["TZID"].strip('"')
+    return None
+
+
+def parse_ics_datetime(value, params):
+    """
+    Converts a DTSTART value to a naive local datetime, like the rest of the app uses.
+    Handles DATE values, UTC ('Z'), TZID and floating times. Unknown TZIDs are treated as local.
+    """
+    value = value.strip()
+    if len(value) == 8 or params.get("VALUE") == "DATE":
+        return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    dt = datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15])
+    )
+    if value.endswith("Z"):
+        source_tz = timezone.utc
+    elif "TZID" in params:
+        source_tz = _get_tz(params["TZID"])
+    else:
+        return dt
+    if source_tz is None:
+        return dt
+    # astimezone() without arguments converts to the system zone in C
+    return dt.replace(tzinfo=source_tz).astimezone().replace(tzinfo=None)
+
+
+def _localize_rule(rule_text):
+    """
+    Rewrites a UTC UNTIL to local time for rules of floating starts,
+    dateutil refuses to mix it with a naive DTSTART.
+    """
+    def to_local(match):
+        until = parse_ics_datetime(match.group(1) + "Z", {})
+        return f"UNTIL={until.strftime('%Y%m%dT%H%M%S')}"
+    return _UTC_UNTIL.sub(to_local, rule_text)
+
+
+def _remaining_count(recurrence, first):
+    """
+    Rewrites COUNT for a rule restarted at its occurrence 'first': the occurrences
+    between the anchor and first are used up, so a weekly COUNT=10 still ends on its 10th week.
+    """
+    rule_text = recurrence.rule_text
+    match = _COUNT.search(rule_text)
+    if match is None:
+        return rule_text
+    # COUNT bounds the walk, the rule was already walked this far to find 'first'
+    skipped = recurrence.count_before(first)
+    return f"{rule_text[:match.start(1)]}{int(match.group(1)) - skipped}{rule_text[match.end(1):]}"
+
+
+def iter_vevents(lines):
+    """Yields (summary, dtstart_value, dtstart_params, rrule) for each VEVENT, ignoring nested components."""
+    in_event = False
+    depth = 0
+    summary = dtstart = params = rrule = None
+    for line in lines:
+        if line.startswith("BEGIN:"):
+            if line == "BEGIN:VEVENT":
+                in_event, depth = True, 0
+                summary = dtstart = params = rrule = None
+            elif in_event:
+                depth += 1  # e.g. VALARM inside the event
+            continue
+        if not in_event:
+            continue
+        if line.startswith("END:"):
+            if depth:
+                depth -= 1
+            elif line == "END:VEVENT":
+                in_event = False
+                if dtstart is not None:
+                    yield summary or "", dtstart, params, rrule
+            continue
+        if depth:
+            continue
+        # Only three properties matter, everything else is skipped without parsing
+        first = line[:1]
+        if first == "D" and line.startswith("DTSTART"):
+            _, params, dtstart = _split_property(line)
+        elif first == "S" and line.startswith("SUMMARY"):
+            summary = _unescape(_split_property(line)[2])
+        elif first == "R" and line.startswith("RRULE"):
+            rrule = _split_property(line)[2]
+
+
+def iter_ics_targets(file_path, start=None, end=None):
+    """
+    Yields (summary, target, rule_text or None) for events whose start lies in [start, end).
+    Recurring events are moved to their first occurrence inside the window, with
+    COUNT lowered by the occurrences skipped, so the rule still ends where it did.
+    Rules of events with a UTC or TZID start carry that zone as TZID (see
+    modules/recurrence.py), so they keep repeating at the calendar's wall-clock time.
+    Events with unreadable dates or rules are skipped.
+    """
+    # Cheap pre-filter on the raw YYYYMMDD text, with a day of margin for time zone shifts
+    start_key = (start - timedelta(days=1)).strftime("%Y%m%d") if start is not None else None
+    end_key = (end + timedelta(days=1)).strftime("%Y%m%d") if end is not None else None
+
+    with open(file_path, "r", encoding="utf-8", errors="replace") as file:
+        for summary, value, params, rrule in iter_vevents(iter_unfolded_lines(file)):
+            day_key = value.strip()[:8]
+            if end_key is not None and day_key > end_key:
+                continue
+            if start_key is not None and day_key < start_key and not rrule:
+                continue
+            if rrule:
+                zone = source_zone(value, params)
+                # Expanded in the event's own zone, where a UTC UNTIL is valid as it is
+                rrule = f"{rrule};TZID={zone}" if zone else _localize_rule(rrule)
+            try:
+                target = parse_ics_datetime(value, params)
+            except (ValueError, IndexError, OverflowError):
+                continue
+            if rrule and start is not None and target < start:
+                try:
+                    recurrence = RecurringTarget(rrule, target)
+                    first = recurrence.next_occurrence(start)
+                    if first is None:
+                        continue
+                    rrule = _remaining_count(recurrence, first)
+                except (ValueError, TypeError):
+                    # A rule dateutil cannot read (or combine with a naive start): the
+                    # event's own start is before the window, so it is skipped
+                    continue
+                target = first
+            if start is not None and target < start:
+                continue
+            if end is not None and target >= end:
+                continue
+            yield summary, target, rrule
+
+
+def next_ics_event(file_path, now):
+    """Returns the (summary, target, rule_text) starting soonest after now, or None (single pass)."""
+    return min(iter_ics_targets(file_path, start=now), key=lambda event: event[1], default=None)
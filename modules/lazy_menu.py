@@ -0,0 +1,51 @@
+"""
+Menu bar dropdowns built on first use.
+
+A CustomDropdownMenu (CTkMenuBar) is a frame with one CTkButton per
+option, so building every menu up front costs dozens of widgets before
+the first frame is painted. LazyDropdown only keeps the cascade button
+and a populate callback; the dropdown and its options are created on the
+first click, and from then on the button toggles the real menu.
+
+Usage:
+    from modules.lazy_menu import LazyDropdown
+    ...
+    file_menu = LazyDropdown(menu_bar.add_cascade("File"), populate_file_menu)
+
+    def populate_file_menu(dropdown):
+        dropdown.add_option(option="Load File", command=load_file_dialog)
+"""
+from CTkMenuBar import CustomDropdownMenu
+
+
+class LazyDropdown:
+    """
+    Args:
+        button: Cascade button returned by CTkMenuBar.add_cascade()
+        populate: populate(dropdown) adds the options to the new CustomDropdownMenu
+        menu_options: Keyword arguments for CustomDropdownMenu
+    """
+
+    def __init__(self, button, populate, **menu_options):
+        self.button = button
+        self.populate = populate
+        self.menu_options = menu_options
+        self.dropdown = None
+        button.configure(command=self.open)
+
+    @property
+    def built(self):
+        return self.dropdown is not None
+
+    def build(self):
+        """Creates the dropdown now (CustomDropdownMenu rebinds the button to its own toggle). Returns it."""
+        if self.dropdown is None:
+            self.dropdown = CustomDropdownMenu(widget=self.button, **self.menu_options)
+            self.populate(self.dropdown)
+        return self.dropdown
+
+    def open(self):
+        self.build()
+        # Shown once the click that created it is fully handled, otherwise the
+        # menu's own "clicked outside" check could close it again right away
+        self.button.after_idle(self.dropdown.toggleShow)
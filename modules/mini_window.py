@@ -0,0 +1,81 @@
+"""
+Compact always-on-top countdown window.
+
+A MiniWindow is only a view of the shared TickEngine (see
+modules/tick_engine.py): it subscribes on open, renders the frame of one
+target every tick and unsubscribes when it is closed. Any number can be
+open (e.g. one per monitor) without adding another timer loop or
+breakdown computation.
+
+Usage:
+    from modules.mini_window import MiniWindow
+    ...
+    MiniWindow(root, engine, theme, fonts, compact_format="{days} d {hours:02}:{minutes:02}:{seconds:02}")
+"""
+import customtkinter as ctk
+
+
+class MiniWindow(ctk.CTkToplevel):
+    """
+    Args:
+        master: Parent window
+        engine: TickEngine to subscribe to
+        theme: ThemeRegistry providing the colors
+        fonts: (label_font, countdown_font)
+        compact_format: str.format template with {days}, {hours}, {minutes}, {seconds} and {sign}
+        index: Target index shown (0 = main target)
+        title: Window title
+    """
+
+    def __init__(self, master, engine, theme, fonts, compact_format, index=0, title="Countdown"):
+        super().__init__(master)
+        self.engine = engine
+        self.theme = theme
+        self.compact_format = compact_format
+        self.index = index
+        self._text = None
+
+        self.title(title)
+        self.geometry("280x90")
+        self.attributes("-topmost", True)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.frame = ctk.CTkFrame(self, fg_color=theme.color("background_color"))
+        self.frame.pack(fill="both", expand=True)
+        self.label = ctk.CTkLabel(self.frame, text="", font=fonts[0], text_color=theme.color("text_color"))
+        self.label.pack(pady=(8, 0))
+        self.countdown = ctk.CTkLabel(self.frame, text="", font=fonts[1], text_color=theme.color("highlight_color"))
+        self.countdown.pack(pady=(0, 8))
+        for widget, role, option in (
+            (self.frame, "background_color", "fg_color"),
+            (self.label, "text_color", "text_color"),
+            (self.countdown, "highlight_color", "text_color"),
+        ):
+            theme.register(widget, role, option, apply=False)
+
+        engine.subscribe(self.render)
+
+    def render(self, tick):
+        if self.index >= len(tick):
+            return
+        frame = tick[self.index]
+        # Only the total_* fields are shown, the calendar difference is not needed
+        breakdown = frame.breakdown(calendar=False)
+        text = self.compact_format.format(
+            sign="" if frame.mode == "remaining" else "+",
+            days=breakdown.total_days,
+            hours=breakdown.hours,
+            minutes=breakdown.minutes,
+            seconds=breakdown.seconds,
+        )
+        # configure() redraws the labels, skip it when nothing changed
+        if (text, frame.label) != self._text:
+            self._text = (text, frame.label)
+            self.countdown.configure(text=text)
+            self.label.configure(text=frame.label or "")
+
+    def close(self):
+        self.engine.unsubscribe(self.render)
+        for widget in (self.frame, self.label, self.countdown):
+            self.theme.unregister(widget)
+        self.destroy()
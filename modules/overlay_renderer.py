@@ -0,0 +1,185 @@
+"""
+Offscreen countdown renderer for streaming/signage overlays (Pillow, no Tk window).
+
+Every glyph is rasterized once per font style into a cached mask. A frame
+is composed by blitting cached glyph masks, and only the part of a line
+that changed since the previous frame is cleared and redrawn (with
+tabular digits usually just the last few characters). Unchanged frames
+are not encoded at all; changed ones are PNG-encoded with fast zlib
+settings, and encode_regions() hands out only the dirty rectangles for
+consumers that can patch an existing image.
+
+Usage:
+    from modules.overlay_renderer import OverlayRenderer
+    ...
+    renderer = OverlayRenderer((1920, 1080), FONT_SETTINGS, COLOR_SETTINGS["dark"])
+    renderer.render([("Current Date: ...", "title"), ("Time remaining: ...", "countdown")])
+    renderer.save_png("overlay.png")
+"""
+import io
+import os
+from PIL import Image, ImageDraw, ImageFont
+
+# Window height the FONT_SETTINGS sizes were designed for
+BASE_HEIGHT = 420
+LINE_SPACING = 1.25
+
+
+def load_font(font_setting, scale=1.0):
+    """
+    Loads a FONT_SETTINGS entry such as ("Arial", 18, "bold") as a Pillow font.
+    Falls back to Pillow's built-in font when the family is not installed.
+    """
+    family, size = font_setting[0], max(1, int(round(font_setting[1] * scale)))
+    bold = len(font_setting) > 2 and "bold" in str(font_setting[2]).lower()
+    base = family.replace(" ", "")
+    candidates = [f"{base}bd.ttf", f"{base}-Bold.ttf", f"{base}.ttf"] if bold else [f"{base}.ttf"]
+    for name in candidates + [name.lower() for name in candidates]:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+class GlyphCache:
+    """Rasterized glyph masks (mode "L") and advances for one font."""
+
+    def __init__(self, font):
+        self.font = font
+        ascent, descent = font.getmetrics()
+        self.height = ascent + descent
+        self._glyphs = {}
+
+    def glyph(self, char):
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            advance = max(1, int(round(self.font.getlength(char))))
+            mask = Image.new("L", (advance + self.height // 2, self.height), 0)
+            ImageDraw.Draw(mask).text((0, 0), char, font=self.font, fill=255)
+            glyph = (mask, advance)
+            self._glyphs[char] = glyph
+        return glyph
+
+    def offsets(self, text):
+        """x offset of every character plus the total width."""
+        offsets = []
+        x = 0
+        for char in text:
+            offsets.append(x)
+            x += self.glyph(char)[1]
+        return offsets, x
+
+
+class OverlayRenderer:
+    """
+    Args:
+        size: (width, height) of the frame
+        font_settings: FONT_SETTINGS dict
+        palette: COLOR_SETTINGS["dark"] / ["light"] dict
+        transparent: Transparent background instead of background_color
+    """
+
+    def __init__(self, size, font_settings, palette, transparent=False):
+        self.size = size
+        scale = size[1] / BASE_HEIGHT
+        self._glyph_caches = {style: GlyphCache(load_font(setting, scale)) for style, setting in font_settings.items()}
+        self.background = (0, 0, 0, 0) if transparent else _rgba(palette.get("background_color", "#2E2E2E"))
+        self.text_color = _rgba(palette.get("text_color", "#FFFFFF"))
+        self.frame = Image.new("RGBA", size, self.background)
+        self._ink = Image.new("RGBA", size, self.text_color)
+        self._slots = []        # [(style, y)] per physical line
+        self._drawn = []        # [(text, x, offsets, width)] per physical line
+        self.dirty = []         # boxes changed by the last render()
+        self.frames_rendered = 0
+        self.frames_encoded = 0
+
+    def render(self, labels):
+        """
+        Draws [(text, style), ...] (text may contain newlines). Returns the list of
+        dirty (left, top, right, bottom) boxes; empty when nothing changed.
+        """
+        lines = [(line, style) for text, style in labels for line in text.split("\n")]
+        styles = [style for _, style in lines]
+        if styles != [style for style, _ in self._slots]:
+            self._layout(styles)
+
+        self.dirty = []
+        width = self.size[0]
+        for index, (text, style) in enumerate(lines):
+            old_text, old_x, old_offsets, old_width = self._drawn[index]
+            if text == old_text:
+                continue
+            cache = self._glyph_caches[style]
+            offsets, text_width = cache.offsets(text)
+            x = (width - text_width) // 2
+            y = self._slots[index][1]
+
+            if x == old_x and text_width == old_width:
+                # Same width and position: only redraw from the first differing character
+                first = next((i for i, (a, b) in enumerate(zip(text, old_text)) if a != b), min(len(text), len(old_text)))
+                left = x + (offsets[first] if first < len(offsets) else text_width)
+            else:
+                first = 0
+                left = min(x, old_x) if old_text is not None else x
+            right = max(x + text_width, old_x + old_width) if old_text is not None else x + text_width
+            box = (max(0, left), y, min(width, right + cache.height // 2), min(self.size[1], y + cache.height))
+            if box[2] <= box[0] or box[3] <= box[1]:
+                self._drawn[index] = (text, x, offsets, text_width)
+                continue
+
+            self.frame.paste(self.background, box)
+            for char, offset in zip(text[first:], offsets[first:]):
+                mask, _ = cache.glyph(char)
+                position = (x + offset, y)
+                self.frame.paste(self._ink.crop((*position, position[0] + mask.width, position[1] + mask.height)), position, mask)
+            self._drawn[index] = (text, x, offsets, text_width)
+            self.dirty.append(box)
+
+        self.frames_rendered += 1
+        return self.dirty
+
+    def _layout(self, styles):
+        """Computes fixed line positions (vertically centered block) and clears the frame."""
+        heights = [int(self._glyph_caches[style].height * LINE_SPACING) for style in styles]
+        y = max(0, (self.size[1] - sum(heights)) // 2)
+        self._slots = []
+        for style, height in zip(styles, heights):
+            self._slots.append((style, y))
+            y += height
+        self._drawn = [(None, 0, [], 0)] * len(styles)
+        self.frame.paste(self.background, (0, 0, *self.size))
+
+    def encode_png(self):
+        self.frames_encoded += 1
+        buffer = io.BytesIO()
+        # Level 1 zlib: large flat areas still compress well, encoding stays fast
+        self.frame.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
+
+    def encode_regions(self):
+        """PNG bytes of only the dirty boxes from the last render(), as [(box, png_bytes)]."""
+        regions = []
+        for box in self.dirty:
+            buffer = io.BytesIO()
+            self.frame.crop(box).save(buffer, format="PNG", compress_level=1)
+            regions.append((box, buffer.getvalue()))
+        return regions
+
+    def save_png(self, file_path, force=False):
+        """
+        Rewrites file_path atomically (temp file + rename) so readers never see a half-written
+        image. Skipped when the last render() changed nothing. Returns True if written.
+        """
+        if not self.dirty and not force:
+            return False
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.encode_png())
+        os.replace(temp_path, file_path)
+        return True
+
+
+def _rgba(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4)) + (255,)
@@ -0,0 +1,128 @@
+"""
+Recurring countdown targets built on top of dateutil's rrule.
+
+A .countdown file may carry an optional second line with an iCalendar rule:
+
+    2025-10-14 00:00:00
+    RRULE:FREQ=YEARLY
+
+A rule may name the time zone it repeats in with a TZID part, as an
+imported calendar event does ("FREQ=WEEKLY;TZID=Europe/Warsaw"). The rule
+is then expanded in that zone's wall-clock time and every occurrence is
+converted to local time, so a 09:00 Warsaw meeting stays at 09:00 Warsaw
+time across DST changes on either side. Without TZID the rule repeats in
+local time. TZID is this app's extension and is removed before dateutil
+sees the rule.
+
+The next occurrence is computed once and cached. It is only advanced (one
+rrule lookup) when the cached occurrence has passed, so asking for the
+current target on every tick is a single datetime comparison.
+
+Usage:
+    from modules.recurrence import RecurringTarget
+    ...
+    recurrence = RecurringTarget("FREQ=YEARLY", anchor)
+    target = recurrence.next_occurrence(datetime.now())
+"""
+import re
+from itertools import takewhile
+from dateutil import tz
+from dateutil.rrule import rrulestr
+
+# Rules offered in the "Repeat" menu (None = one-shot countdown)
+RECURRENCE_PRESETS = {
+    "none": None,
+    "daily": "FREQ=DAILY",
+    "weekly": "FREQ=WEEKLY",
+    "monthly": "FREQ=MONTHLY",
+    "yearly": "FREQ=YEARLY",
+}
+
+RRULE_PREFIX = "RRULE:"
+_TZID = re.compile(r";?\bTZID=([^;]*)", re.IGNORECASE)
+
+
+def normalize_rule(rule_text):
+    """Strips whitespace and the optional 'RRULE:' prefix from a rule string."""
+    rule_text = rule_text.strip()
+    if rule_text.upper().startswith(RRULE_PREFIX):
+        rule_text = rule_text[len(RRULE_PREFIX):]
+    return rule_text
+
+
+def split_rule_zone(rule_text):
+    """'FREQ=WEEKLY;TZID=Europe/Warsaw' -> ('FREQ=WEEKLY', 'Europe/Warsaw'); (rule_text, None) without TZID."""
+    match = _TZID.search(rule_text)
+    if match is None:
+        return rule_text, None
+    rule = (rule_text[:match.start()] + rule_text[match.end():]).strip(";")
+    return rule, match.group(1).strip().strip('"')
+
+
+class RecurringTarget:
+    """
+    A countdown target that repeats according to an RFC 5545 rule.
+
+    Args:
+        rule_text: Rule such as "FREQ=MONTHLY" (an "RRULE:" prefix and a TZID part are accepted)
+        anchor: First occurrence (naive local datetime), used as the rule's DTSTART
+    """
+    __slots__ = ("rule_text", "anchor", "zone", "_rule", "_next", "_previous")
+
+    def __init__(self, rule_text, anchor):
+        self.rule_text = normalize_rule(rule_text)
+        self.anchor = anchor
+        rule, zone_name = split_rule_zone(self.rule_text)
+        self.zone = None
+        if zone_name is not None:
+            self.zone = tz.gettz(zone_name)
+            if self.zone is None:
+                raise ValueError(f"Unknown time zone '{zone_name}' in repeat rule")
+        # Raises ValueError for malformed rules, callers report it like a bad date
+        self._rule = rrulestr(rule, dtstart=self._to_rule_time(anchor))
+        self._next = anchor
+        self._previous = None
+
+    def _to_rule_time(self, dt):
+        # Naive local time -> the same instant in the rule's zone
+        return dt if self.zone is None else dt.astimezone(self.zone)
+
+    def _to_local(self, dt):
+        return dt if dt is None or self.zone is None else dt.astimezone().replace(tzinfo=None)
+
+    @property
+    def current(self):
+        """Cached occurrence (None once a finite rule is exhausted)."""
+        return self._next
+
+    def next_occurrence(self, now):
+        """
+        Returns the first occurrence that is still ahead of 'now'.
+        The cached value is reused until it passes; only then is the rule walked.
+        Returns None when the rule has no more occurrences (COUNT/UNTIL reached).
+        """
+        upcoming = self._next
+        if upcoming is not None and now < upcoming:
+            return upcoming
+        if upcoming is None:
+            return None
+        self._previous = upcoming
+        self._next = self._to_local(self._rule.after(self._to_rule_time(now)))
+        return self._next
+
+    def count_before(self, dt):
+        """Number of occurrences from the anchor up to (not including) dt; walks the rule."""
+        limit = self._to_rule_time(dt)
+        return sum(1 for _ in takewhile(lambda occurrence: occurrence < limit, self._rule))
+
+    def tracks(self, dt):
+        """True if dt is the cached occurrence (or the last one of an exhausted rule)."""
+        return dt == self._next or (self._next is None and dt == self._previous)
+
+    def rebased(self, anchor):
+        """Returns the same rule anchored at a new first occurrence (used after manual edits)."""
+        return RecurringTarget(self.rule_text, anchor)
+
+    def to_file_line(self):
+        return f"{RRULE_PREFIX}{self.rule_text}"
+
@@ -0,0 +1,48 @@
+"""
+Session snapshot restored on startup.
+
+On exit the app stores where it was left: target (+ repeat rule), last
+file path and window geometry. Everything lives in one small JSON file, so
+startup costs a single read and no .countdown file has to be opened again.
+Theme and zoom are settings, they stay in settingsV2.json only (a value
+edited there while the app is closed is never overridden by the session).
+
+Usage:
+    from modules.session import load_session, save_session
+"""
+import json
+import os
+
+SESSION_FILE = "Assets/Countdown/session.json"
+SESSION_VERSION = 1
+
+
+def load_session(file_path=None):
+    """Returns the stored snapshot dict, or {} when missing/outdated/broken. file_path defaults to SESSION_FILE."""
+    # Looked up on every call, so tools can point SESSION_FILE somewhere else
+    file_path = file_path or SESSION_FILE
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[WARNING]: Could not read session snapshot '{file_path}': {e}")
+        return {}
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SESSION_VERSION:
+        print("[WARNING]: Session snapshot has an unknown version and was ignored.")
+        return {}
+    return snapshot
+
+
+def save_session(snapshot, file_path=None):
+    """Writes the snapshot through a temporary file, so a crash never leaves half a file."""
+    file_path = file_path or SESSION_FILE
+    snapshot = dict(snapshot, version=SESSION_VERSION)
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, file_path)
+    except Exception as e:
+        print(f"[ERROR]: Could not save session snapshot: {e}")
@@ -0,0 +1,198 @@
+"""
+Writes runtime setting changes back to settingsV2.json.
+
+Only the changed keys are merged into what is currently on disk, so the
+rest of the file (including hand edits made through "Open Config File")
+is kept. Changed values are replaced right in the file text, so its
+layout (blank lines between sections, one-line lists, line endings) stays
+as written; only a key the file does not have yet makes it re-serialised.
+The file is replaced atomically through a temporary file. A build that
+only ships the asset bundle (modules/assets.py) gets the loose file
+created from the bundled copy on the first write.
+
+SettingsWriter collects changes from the UI thread and writes them from a
+background timer once no new change arrived for a short delay, so ten
+quick theme toggles cost one write and the UI never waits for the disk.
+
+Usage:
+    from modules.settings_store import SettingsWriter
+    ...
+    writer = SettingsWriter(path, required_version=9)
+    writer.update({"APP_SETTINGS": {"ui_zoom_factor": 1.2}})
+    writer.flush()  # on exit
+"""
+import json
+import os
+import re
+import threading
+from modules import assets
+
+# Short lists such as fonts (["Arial", 14]) stay on one line, like the hand-written file
+_SCALAR_LIST = re.compile(r"\[[^\[\]{}]*\]")
+_SEPARATORS = re.compile(r"[\s,]*")
+_COLON = re.compile(r"\s*:\s*")
+_DECODER = json.JSONDecoder()
+
+
+def dump_settings(settings):
+    text = json.dumps(settings, indent=2, ensure_ascii=False)
+    return _SCALAR_LIST.sub(lambda m: json.dumps(json.loads(m.group(0)), ensure_ascii=False), text)
+
+
+def _member_spans(text, start):
+    """Yields (key, value start, value end) for the members of the JSON object whose "{" is at text[start]."""
+    index = start + 1
+    while True:
+        index = _SEPARATORS.match(text, index).end()
+        if text[index] == "}":
+            return
+        key, index = _DECODER.raw_decode(text, index)
+        index = _COLON.match(text, index).end()
+        _, end = _DECODER.raw_decode(text, index)
+        yield key, index, end
+        index = end
+
+
+def patch_settings_text(raw, changes):
+    """
+    Replaces the values of {section: {key: value}} in the JSON text raw, leaving
+    everything else untouched. Returns the new text, or None when a section or
+    key is not in the file (the caller re-serialises then).
+    """
+    start = _SEPARATORS.match(raw, 1 if raw.startswith("\ufeff") else 0).end()
+    sections = {key: value_start for key, value_start, _ in _member_spans(raw, start)}
+    edits = []
+    for section, values in changes.items():
+        section_start = sections.get(section)
+        if section_start is None or raw[section_start] != "{":
+            return None
+        members = {key: (value_start, end) for key, value_start, end in _member_spans(raw, section_start)}
+        for key, value in values.items():
+            if key not in members:
+                return None
+            edits.append((*members[key], json.dumps(value, ensure_ascii=False)))
+    # Back to front, so the earlier offsets stay valid
+    for value_start, end, text in sorted(edits, reverse=True):
+        raw = raw[:value_start] + text + raw[end:]
+    return raw
+
+
+def seed_settings_file(file_path):
+    """
+    Creates the loose settings file from the bundled copy when only the asset bundle has it.
+    Returns True when the loose file exists afterwards.
+    """
+    if os.path.isfile(file_path):
+        return True
+    try:
+        data = assets.read_bytes(file_path)
+    except FileNotFoundError:
+        return False
+    temp_path = f"{file_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+    except OSError as e:
+        print(f"[ERROR]: Could not create {file_path} from the asset bundle: {e}")
+        return False
+    print(f"[INFO]: Created {file_path} from the asset bundle.")
+    return True
+
+
+def update_settings_file(file_path, changes, required_version=None):
+    """
+    Merges {section: {key: value}} into the JSON settings file (VERSION is kept).
+    Skips the write when the file is missing (from disk and the asset bundle), broken,
+    has another VERSION or already holds the same values. Returns True if the file was written.
+    """
+    try:
+        if not seed_settings_file(file_path):
+            raise FileNotFoundError(file_path)
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            raw = f.read()
+        settings = json.loads(raw)
+    except FileNotFoundError:
+        print(f"[WARNING]: File {file_path} not found. Settings were not saved.")
+        return False
+    except json.JSONDecodeError as e:
+        print(f"[ERROR]: JSON decoding error, settings were not saved: {e}")
+        return False
+
+    if required_version is not None and settings.get("VERSION") != required_version:
+        print(f"[WARNING]: JSON version ({settings.get('VERSION')}) does not match required version ({required_version}). Settings were not saved.")
+        return False
+
+    changed = {}
+    for section, values in changes.items():
+        current = settings.setdefault(section, {})
+        for key, value in values.items():
+            if key not in current or current[key] != value:
+                current[key] = value
+                changed.setdefault(section, {})[key] = value
+    if not changed:
+        return False
+
+    text = patch_settings_text(raw, changed)
+    if text is None:
+        newline = "\r\n" if "\r\n" in raw else "\n"
+        text = dump_settings(settings).replace("\n", newline)
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except OSError as e:
+        print(f"[ERROR]: Could not save settings: {e}")
+        return False
+    return True
+
+
+class SettingsWriter:
+    """
+    Debounced background writer for update_settings_file().
+
+    Args:
+        file_path: Settings file
+        required_version: VERSION the file must have
+        delay: Seconds without new changes before writing
+    """
+
+    def __init__(self, file_path, required_version=None, delay=0.5):
+        self.file_path = file_path
+        self.required_version = required_version
+        self.delay = delay
+        self._pending = {}
+        # _lock guards _pending and _timer; _write_lock is held from taking the changes until they
+        # are on disk, so an older batch can never be written after a newer one
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer = None
+        self.writes = 0
+
+    def update(self, changes):
+        """Queues {section: {key: value}}; later values for the same key win."""
+        with self._lock:
+            for section, values in changes.items():
+                self._pending.setdefault(section, {}).update(values)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Writes the queued changes now (called by the timer, and on exit from the UI thread)."""
+        # One writer at a time, and each takes the changes only once the previous one wrote
+        # its batch, so batches reach the file in queue order (the newest value wins)
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                changes, self._pending = self._pending, {}
+            if changes and update_settings_file(self.file_path, changes, self.required_version):
+                self.writes += 1
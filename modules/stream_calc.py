@@ -0,0 +1,105 @@
+"""
+Streaming breakdown calculator behind "main.py calc".
+
+Reads one target timestamp per line ("%Y-%m-%d %H:%M:%S" like .countdown
+files, or ISO 8601) and writes one line per input line: the pluralized
+time_left text of the main window, or the raw breakdown numbers as JSON.
+Lines are processed one at a time (constant memory, any input size) and
+the output is joined into batches of BATCH_LINES before it is written.
+
+Timestamps are parsed with datetime.fromisoformat (C code, no strptime),
+which covers both formats; dateutil's ISO parser is only the fallback for
+the rare forms it rejects. Aware timestamps are converted to local time.
+Every line is compared with the same reference time, read once at the start.
+
+Usage:
+    from modules.stream_calc import calc_stream
+    ...
+    lines, invalid = calc_stream(sys.stdin, out, now=datetime.now(), fmt="json")
+"""
+import json
+from datetime import datetime
+from dateutil.parser import isoparse
+from modules.breakdown import compute_breakdown, BREAKDOWN_FIELDS
+
+CALC_FORMATS = ("text", "json")
+BATCH_LINES = 4096
+
+# The mode and numbers of a Breakdown in field order, e.g. {"target":"...","mode":"remaining","years":1,...}
+JSON_TEMPLATE = '{"target":"%s","mode":"%s",' + ",".join(f'"{name}":%d' for name in BREAKDOWN_FIELDS[1:]) + "}\n"
+
+
+def parse_target(text):
+    """Naive local datetime from "YYYY-MM-DD HH:MM:SS" or an ISO 8601 timestamp. Raises ValueError."""
+    try:
+        target = datetime.fromisoformat(text)
+    except ValueError:
+        # "Z" suffix and basic format (20250101T120000) on Python < 3.11, week dates, ...
+        target = isoparse(text)
+    if target.tzinfo is not None:
+        target = target.astimezone().replace(tzinfo=None)
+    return target
+
+
+def _json_line(now, target):
+    breakdown = compute_breakdown(now, target)
+    return JSON_TEMPLATE % ((target.isoformat(" "),) + breakdown)
+
+
+def _error_line(fmt, text, error):
+    if fmt == "json":
+        return json.dumps({"input": text, "error": str(error)}, ensure_ascii=False) + "\n"
+    return f"[ERROR]: {error}\n"
+
+
+def calc_stream(lines, out, now=None, fmt="text", formatter=None, total=False):
+    """
+    Writes one output line per input line (empty lines stay empty) to out.
+
+    Args:
+        lines: Iterable of text lines (e.g. sys.stdin)
+        out: Text stream to write to
+        now: Reference time (default: datetime.now() once)
+        fmt: "text" (needs formatter) or "json"
+        formatter: DisplayFormatter for the pluralized texts
+        total: In text mode, also append the "in other words" lines, separated by " | "
+
+    Returns (lines read, invalid lines).
+    """
+    if fmt not in CALC_FORMATS:
+        raise ValueError(f"Unknown calc format '{fmt}', expected one of {', '.join(CALC_FORMATS)}")
+    if fmt == "text" and formatter is None:
+        raise ValueError("Text output needs the display formatter from main.py")
+    now = now or datetime.now()
+
+    if fmt == "json":
+        def render(target):
+            return _json_line(now, target)
+    elif total:
+        def render(target):
+            time_left_text, total_time_text = formatter.format(now, target)
+            return f"{time_left_text} | {total_time_text.replace(chr(10), ' | ')}\n"
+    else:
+        def render(target):
+            return formatter.format(now, target)[0] + "\n"
+
+    batch = []
+    count = invalid = 0
+    write = out.write
+    for line in lines:
+        count += 1
+        text = line.strip()
+        if not text:
+            batch.append("\n")
+        else:
+            try:
+                batch.append(render(parse_target(text)))
+            except (ValueError, OverflowError) as e:
+                invalid += 1
+                batch.append(_error_line(fmt, text, f"Invalid timestamp '{text}': {e}"))
+        if len(batch) >= BATCH_LINES:
+            write("".join(batch))
+            batch.clear()
+    if batch:
+        write("".join(batch))
+    return count, invalid
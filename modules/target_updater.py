@@ -0,0 +1,111 @@
+"""
+Tick updater of a countdown target that is edited in an input (the entry fields).
+
+Every tick it reads the target from the input, moves a recurring target to
+its next occurrence once the current one has passed (and writes it back to
+the input), keeps the target's TargetStore row in sync and arms the alarm.
+CountdownApp and the fast-forward simulation (tools/simulate_clock.py) run
+this same code on a TickEngine, so the simulation checks the real pipeline.
+
+Input that the repeat rule does not track is an edit in progress: it is
+shown as a one-shot target, and only commit() (focus leaves the field,
+Return, a menu action) restarts the rule from it and reports EVENT_SET, so
+half-typed dates never reach the rule or the event log. Nothing is written
+back to the input while it is being edited.
+
+Usage:
+    from modules.target_updater import TargetUpdater
+    ...
+    updater = TargetUpdater(targets, 0, alarms, read_entry_fields, show_target=write_entry_fields)
+    engine.add_updater(updater)
+"""
+from modules.targets import FLAG_REACHED
+from modules.event_log import EVENT_SET, EVENT_ADVANCED
+
+
+class TargetUpdater:
+    """
+    Args:
+        targets: TargetStore with the target's row
+        index: Row of the target in targets
+        alarms: DeadlineScheduler, the target is armed as alarm_key
+        read_target: read_target() -> (datetime, None), or (None, error message) for invalid input
+        show_target: show_target(dt) writes an advanced occurrence back to the input
+        label: label() -> label stored with the target
+        is_editing: is_editing() -> True while the input is being edited
+        on_event: on_event(kind, target) with EVENT_SET (commit) / EVENT_ADVANCED (tick), see modules/event_log.py
+        alarm_key: Key of the target in alarms
+    """
+
+    def __init__(self, targets, index, alarms, read_target, show_target=None, label=None, is_editing=None,
+                 on_event=None, alarm_key="main"):
+        self.targets = targets
+        self.index = index
+        self.alarms = alarms
+        self.read_target = read_target
+        self.show_target = show_target
+        self.label = label
+        self.is_editing = is_editing
+        self.on_event = on_event
+        self.alarm_key = alarm_key
+        # RecurringTarget of the target, or None for a one-shot countdown
+        self.recurrence = None
+        # Message of the last invalid input, None while the input is valid
+        self.error = None
+        # Last target that was committed, loaded or advanced to (EVENT_SET is only sent for others)
+        self.committed = None
+
+    def store(self, target, label=None):
+        """Writes target (and the repeat rule) into the store row. Returns True if it changed."""
+        if label is None:
+            label = self.label() if self.label is not None else self.targets.label(self.index)
+        rule_text = self.recurrence.rule_text if self.recurrence is not None else None
+        return self.targets.put(self.index, label, target, rule_text)
+
+    def reset(self, target, recurrence=None):
+        """Takes a target that was not typed (file, calendar, session) as committed, with its repeat rule."""
+        self.committed = target
+        self.recurrence = recurrence
+
+    def commit(self):
+        """
+        Called when an edit of the input is finished. A changed target restarts the
+        repeat rule and is reported as EVENT_SET. Returns the target, or None for invalid input.
+        """
+        target, _ = self.read_target()
+        if target is None:
+            return None
+        if self.recurrence is not None and not self.recurrence.tracks(target):
+            self.recurrence = self.recurrence.rebased(target)
+        if target != self.committed:
+            self.committed = target
+            if self.on_event is not None:
+                self.on_event(EVENT_SET, target)
+        return target
+
+    def __call__(self, now):
+        """TickEngine updater. Invalid input leaves the stored target as it is and sets self.error."""
+        target, self.error = self.read_target()
+        if target is None:
+            self.alarms.cancel(self.alarm_key)
+            return
+
+        # Recurring targets jump to their next occurrence once the current one passes
+        advanced = False
+        recurrence = self.recurrence
+        if (recurrence is not None and now >= target and recurrence.tracks(target)
+                and not (self.is_editing is not None and self.is_editing())):
+            upcoming = recurrence.next_occurrence(now)
+            if upcoming is not None:
+                if self.show_target is not None:
+                    self.show_target(upcoming)
+                target = upcoming
+                advanced = True
+
+        if advanced:
+            self.committed = target
+        if self.store(target) and advanced and self.on_event is not None:
+            self.on_event(EVENT_ADVANCED, target)
+        # A target that already fired stays silent, even when a DST fall-back repeats its hour
+        if not self.targets.flags[self.index] & FLAG_REACHED:
+            self.alarms.schedule(self.alarm_key, target)
@@ -0,0 +1,186 @@
+"""
+Compact countdown target model.
+
+A target is three integers and a few flag bits: whole seconds since
+1970-01-01 (naive wall-clock time, like the rest of the app), the id of
+its interned label and the id of its interned repeat rule. TargetStore
+keeps them column by column in typed arrays (17 bytes per target), and
+CountdownTarget is the __slots__ record handed out for a single target.
+datetime objects are only created when a value is read.
+
+The main window keeps its current target in a TargetStore, the HTTP API
+serves one, and batch paths can fill one from .countdown/.ics files.
+
+Usage:
+    from modules.targets import TargetStore
+    ...
+    store = TargetStore()
+    index = store.append("New Year", datetime(2026, 1, 1))
+    label, target = store.label(index), store.target(index)
+    run "python tools/target_memory_benchmark.py" for bytes per target
+"""
+from array import array
+from datetime import datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+ONE_SECOND = timedelta(seconds=1)
+
+# Flag bits
+FLAG_RECURRING = 1   # Has a repeat rule
+FLAG_REACHED = 2     # The alarm for this target already fired
+
+
+def to_epoch(dt):
+    """Naive datetime -> whole seconds since EPOCH (wall clock, no time zone)."""
+    return (dt - EPOCH) // ONE_SECOND
+
+
+def from_epoch(seconds):
+    return EPOCH + timedelta(seconds=seconds)
+
+
+class StringTable:
+    """Interns strings to small integer ids. Id 0 is reserved for None."""
+
+    __slots__ = ("_strings", "_ids")
+
+    def __init__(self):
+        self._strings = [None]
+        self._ids = {}
+
+    def intern(self, text):
+        if text is None:
+            return 0
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(text)
+            self._ids[text] = string_id
+        return string_id
+
+    def get(self, string_id):
+        return self._strings[string_id]
+
+    def __len__(self):
+        return len(self._strings) - 1
+
+
+class CountdownTarget:
+    """One target as plain integers. Labels and rules are ids into the owning store's tables."""
+
+    __slots__ = ("epoch", "label_id", "rule_id", "flags")
+
+    def __init__(self, epoch, label_id=0, rule_id=0, flags=0):
+        self.epoch = epoch
+        self.label_id = label_id
+        self.rule_id = rule_id
+        self.flags = flags
+
+    @property
+    def target(self):
+        return from_epoch(self.epoch)
+
+    def __repr__(self):
+        return f"CountdownTarget({self.target}, label_id={self.label_id}, rule_id={self.rule_id}, flags={self.flags})"
+
+
+class TargetStore:
+    """
+    Columnar store of countdown targets.
+
+    version grows with every change, so readers (e.g. the HTTP API) can tell
+    whether anything changed without comparing the contents.
+    """
+
+    __slots__ = ("epochs", "label_ids", "rule_ids", "flags", "labels", "rules", "version")
+
+    def __init__(self):
+        self.epochs = array("q")
+        self.label_ids = array("I")
+        self.rule_ids = array("I")
+        self.flags = array("B")
+        self.labels = StringTable()
+        self.rules = StringTable()
+        self.version = 0
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Builds a store from (label, target) or (label, target, rule_text) tuples."""
+        store = cls()
+        store.extend(pairs)
+        return store
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def append(self, label, target, rule_text=None, flags=0):
+        """Adds a target and returns its index."""
+        rule_id = self.rules.intern(rule_text)
+        self.epochs.append(to_epoch(target))
+        self.label_ids.append(self.labels.intern(label))
+        self.rule_ids.append(rule_id)
+        self.flags.append(flags | (FLAG_RECURRING if rule_id else 0))
+        self.version += 1
+        return len(self.epochs) - 1
+
+    def extend(self, pairs):
+        for item in pairs:
+            self.append(*item)
+
+    def put(self, index, label, target, rule_text=None):
+        """
+        Stores a target at index (appending if index == len(self)). Returns True if anything
+        changed; a new date clears FLAG_REACHED.
+        """
+        if index == len(self.epochs):
+            self.append(label, target, rule_text)
+            return True
+        epoch = to_epoch(target)
+        label_id = self.labels.intern(label)
+        rule_id = self.rules.intern(rule_text)
+        if (self.epochs[index], self.label_ids[index], self.rule_ids[index]) == (epoch, label_id, rule_id):
+            return False
+        flags = self.flags[index] & ~FLAG_RECURRING
+        if self.epochs[index] != epoch:
+            flags &= ~FLAG_REACHED
+        self.epochs[index] = epoch
+        self.label_ids[index] = label_id
+        self.rule_ids[index] = rule_id
+        self.flags[index] = flags | (FLAG_RECURRING if rule_id else 0)
+        self.version += 1
+        return True
+
+    def set_flag(self, index, flag):
+        if not self.flags[index] & flag:
+            self.flags[index] |= flag
+            self.version += 1
+
+    def __getitem__(self, index):
+        return CountdownTarget(self.epochs[index], self.label_ids[index], self.rule_ids[index], self.flags[index])
+
+    def target(self, index):
+        return from_epoch(self.epochs[index])
+
+    def label(self, index):
+        return self.labels.get(self.label_ids[index])
+
+    def rule_text(self, index):
+        return self.rules.get(self.rule_ids[index])
+
+    def iter_pairs(self):
+        """Yields (label, target) like modules.export.iter_countdown_files, creating datetimes lazily."""
+        get_label = self.labels.get
+        for epoch, label_id in zip(self.epochs, self.label_ids):
+            yield get_label(label_id), EPOCH + timedelta(seconds=epoch)
+
+    def copy(self):
+        """Snapshot for another thread: the arrays are copied, the string tables only grow and are shared."""
+        store = TargetStore.__new__(TargetStore)
+        store.epochs = array("q", self.epochs)
+        store.label_ids = array("I", self.label_ids)
+        store.rule_ids = array("I", self.rule_ids)
+        store.flags = array("B", self.flags)
+        store.labels = self.labels
+        store.rules = self.rules
+        store.version = self.version
+        return store
@@ -0,0 +1,99 @@
+"""
+Palette registry for theme switching.
+
+COLOR_SETTINGS is resolved once into immutable Palette objects. Widgets
+register the palette role they use (e.g. "text_color" for their
+text_color option) and receive a (light, dark) color pair, which
+CustomTkinter switches by itself. A dark/light toggle is therefore a
+single ctk.set_appearance_mode() call: one redraw per widget, all inside
+the same Tk callback, so no half-themed frame is ever painted.
+
+Usage:
+    from modules.theme import ThemeRegistry, resolve_palettes
+    ...
+    theme = ThemeRegistry(resolve_palettes(COLOR_SETTINGS))
+    label = theme.register(ctk.CTkLabel(frame), "text_color")
+    theme.apply_mode("light")
+"""
+from typing import NamedTuple
+import customtkinter as ctk
+
+
+class Palette(NamedTuple):
+    text_color: str
+    background_color: str
+    date_frame_color: str
+    highlight_color: str
+
+
+# Used for roles missing from a hand-edited COLOR_SETTINGS
+DEFAULT_PALETTES = {
+    "dark": Palette("#FFFFFF", "#2E2E2E", "#282828", "#db143c"),
+    "light": Palette("#333333", "#dbdbdb", "#cecece", "#E60000"),
+}
+
+
+def resolve_palettes(color_settings):
+    """Builds {"light": Palette, "dark": Palette} from a COLOR_SETTINGS dict."""
+    palettes = {}
+    for mode, default in DEFAULT_PALETTES.items():
+        colors = color_settings.get(mode, {})
+        palettes[mode] = Palette(*(colors.get(role, default_value) for role, default_value in default._asdict().items()))
+    return palettes
+
+
+class ThemeRegistry:
+    """
+    Maps widgets to palette roles.
+
+    Args:
+        palettes: dict returned by resolve_palettes()
+    """
+
+    def __init__(self, palettes):
+        self._bindings = {}  # widget -> {option: role}
+        self.set_palettes(palettes)
+
+    def color(self, role):
+        """(light, dark) pair for a role, accepted by every CustomTkinter color option."""
+        return self._pairs[role]
+
+    def palette(self, mode=None):
+        """Palette for 'light'/'dark' (defaults to the current appearance mode)."""
+        mode = (mode or ctk.get_appearance_mode()).lower()
+        return self.palettes.get(mode, self.palettes["dark"])
+
+    def register(self, widget, role, option="text_color", apply=True):
+        """
+        Binds widget.option to a palette role. Returns the widget.
+        apply=False skips the configure() call for widgets created with theme.color(role).
+        """
+        self._bindings.setdefault(widget, {})[option] = role
+        if apply:
+            widget.configure(**{option: self._pairs[role]})
+        return widget
+
+    def unregister(self, widget):
+        self._bindings.pop(widget, None)
+
+    def set_palettes(self, palettes):
+        """
+        Replaces the palettes (e.g. after reloading COLOR_SETTINGS) and
+        reconfigures every registered widget with one configure() call each.
+        """
+        self.palettes = palettes
+        self._pairs = {
+            role: (palettes["light"][index], palettes["dark"][index])
+            for index, role in enumerate(Palette._fields)
+        }
+        for widget, options in list(self._bindings.items()):
+            try:
+                widget.configure(**{option: self._pairs[role] for option, role in options.items()})
+            except Exception as e:
+                # Destroyed widgets are dropped from the registry
+                print(f"[WARNING] Theme registry dropped {widget}: {e}")
+                self._bindings.pop(widget, None)
+
+    def apply_mode(self, mode):
+        """Switches between light/dark/system. Registered widgets follow automatically."""
+        ctk.set_appearance_mode(mode)
@@ -0,0 +1,159 @@
+"""
+Shared tick engine for every view of the countdown.
+
+One timer loop per process instead of one per window: each tick the
+engine reads the clock once, runs the updaters (code that may change the
+targets, e.g. the entry fields or a repeat rule), builds one TickFrame per
+target of its TargetStore and hands the same frames to every subscribed
+view: the main window, mini windows, headless sinks such as the HTTP API
+publisher. Breakdowns and label texts are computed lazily, once per frame,
+by the first view that asks for them, so another view only costs its own
+render.
+
+The engine schedules itself through a Tk-style widget (.after /
+.after_cancel), so it runs on the Tk main loop or on a VirtualClock
+(see modules/clock.py).
+
+Usage:
+    from modules.tick_engine import TickEngine
+    ...
+    engine = TickEngine(root, targets, format_texts, clock=clock, interval_ms=1000)
+    engine.add_updater(read_entry_fields)
+    engine.subscribe(lambda tick: label.configure(text=tick[0].texts[0]))
+    engine.start()
+"""
+from datetime import datetime
+from modules.breakdown import compute_breakdown
+
+
+class TickFrame:
+    """State of one target at one tick, shared by all views."""
+
+    __slots__ = ("index", "label", "target", "now", "mode", "_format_texts", "_breakdown", "_calendar", "_texts")
+
+    def __init__(self, index, label, target, now, format_texts):
+        self.index = index
+        self.label = label
+        self.target = target
+        self.now = now
+        self.mode = "remaining" if now < target else "elapsed"
+        self._format_texts = format_texts
+        self._breakdown = None
+        self._calendar = False
+        self._texts = None
+
+    def breakdown(self, calendar=True):
+        """Breakdown of this frame, computed on first use; calendar=False is enough for the total_* fields."""
+        if self._breakdown is None or (calendar and not self._calendar):
+            self._breakdown = compute_breakdown(self.now, self.target, calendar=calendar)
+            self._calendar = calendar
+        return self._breakdown
+
+    @property
+    def texts(self):
+        """(time_left_text, total_time_text) from the engine's format_texts, computed on first use."""
+        if self._texts is None:
+            self._texts = self._format_texts(self)
+        return self._texts
+
+
+class Tick:
+    """What the views receive: the tick time and one frame per target (tick[index])."""
+
+    __slots__ = ("number", "now", "frames")
+
+    def __init__(self, number, now, frames):
+        self.number = number
+        self.now = now
+        self.frames = frames
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    def __len__(self):
+        return len(self.frames)
+
+
+class TickEngine:
+    """
+    Args:
+        widget: Object with Tk-style after()/after_cancel() (Tk root or VirtualClock)
+        targets: TargetStore whose targets are published
+        format_texts: format_texts(frame) -> (time_left_text, total_time_text), used by TickFrame.texts
+        clock: Callable returning the current naive datetime
+        interval_ms: Time between ticks
+    """
+
+    def __init__(self, widget, targets, format_texts, clock=datetime.now, interval_ms=1000):
+        self.widget = widget
+        self.targets = targets
+        self.format_texts = format_texts
+        self.clock = clock
+        self.interval_ms = interval_ms
+        self.updaters = []
+        self.views = []
+        self.ticks = 0
+        self.last_tick = None
+        self._job = None
+
+    def add_updater(self, updater):
+        """updater(now) runs before the frames are built and may change the targets."""
+        self.updaters.append(updater)
+        return updater
+
+    def subscribe(self, view):
+        """view(tick) is called every tick; it gets the latest tick right away if there is one."""
+        self.views.append(view)
+        if self.last_tick is not None:
+            self._publish(view, self.last_tick)
+        return view
+
+    def unsubscribe(self, view):
+        if view in self.views:
+            self.views.remove(view)
+
+    def tick(self):
+        """Runs one tick now (also used to refresh the views after a change) and returns it."""
+        now = self.clock()
+        for updater in self.updaters:
+            updater(now)
+
+        targets = self.targets
+        format_texts = self.format_texts
+        frames = [
+            TickFrame(index, label, target, now, format_texts)
+            for index, (label, target) in enumerate(targets.iter_pairs())
+        ]
+        self.ticks += 1
+        tick = self.last_tick = Tick(self.ticks, now, frames)
+        # A copy, views may unsubscribe themselves (e.g. a closed mini window)
+        for view in list(self.views):
+            self._publish(view, tick)
+        return tick
+
+    def _publish(self, view, tick):
+        try:
+            view(tick)
+        except Exception as e:
+            # One broken view must not stop the others or the loop
+            print(f"[ERROR]: Tick view {view!r} failed: {e}")
+
+    def _run(self):
+        self._job = None
+        try:
+            self.tick()
+        finally:
+            self._job = self.widget.after(self.interval_ms, self._run)
+
+    def start(self):
+        if self._job is None:
+            self._run()
+
+    def stop(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    @property
+    def running(self):
+        return self._job is not None
@@ -1,9 +1,10 @@
 import os
 import sys
 from tkinter import messagebox
-from PIL import Image, ImageTk
+from PIL import ImageTk
 import platform
 import customtkinter as ctk
+from modules import assets
 
 def get_program_path(show_messagebox=False, status_flag=None):
     """
@@ -30,11 +31,22 @@ def get_program_path(show_messagebox=False, status_flag=None):
         msg += f"Compiled? (Nuitka) - {'__compiled__' in globals()}"
         messagebox.showinfo("Program Path", msg)
 
+# Decoded icons are kept per path, a theme toggle reuses them instead of creating new PhotoImages
+_ICON_CACHE = {}
+
+def _load_icon_photo(icon_path):
+    icon_photo = _ICON_CACHE.get(icon_path)
+    if icon_photo is None:
+        icon_photo = ImageTk.PhotoImage(assets.open_image(icon_path))
+        _ICON_CACHE[icon_path] = icon_photo
+    return icon_photo
+
 def set_app_icon(app, icon_dark_path="Assets/Countdown/Icons/white_icon1.png", icon_light_path="Assets/Countdown/Icons/dark_icon1.png"):
     """
-    v1.1.1 (2025-05-30)
+    v1.2.0 (2026-10-19)
     Sets the application window icon based on the current system appearance mode (dark/light).
     Automatically selects the appropriate icon version. On Windows, works around CustomTkinter bug by resetting icon after 200ms.
+    Icons are decoded once per path and cached (read from the asset bundle when there is one).
     Args:
         app: The application or window instance. If it has .root, uses app.root, else uses app itself.
         icon_dark_path (str): Path to the icon for dark mode
@@ -46,13 +58,13 @@ def set_app_icon(app, icon_dark_path="Assets/Countdown/Icons/white_icon1.png", i
     icon_loaded = False
     # Use .root if present, else use app itself
     window = getattr(app, 'root', app)
-    if os.path.exists(icon_path):
+    if assets.exists(icon_path):
         try:
-            icon_image = Image.open(icon_path)
-            icon_photo = ImageTk.PhotoImage(icon_image)
+            icon_photo = _load_icon_photo(icon_path)
             window.iconphoto(False, icon_photo)
             icon_loaded = True
         except Exception as e:
+            _ICON_CACHE.pop(icon_path, None)
             print(f"[ERROR] Failed to load icon: {e}")
     else:
         print(f"[WARNING] File {icon_path} has not been found.")
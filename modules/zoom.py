@@ -0,0 +1,72 @@
+"""
+Debounced UI zoom for CustomTkinter.
+
+ctk.set_window_scaling() / ctk.set_widget_scaling() re-layout and redraw
+every widget. Zoom requests are therefore only accumulated and applied
+once the user stops clicking/pressing keys for delay_ms, so five quick
+"Zoom In" clicks cost one relayout instead of five.
+
+Usage:
+    from modules.zoom import ZoomController
+    ...
+    zoom = ZoomController(root, APP_SETTINGS["ui_zoom_factor"], on_applied=save_zoom)
+    zoom.apply_now()
+    zoom.request(+1)
+"""
+import customtkinter as ctk
+
+
+class ZoomController:
+    """
+    Args:
+        widget: Any Tk widget, used for after()/after_cancel()
+        factor: Initial zoom factor
+        on_applied: Optional callback called as on_applied(factor) after scaling was applied
+        delay_ms: Quiet period before pending requests are applied
+        step: Zoom change per request step
+    """
+
+    def __init__(self, widget, factor, on_applied=None, delay_ms=200, step=0.1, min_factor=0.5, max_factor=3.0):
+        self.widget = widget
+        self.factor = factor            # factor currently applied
+        self.pending = factor           # factor that will be applied after the debounce
+        self.on_applied = on_applied
+        self.delay_ms = delay_ms
+        self.step = step
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self._timer_id = None
+        # Instrumentation
+        self.requests = 0
+        self.relayouts = 0
+        self.relayouts_avoided = 0
+
+    def request(self, steps):
+        """Queues a zoom change of steps * step, restarting the debounce timer."""
+        self.set_pending(self.pending + steps * self.step)
+
+    def set_pending(self, factor):
+        self.requests += 1
+        self.pending = round(min(self.max_factor, max(self.min_factor, factor)), 3)
+        if self._timer_id is not None:
+            # Coalesced with the previous request, which would have re-laid out on its own
+            self.widget.after_cancel(self._timer_id)
+            self.relayouts_avoided += 1
+        self._timer_id = self.widget.after(self.delay_ms, self.apply_now)
+
+    def apply_now(self):
+        """Applies the pending factor immediately (also used for the initial scaling)."""
+        if self._timer_id is not None:
+            self.widget.after_cancel(self._timer_id)
+            self._timer_id = None
+        if self.pending == self.factor and self.relayouts:
+            # Zoomed in and back out again, nothing to re-lay out
+            self.relayouts_avoided += 1
+            return
+        self.factor = self.pending
+        ctk.set_window_scaling(self.factor)
+        ctk.set_widget_scaling(self.factor)
+        self.relayouts += 1
+        print(f"UI zoom factor: {self.factor} ({self.requests} requests, {self.relayouts_avoided} relayouts avoided)")
+        if self.on_applied:
+            self.on_applied(self.factor)
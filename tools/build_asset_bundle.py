@@ -0,0 +1,121 @@
+"""
+Packs Assets/Countdown into the single-file asset bundle read by modules/assets.py.
+
+Settings and translation JSON are stored as they are; PNG icons are
+decoded here once and stored as raw pixels. Runtime files (session,
+event log, temporary files) are left out. Ship the bundle next to the
+frozen executable (or add it as a data file) and the app reads it instead
+of the loose files:
+
+    python tools/build_asset_bundle.py
+    python tools/build_asset_bundle.py --output dist/Assets/countdown.assets --list
+
+Re-run it after changing any asset; loose files are only used for what the bundle lacks.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # bundle paths are relative to the program directory, like the loose files
+
+from PIL import Image
+from modules.assets import ASSET_BUNDLE_FILE, BUNDLE_MAGIC, BUNDLE_HEADER, ALIGNMENT, AssetBundle, normalize_path
+
+ASSET_DIRECTORY = "Assets/Countdown"
+INCLUDED_EXTENSIONS = (".json", ".png")
+# Written by the running app, never bundled
+EXCLUDED_FILES = ("session.json",)
+
+
+def collect_assets(directory):
+    paths = []
+    for folder, _, names in os.walk(directory):
+        for name in sorted(names):
+            if name.endswith(INCLUDED_EXTENSIONS) and name not in EXCLUDED_FILES:
+                paths.append(normalize_path(os.path.join(folder, name)))
+    return sorted(paths)
+
+
+def build_bundle(paths, output_path):
+    """Writes the bundle atomically. Returns the index."""
+    blobs = []
+    files, images = {}, {}
+    for path in paths:
+        if path.endswith(".png"):
+            with Image.open(path) as image:
+                image = image.convert("RGBA")
+            data = image.tobytes()
+            images[path] = [None, len(data), image.width, image.height, "RGBA"]
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+            files[path] = [None, len(data)]
+        blobs.append((path, data))
+
+    # Offsets depend on the index size and the index holds the offsets: lay out until it is stable
+    data_start = 0
+    while True:
+        offset = data_start
+        for path, data in blobs:
+            entry = images.get(path) or files[path]
+            entry[0] = offset
+            offset += len(data) + (-len(data) % ALIGNMENT)
+        index = json.dumps({"files": files, "images": images}, separators=(",", ":")).encode("utf-8")
+        header_size = BUNDLE_HEADER.size + len(index)
+        needed = header_size + (-header_size % ALIGNMENT)
+        if needed == data_start:
+            break
+        data_start = needed
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, len(index)))
+        f.write(index)
+        f.write(b"\0" * (data_start - header_size))
+        for _, data in blobs:
+            f.write(data)
+            f.write(b"\0" * (-len(data) % ALIGNMENT))
+    os.replace(temp_path, output_path)
+    return {"files": files, "images": images}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the packed asset bundle")
+    parser.add_argument("--output", default=ASSET_BUNDLE_FILE, help=f"Bundle file (default: {ASSET_BUNDLE_FILE})")
+    parser.add_argument("--list", action="store_true", help="Print the bundled entries")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    paths = collect_assets(ASSET_DIRECTORY)
+    index = build_bundle(paths, args.output)
+
+    # Read it back, so a broken bundle is never shipped
+    bundle = AssetBundle(args.output)
+    try:
+        for path in index["files"]:
+            with open(path, "rb") as f:
+                if bundle.read(path) != f.read():
+                    print(f"[ERROR]: {path} does not match the loose file")
+                    return 1
+        for path in index["images"]:
+            bundle.image(path).load()
+    finally:
+        bundle.close()
+
+    if args.list:
+        for path, (offset, size) in index["files"].items():
+            print(f"  file  {size:>9,} B  {path}")
+        for path, (offset, size, width, height, mode) in index["images"].items():
+            print(f"  image {size:>9,} B  {path} ({width}x{height} {mode})")
+    print(f"[INFO]: Wrote {args.output}: {len(index['files'])} file(s), {len(index['images'])} icon(s), "
+          f"{os.path.getsize(args.output):,} bytes in {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Load test for the local HTTP/JSON countdown API (modules/http_api.py).
+
+Opens N keep-alive clients that poll /api/targets as fast as they can for a
+fixed time and reports throughput, latency percentiles and how many
+snapshots the server actually computed.
+
+    python tools/http_load_test.py --spawn --clients 200 --duration 10
+    python tools/http_load_test.py --port 8765 --clients 1000      (app or "main.py serve" already running)
+    python tools/http_load_test.py --spawn --sse --clients 500      (Server-Sent Events fan-out)
+
+Note: every client is one socket, raise 'ulimit -n' for more than ~500 clients with --spawn.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+async def poll_client(host, port, deadline, latencies, errors):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        errors.append(1)
+        return
+    request = f"GET /api/targets HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    except (OSError, asyncio.IncompleteReadError):
+        errors.append(1)
+    finally:
+        writer.close()
+
+
+async def sse_client(host, port, deadline, counts, errors):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        errors.append(1)
+        return
+    writer.write(f"GET /api/events HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    events = 0
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(reader.readuntil(b"\n\n"), remaining)
+            except asyncio.TimeoutError:
+                break
+            events += 1
+    except (OSError, asyncio.IncompleteReadError):
+        errors.append(1)
+    finally:
+        counts.append(events)
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run(args):
+    deadline = time.perf_counter() + args.duration
+    errors = []
+    if args.sse:
+        counts = []
+        await asyncio.gather(*(sse_client(args.host, args.port, deadline, counts, errors) for _ in range(args.clients)))
+        print(f"SSE clients: {args.clients}, events received: {sum(counts)} "
+              f"(avg {sum(counts) / max(1, len(counts)):.1f} per client in {args.duration}s), errors: {len(errors)}")
+        return
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(poll_client(args.host, args.port, deadline, latencies, errors) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(f"Clients: {args.clients}, requests: {len(latencies)}, errors: {len(errors)}")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"Latency: p50 {percentile(latencies, 0.5) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms, max {percentile(latencies, 1.0) * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the countdown HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--sse", action="store_true", help="Test the /api/events stream instead of polling")
+    parser.add_argument("--spawn", action="store_true", help="Start an in-process server with sample targets")
+    parser.add_argument("--targets", type=int, default=10, help="Number of sample targets with --spawn")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        from modules.http_api import CountdownApiServer
+        server = CountdownApiServer(host=args.host, port=args.port)
+        base = datetime.now().replace(microsecond=0)
+        server.publish_targets((f"Target {i}", base + timedelta(days=i * 37, seconds=i)) for i in range(args.targets))
+        server.start()
+        if not server.is_running():
+            return 1
+
+    asyncio.run(run(args))
+
+    if server is not None:
+        print(f"Server: {server.requests_served} requests served from {server.snapshots_built} computed snapshot(s)")
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
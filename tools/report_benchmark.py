@@ -0,0 +1,80 @@
+"""
+Speedup curve of the parallel breakdown report (modules/batch_report.py).
+
+Computes the breakdown rows for N synthetic targets with 1, 2, 4, ...
+worker processes (up to the CPU count) and prints the time, the speedup
+over one process and the parallel efficiency. Rows are consumed but not
+written, so the numbers show the compute/transfer part only. The curve
+only means something on a machine with that many free cores: rows with
+more workers than usable CPUs are marked, they measure the pool overhead.
+
+    python tools/report_benchmark.py
+    python tools/report_benchmark.py --count 2000000 --workers 1 2 4 8 16 32
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.batch_report import iter_report_rows, CHUNK_SIZE
+from modules.targets import TargetStore
+
+
+def build_store(count):
+    base = datetime(2020, 1, 1)
+    store = TargetStore()
+    for i in range(count):
+        store.append(f"Target {i % 1000}", base + timedelta(seconds=i * 7919))
+    return store
+
+
+def usable_cpus():
+    """CPUs this process may run on (affinity/cgroup masks included where the OS reports them)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def default_worker_counts():
+    cpus = usable_cpus()
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Speedup of the process-pool report")
+    parser.add_argument("--count", type=int, default=500_000, help="Number of targets")
+    parser.add_argument("--workers", type=int, nargs="+", help="Worker counts to test (default: 1, 2, 4, ... CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    store = build_store(args.count)
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    cpus = usable_cpus()
+    print(f"{args.count:,} targets, chunk size {args.chunk_size:,}, {cpus} usable of {os.cpu_count()} CPU(s)")
+    print(f"{'workers':>8} {'seconds':>9} {'rows/s':>12} {'speedup':>8} {'efficiency':>11}")
+
+    baseline = None
+    for workers in args.workers or default_worker_counts():
+        start = time.perf_counter()
+        # deque(maxlen=0) drains the generator without keeping rows
+        deque(iter_report_rows(store, now=now, workers=workers, chunk_size=args.chunk_size), maxlen=0)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        oversubscribed = "  (more workers than CPUs)" if workers > cpus else ""
+        print(f"{workers:>8} {elapsed:>9.2f} {args.count / elapsed:>12,.0f} {speedup:>7.2f}x {speedup / workers:>10.0%}{oversubscribed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Fast-forward simulation of the countdown tick loop.
+
+Runs the CountdownApp tick pipeline (the TargetUpdater of
+modules/target_updater.py with its repeat rules, alarms and target model,
+and the label texts) on the shared TickEngine (modules/tick_engine.py)
+and a VirtualClock instead of Tk, at full
+speed (thousands of ticks per second) instead of one tick per second. Every tick is checked against
+an independent relativedelta/integer oracle, and every alarm must fire
+exactly once and no later than the first tick that reaches its deadline.
+
+Scenarios cover DST jumps (Europe/Warsaw), leap days and month ends:
+
+    python tools/simulate_clock.py
+    python tools/simulate_clock.py --scenario fall-back --tick 0.5
+    python tools/simulate_clock.py --scenario year --tick 1      (31.5M ticks, slow)
+
+Exit code 1 when any check fails.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # settings and translations are loaded relative to the program directory
+
+from modules.clock import VirtualClock
+from modules.alarms import DeadlineScheduler
+from modules.recurrence import RecurringTarget
+from modules.targets import TargetStore, FLAG_REACHED
+from modules.target_updater import TargetUpdater
+from modules.tick_engine import TickEngine
+
+# (name, zone, start, duration, target, rule, default tick in seconds)
+SCENARIOS = {
+    # Armed less than an hour (one timer hop) before a deadline that falls into the skipped hour
+    "spring-forward": ("Europe/Warsaw", datetime(2025, 3, 30, 1, 20, 0, 250000), timedelta(days=1),
+                       datetime(2025, 3, 30, 2, 30), None, 1),
+    "fall-back": ("Europe/Warsaw", datetime(2025, 10, 25, 12, 0, 0, 250000), timedelta(days=2),
+                  datetime(2025, 10, 26, 2, 30), None, 1),
+    "fall-back-daily": ("Europe/Warsaw", datetime(2025, 10, 24, 0, 0), timedelta(days=4),
+                        datetime(2025, 10, 24, 2, 30), "FREQ=DAILY", 1),
+    "leap-day": (None, datetime(2024, 2, 27, 0, 0), timedelta(days=4),
+                 datetime(2024, 2, 29, 0, 0), "FREQ=YEARLY", 1),
+    "month-end": (None, datetime(2025, 1, 30, 0, 0), timedelta(days=62),
+                  datetime(2025, 1, 31, 12, 0), "FREQ=MONTHLY", 30),
+    "year": ("Europe/Warsaw", datetime(2025, 1, 1, 0, 0), timedelta(days=366),
+             datetime(2025, 1, 5, 2, 30), "FREQ=WEEKLY", 120),
+}
+
+
+def oracle_breakdown(now, target):
+    """Reference values from relativedelta and integer arithmetic (no floats)."""
+    start, end = (now, target) if now < target else (target, now)
+    diff = relativedelta(end, start)
+    seconds = (end - start) // timedelta(seconds=1)
+    return (
+        "remaining" if now < target else "elapsed",
+        diff.years, diff.months, diff.days // 7, diff.days % 7, diff.hours, diff.minutes, diff.seconds,
+        diff.years * 12 + diff.months, diff.days,
+        seconds // 604800, seconds // 86400 % 7, seconds // 86400,
+        seconds // 3600, seconds // 60 % 60, seconds // 60, seconds % 60, seconds,
+    )
+
+
+class SimulatedCountdown:
+    """
+    CountdownApp without Tk: the app's TargetUpdater and a checking view on a TickEngine driven by a
+    VirtualClock. self.entered stands in for the entry fields.
+    """
+
+    def __init__(self, clock, target, rule_text, tick_ms, format_texts=None):
+        self.clock = clock
+        self.with_texts = format_texts is not None
+        self.entered = target
+        self.targets = TargetStore()
+        self.targets.append("simulation", target, rule_text)
+        self.alarms = DeadlineScheduler(clock, self.on_target_reached, clock=clock)
+        self.updater = TargetUpdater(
+            self.targets, 0, self.alarms,
+            read_target=lambda: (self.entered, None),
+            show_target=self.show_target,
+            label=lambda: "simulation",
+        )
+        self.updater.recurrence = RecurringTarget(rule_text, target) if rule_text else None
+        self.engine = TickEngine(clock, self.targets, format_texts, clock=clock, interval_ms=tick_ms)
+        self.engine.add_updater(self.updater)
+        self.engine.subscribe(self.check)
+        self.fired = {}             # deadline -> number of alarms
+        self.deadlines = {target}   # every target the countdown pointed at
+        self.errors = []
+
+    @property
+    def ticks(self):
+        return self.engine.ticks
+
+    def on_target_reached(self, key, deadline):
+        self.fired[deadline] = self.fired.get(deadline, 0) + 1
+        if self.fired[deadline] > 1:
+            self.errors.append(f"{self.clock()}: alarm for {deadline} fired {self.fired[deadline]} times")
+        if self.targets.target(0) == deadline:
+            self.targets.set_flag(0, FLAG_REACHED)
+
+    def show_target(self, dt):
+        # An advanced occurrence written back to the "entry fields"
+        self.entered = dt
+        self.deadlines.add(dt)
+
+    def check(self, tick):
+        now = tick.now
+        frame = tick[0]
+        # Every deadline reached by now must have fired already
+        for deadline in self.deadlines:
+            if deadline <= now and deadline not in self.fired:
+                self.errors.append(f"{now}: alarm for {deadline} is late")
+                self.fired[deadline] = 0
+
+        expected = oracle_breakdown(now, frame.target)
+        actual = tuple(frame.breakdown())
+        if actual != expected:
+            self.errors.append(f"{now} -> {frame.target}: breakdown {actual} != oracle {expected}")
+        if self.with_texts:
+            frame.texts
+
+
+def run_scenario(name, tick_seconds, with_texts, format_texts):
+    zone, start, duration, target, rule_text, default_tick = SCENARIOS[name]
+    tick_ms = int((tick_seconds or default_tick) * 1000)
+    clock = VirtualClock(start, zone=zone)
+    simulation = SimulatedCountdown(clock, target, rule_text, tick_ms, format_texts if with_texts else None)
+
+    started = time.perf_counter()
+    simulation.engine.start()
+    clock.run_for(duration)
+    elapsed = time.perf_counter() - started
+
+    alarms = sum(simulation.fired.values())
+    status = "OK" if not simulation.errors else f"FAILED ({len(simulation.errors)})"
+    print(f"{name:<16} {simulation.ticks:>10,} ticks {elapsed:>7.2f} s {simulation.ticks / elapsed:>10,.0f} ticks/s "
+          f"{alarms:>4} alarm(s)  {status}")
+    for error in simulation.errors[:10]:
+        print(f"    {error}")
+    return not simulation.errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fast-forward simulation of the countdown tick loop")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), nargs="+", help="Scenarios to run (default: all)")
+    parser.add_argument("--tick", type=float, help="Seconds between ticks (default: per scenario)")
+    parser.add_argument("--no-texts", action="store_true", help="Skip building the label texts (oracle checks only)")
+    args = parser.parse_args()
+
+    format_texts = None
+    if not args.no_texts:
+        # main.py only opens the window when run as a script
+        from main import format_frame_texts as format_texts
+
+    results = [run_scenario(name, args.tick, not args.no_texts, format_texts) for name in args.scenario or SCENARIOS]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
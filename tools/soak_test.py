@@ -0,0 +1,274 @@
+"""
+Soak test of the main window for memory and handle leaks.
+
+Builds the real CountdownApp on a VirtualClock and drives it far faster
+than real time: every tick advances the clock by the refresh interval and
+runs one TickEngine tick, and every few thousand ticks the window goes
+through the things a display running for weeks sees: theme toggles, zoom
+in/out, loading .countdown files (one with a daily repeat rule, so alarms
+fire), opening/closing About and a mini window.
+
+Every --sample-every ticks it records the RSS, the Python heap
+(tracemalloc), the number of Tcl commands, Tk images, pending after()
+timers and widgets. The first sample after --warmup ticks is the baseline
+(fonts, icon and translation caches are filled by then); the run fails
+when the final growth over the baseline passes one of the limits. The top
+tracemalloc allocation sites by growth are printed at the end, with the
+largest growth of every metric next to its limit; --csv keeps the samples
+for plotting. The default limits are guesses until they are set from a
+measured run: take that largest growth over a long run on a clean build
+and leave some headroom.
+
+Needs a display (use xvfb-run on a headless Linux box). The run is
+hermetic: settings changes go to a temporary copy of settingsV2.json, the
+session snapshot is read from (and would be written to) the same temporary
+directory, and the event log, HTTP API and alarm popups/sounds are
+switched off.
+
+    python tools/soak_test.py
+    python tools/soak_test.py --ticks 100000 --sample-every 10000
+    xvfb-run python tools/soak_test.py --ticks 5000000 --no-tracemalloc
+    xvfb-run python tools/soak_test.py --ticks 2000000 --sample-every 20000 --csv soak.csv
+
+Exit code 1 when a limit is exceeded, 2 when no window can be opened.
+"""
+import argparse
+import contextlib
+import csv
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tkinter
+import tracemalloc
+from datetime import datetime, timedelta
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # settings and translations are loaded relative to the program directory
+
+from modules.clock import VirtualClock
+from modules.countdown_file import write_countdown_file
+
+# (metric, limit argument, unit) checked against the baseline sample
+LIMITS = (
+    ("rss", "max_rss_growth_mb", "MB"),
+    ("heap", "max_heap_growth_mb", "MB"),
+    ("tcl_commands", "max_tcl_command_growth", ""),
+    ("images", "max_image_growth", ""),
+    ("timers", "max_timer_growth", ""),
+    ("widgets", "max_widget_growth", ""),
+)
+
+
+def rss_megabytes():
+    """Resident set size of this process in MB, or None when it cannot be read."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 2**20
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def sample(root, tick):
+    gc.collect()
+    return {
+        "tick": tick,
+        "rss": rss_megabytes(),
+        "heap": tracemalloc.get_traced_memory()[0] / 2**20 if tracemalloc.is_tracing() else None,
+        "tcl_commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+        "images": len(root.tk.splitlist(root.tk.call("image", "names"))),
+        "timers": len(root.tk.splitlist(root.tk.call("after", "info"))),
+        "widgets": count_widgets(root),
+    }
+
+
+def format_sample(values, baseline=None):
+    parts = [f"{values['tick']:>10,}"]
+    for name, _, unit in LIMITS:
+        value = values[name]
+        if value is None:
+            parts.append(f"{'-':>14}")
+            continue
+        text = f"{value:.1f}{unit}" if unit else f"{value}"
+        if baseline is not None and baseline[name] is not None:
+            growth = value - baseline[name]
+            text += f" ({growth:+.1f})" if unit else f" ({growth:+d})"
+        parts.append(f"{text:>14}")
+    return " ".join(parts)
+
+
+def write_sample_files(directory, start):
+    """Two .countdown files: a one-off target and a daily repeat that fires an alarm every simulated day."""
+    one_off = os.path.join(directory, "one_off.countdown")
+    daily = os.path.join(directory, "daily.countdown")
+    write_countdown_file(one_off, start + timedelta(days=400))
+    write_countdown_file(daily, start + timedelta(hours=1), "FREQ=DAILY")
+    return [one_off, daily]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and handle leak soak test of the main window")
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="Ticks to run (one refresh interval of virtual time each)")
+    parser.add_argument("--warmup", type=int, default=20_000, help="Ticks before the baseline sample")
+    parser.add_argument("--sample-every", type=int, default=50_000)
+    parser.add_argument("--update-every", type=int, default=100, help="Ticks between Tk event loop passes")
+    parser.add_argument("--theme-every", type=int, default=2_000)
+    parser.add_argument("--zoom-every", type=int, default=5_000)
+    parser.add_argument("--load-every", type=int, default=10_000)
+    parser.add_argument("--about-every", type=int, default=10_000)
+    parser.add_argument("--start", default="2025-10-20 12:00:00", help="Virtual start time (local wall clock)")
+    parser.add_argument("--zone", default="Europe/Warsaw", help="Time zone of the virtual clock")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Skip the Python heap tracing (about 2x faster)")
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites to print")
+    parser.add_argument("--csv", help="Also write every sample (tick and the metrics below) to this CSV file")
+    parser.add_argument("--max-rss-growth-mb", type=float, default=30.0)
+    parser.add_argument("--max-heap-growth-mb", type=float, default=5.0)
+    parser.add_argument("--max-tcl-command-growth", type=int, default=20)
+    parser.add_argument("--max-image-growth", type=int, default=2)
+    parser.add_argument("--max-timer-growth", type=int, default=10)
+    parser.add_argument("--max-widget-growth", type=int, default=20)
+    args = parser.parse_args()
+
+    # CountdownApp loads sys.argv[1] as a .countdown file
+    sys.argv = sys.argv[:1]
+    if not args.no_tracemalloc:
+        tracemalloc.start(10)
+
+    import customtkinter as ctk
+    import main as app_main
+    from modules import session
+    from modules.settings_store import SettingsWriter
+
+    app_main.APP_SETTINGS.update({
+        "event_log_enabled": False,
+        "http_api_enabled": False,
+        "alarm_popup": False,
+        "alarm_bell": False,
+        "alarm_command": "",
+    })
+
+    work_dir = tempfile.mkdtemp(prefix="countdown_soak_")
+    settings_copy = os.path.join(work_dir, "settingsV2.json")
+    shutil.copyfile(app_main.RESOURCE_FILE_PATHS["json_config"], settings_copy)
+    app_main.settings_writer = SettingsWriter(settings_copy, required_version=app_main.REQUIRED_JSON_VERSION, delay=0)
+    # The last real session (target, geometry) must not leak into the run
+    session.SESSION_FILE = os.path.join(work_dir, "session.json")
+
+    start = datetime.strptime(args.start, "%Y-%m-%d %H:%M:%S")
+    clock = VirtualClock(start, zone=args.zone)
+    files = write_sample_files(work_dir, start)
+    step = timedelta(milliseconds=app_main.APP_SETTINGS["refresh_interval"])
+
+    try:
+        root = ctk.CTk()
+    except tkinter.TclError as e:
+        print(f"[ERROR]: Cannot open a window ({e}); run under a display, e.g. xvfb-run")
+        return 2
+
+    out = sys.stdout
+    failed = []
+    try:
+        # The app logs every load and theme switch, keep the report readable
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            app = app_main.CountdownApp(root, clock=clock)
+            # The real tick loop is replaced by the virtual one below
+            app.engine.stop()
+            root.update()
+
+        header = " ".join([f"{'tick':>10}"] + [f"{name + (f' [{unit}]' if unit else ''):>14}" for name, _, unit in LIMITS])
+        print(f"{args.ticks:,} ticks of {step.total_seconds():g} s virtual time from {clock()} ({args.zone})", file=out)
+        print(header, file=out)
+
+        baseline = None
+        baseline_snapshot = None
+        samples = []
+        themes = ("light", "dark")
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            for tick in range(1, args.ticks + 1):
+                clock.advance(step)
+                app.engine.tick()
+
+                if tick % args.theme_every == 0:
+                    app.set_app_appearance_mode(themes[(tick // args.theme_every) % 2])
+                if tick % args.zoom_every == 0:
+                    app.zoom.request(1 if (tick // args.zoom_every) % 2 else -1)
+                    app.zoom.apply_now()
+                if tick % args.load_every == 0:
+                    app_main.load_file(app, files[(tick // args.load_every) % len(files)])
+                if tick % args.about_every == 0:
+                    # Two clicks must give the same window
+                    about = app.open_about_window()
+                    root.update()
+                    if app.open_about_window() is not about:
+                        failed.append(f"tick {tick}: a second About window was opened")
+                    about.destroy()
+                    mini_window = app.open_mini_window()
+                    root.update()
+                    mini_window.close()
+                    if mini_window.render in app.engine.views:
+                        failed.append(f"tick {tick}: a closed mini window is still subscribed")
+                if tick % args.update_every == 0:
+                    root.update()
+
+                if tick == args.warmup or tick % args.sample_every == 0 or tick == args.ticks:
+                    values = sample(root, tick)
+                    samples.append(values)
+                    if tick == args.warmup:
+                        baseline = values
+                        baseline_snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+                    print(format_sample(values, baseline), file=out, flush=True)
+        elapsed = time.perf_counter() - started
+        print(f"{args.ticks / elapsed:,.0f} ticks/s, virtual clock at {clock()}", file=out)
+        if args.csv:
+            with open(args.csv, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["tick"] + [name for name, _, _ in LIMITS])
+                writer.writeheader()
+                writer.writerows(samples)
+            print(f"[INFO]: Wrote {len(samples)} sample(s) to {args.csv}", file=out)
+
+        if baseline is None:
+            print("[WARNING]: Run ended before the warm-up, nothing to compare", file=out)
+        else:
+            print("\nLargest growth over the baseline (set the limits from a long clean run):", file=out)
+            for name, limit_name, unit in LIMITS:
+                if values[name] is None or baseline[name] is None:
+                    continue
+                growth = values[name] - baseline[name]
+                limit = getattr(args, limit_name)
+                largest = max(later[name] - baseline[name] for later in samples if later["tick"] >= baseline["tick"])
+                print(f"  {name:>14} {largest:+g}{unit} (final {growth:+g}{unit}, limit {limit:g}{unit})", file=out)
+                if growth > limit:
+                    failed.append(f"{name} grew by {growth:g}{unit} (limit {limit:g}{unit})")
+
+            if baseline_snapshot is not None:
+                print(f"\nTop {args.top} allocation sites by growth since the baseline:", file=out)
+                for stat in tracemalloc.take_snapshot().compare_to(baseline_snapshot, "traceback")[:args.top]:
+                    frame = stat.traceback[0]
+                    print(f"  {stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks  {frame.filename}:{frame.lineno}", file=out)
+    finally:
+        root.destroy()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for message in failed:
+        print(f"[ERROR]: {message}", file=out)
+    print("FAILED" if failed else "OK", file=out)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Time-to-first-frame and idle memory of the main window.
+
+Every run is a fresh process that imports main.py, builds CountdownApp and
+records:
+
+    import     settings, translations and modules loaded (main.py imported)
+    build      CountdownApp() returned
+    first      first <Map> of the main window (its first frame)
+    settled    event queue drained, after_idle startup work (icon, HTTP API) done
+    idle RSS   resident memory after --idle seconds of ticking, plus widget and Tcl command counts
+
+The menu dropdowns are only built on their first click (modules/lazy_menu.py)
+and the icon and HTTP API follow the first frame (CountdownApp.finish_startup).
+Every run is measured twice, as fresh processes: "lazy" is the app as it is,
+"eager" builds all dropdowns and runs finish_startup inside CountdownApp(),
+like the window did before. The medians over --runs runs of both are printed
+side by side, plus what building the menus later costs in a lazy run. The
+runs alternate, so each lazy run is paired with the eager run after it; the
+last line counts the pairs in which lazy reached the first frame sooner.
+If that is not clearly most of them, the deferral is not worth keeping.
+
+Needs a display (use xvfb-run on a headless Linux box):
+
+    python tools/startup_profile.py
+    xvfb-run python tools/startup_profile.py --runs 10 --idle 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+START = time.perf_counter()
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# (result key, label, unit)
+METRICS = (
+    ("import_ms", "import main.py", "ms"),
+    ("build_ms", "CountdownApp()", "ms"),
+    ("first_frame_ms", "first frame", "ms"),
+    ("settled_ms", "settled", "ms"),
+    ("idle_rss_mb", "idle RSS", "MB"),
+    ("widgets", "widgets", ""),
+    ("tcl_commands", "Tcl commands", ""),
+    ("menus_ms", "+ build all menus", "ms"),
+    ("menus_rss_mb", "+ menus RSS", "MB"),
+    ("menus_widgets", "+ menus widgets", ""),
+)
+
+
+def rss_megabytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 2**20
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        return float("nan")
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def elapsed_ms():
+    return (time.perf_counter() - START) * 1000
+
+
+def child(result_path, idle_seconds, eager):
+    """One measured startup (eager=True: the startup before lazy menus); writes the results as JSON to result_path."""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    # CountdownApp loads sys.argv[1] as a .countdown file
+    sys.argv = sys.argv[:1]
+    sys.stdout = open(os.devnull, "w")
+
+    result = {}
+    import customtkinter as ctk
+    import main as app_main
+    from modules import session
+    result["import_ms"] = elapsed_ms()
+    # Every run starts without the last real session (its target and geometry)
+    session.SESSION_FILE = os.path.join(os.path.dirname(result_path), "session.json")
+
+    root = ctk.CTk()
+    root.bind("<Map>", lambda event: event.widget is root and result.setdefault("first_frame_ms", elapsed_ms()), add="+")
+    app = app_main.CountdownApp(root)
+    if eager:
+        # What __init__ used to do before the first frame: every menu, then the icon and HTTP API
+        for dropdown in app.dropdowns:
+            dropdown.build()
+        root.after_cancel(app.startup_job)
+        app.finish_startup()
+    result["build_ms"] = elapsed_ms()
+    root.update()
+    result["settled_ms"] = elapsed_ms()
+    result.setdefault("first_frame_ms", result["settled_ms"])
+
+    root.after(int(idle_seconds * 1000), root.quit)
+    root.mainloop()
+    result["idle_rss_mb"] = rss_megabytes()
+    result["widgets"] = count_widgets(root)
+    result["tcl_commands"] = len(root.tk.splitlist(root.tk.call("info", "commands")))
+
+    # What the eager menu bar cost on top of that
+    started = time.perf_counter()
+    for dropdown in app.dropdowns:
+        dropdown.build()
+    root.update()
+    result["menus_ms"] = (time.perf_counter() - started) * 1000
+    result["menus_rss_mb"] = rss_megabytes() - result["idle_rss_mb"]
+    result["menus_widgets"] = count_widgets(root) - result["widgets"]
+
+    app.engine.stop()
+    root.destroy()
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-to-first-frame and idle memory of the main window")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes to measure")
+    parser.add_argument("--idle", type=float, default=3.0, help="Seconds of ticking before the idle memory sample")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--eager", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.child, args.idle, args.eager)
+
+    results = {"lazy": [], "eager": []}
+    for run in range(args.runs):
+        # Alternated, so both sides see the same warm disk cache
+        for mode, runs in results.items():
+            with tempfile.TemporaryDirectory(prefix="countdown_startup_") as directory:
+                result_path = os.path.join(directory, "result.json")
+                command = [sys.executable, os.path.abspath(__file__), "--child", result_path, "--idle", str(args.idle)]
+                process = subprocess.run(command + (["--eager"] if mode == "eager" else []), stderr=subprocess.PIPE, text=True)
+                if process.returncode != 0 or not os.path.exists(result_path):
+                    print(f"[ERROR]: Run {run + 1} ({mode}) failed (exit code {process.returncode}):\n{process.stderr.strip()}")
+                    return 2 if "display" in process.stderr.lower() else 1
+                with open(result_path, encoding="utf-8") as f:
+                    runs.append(json.load(f))
+
+    print(f"Median of {args.runs} run(s) each, times from process start:")
+    print(f"  {'':<20} {'lazy':>12} {'eager':>12} {'change':>10}")
+    for key, label, unit in METRICS:
+        lazy, eager = (statistics.median(result[key] for result in results[mode]) for mode in ("lazy", "eager"))
+        change = f"{(lazy - eager) / eager:+.0%}" if eager else ""
+        print(f"  {label:<20} {f'{lazy:.1f} {unit}':>12} {f'{eager:.1f} {unit}':>12} {change:>10}")
+    faster = sum(lazy["first_frame_ms"] < eager["first_frame_ms"] for lazy, eager in zip(results["lazy"], results["eager"]))
+    print(f"First frame: lazy was faster in {faster} of {args.runs} paired run(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Memory benchmark for the countdown target model (modules/targets.py).
+
+Builds N targets (1,000,000 by default) in several representations and
+reports the bytes per target measured with tracemalloc:
+
+    python tools/target_memory_benchmark.py
+    python tools/target_memory_benchmark.py --count 200000 --unique-labels
+
+Labels are drawn from a pool of 1,000 names unless --unique-labels is
+given, in which case every target has its own label string. tracemalloc
+slows allocation down, so the default run takes about a minute.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.targets import TargetStore, CountdownTarget, to_epoch
+
+
+def make_inputs(count, unique_labels):
+    base = datetime(2025, 1, 1)
+    pool = [f"Target {i}" for i in range(1000)]
+    for i in range(count):
+        label = f"Target {i}" if unique_labels else pool[i % 1000]
+        yield label, base + timedelta(seconds=i * 97)
+
+
+def build_dicts(inputs):
+    return [{"label": label, "target": target, "rule": None, "reached": False} for label, target in inputs]
+
+
+def build_tuples(inputs):
+    return [(label, target) for label, target in inputs]
+
+
+def build_records(inputs):
+    store = TargetStore()  # only used for its label table
+    intern = store.labels.intern
+    return store, [CountdownTarget(to_epoch(target), intern(label)) for label, target in inputs]
+
+
+def build_store(inputs):
+    return TargetStore.from_pairs(inputs)
+
+
+def measure(name, builder, count, unique_labels):
+    # Inputs are generated lazily inside the measurement; label strings that survive
+    # in the result are counted, temporaries are not
+    gc.collect()
+    tracemalloc.start()
+    result = builder(make_inputs(count, unique_labels))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<34} {current / count:>8.1f} B/target   peak {peak / count:>8.1f} B/target   total {current / 2**20:>8.1f} MiB")
+    del result
+    gc.collect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per countdown target for each representation")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--unique-labels", action="store_true", help="Give every target its own label")
+    args = parser.parse_args()
+
+    print(f"{args.count:,} targets, {'unique' if args.unique_labels else '1,000 shared'} labels")
+    measure("list of dicts (label/target/...)", build_dicts, args.count, args.unique_labels)
+    measure("list of (label, datetime) tuples", build_tuples, args.count, args.unique_labels)
+    measure("list of CountdownTarget records", build_records, args.count, args.unique_labels)
+    measure("TargetStore (columnar arrays)", build_store, args.count, args.unique_labels)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
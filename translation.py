@@ -10,6 +10,8 @@ TRANSLATIONS_EN = {
       "load_file": "Load File",
       "save_file": "Save File",
       "save_as": "Save As",
+      "import_ics": "Import Calendar (.ics)...",
+      "export": "Export...",
       "exit": "Exit"
     },
     "appearance": {
@@ -17,7 +19,17 @@ TRANSLATIONS_EN = {
       "dark_mode": "Dark Mode",
       "light_mode": "Light Mode",
       "zoom_in": "Zoom In",
-      "zoom_out": "Zoom Out"
+      "zoom_out": "Zoom Out",
+      "lines": "Breakdown Lines",
+      "mini_window": "Mini Window"
+    },
+    "repeat": {
+      "repeat": "Repeat",
+      "none": "No Repeat",
+      "daily": "Daily",
+      "weekly": "Weekly",
+      "monthly": "Monthly",
+      "yearly": "Yearly"
     },
     "settings": {
       "settings": "Settings",
@@ -44,10 +56,13 @@ TRANSLATIONS_EN = {
     "current_date_label": "Current Date:",
     "invalid_date": "Invalid date!",
     "empty_input": "Please fill all fields.",
+    "day_out_of_range": "Day is out of range for this month.",
     "remaining_text": "Time remaining:",
     "elapsed_text": "Time elapsed:",
     "and": "and",
     "in_other_words": "In other words:",
+    "target_reached": "Target reached:",
+    "no_upcoming_events": "No upcoming events in this calendar.",
     "plural_forms": {
       "year": ["year", "years", "years"],
       "month": ["month", "months", "months"],
@@ -56,8 +71,35 @@ TRANSLATIONS_EN = {
       "hour": ["hour", "hours", "hours"],
       "minute": ["minute", "minutes", "minutes"],
       "second": ["second", "seconds", "seconds"]
+    },
+    "display_templates": {
+      "time_left": "{prefix} {years}, {months}, {weeks}, {days}, {hours}, {minutes} {and} {seconds}",
+      "total_time": {
+        "header": "{in_other_words} {prefix}",
+        "calendar": "{years}, {months}, {weeks}, {days}",
+        "months": "{total_months}, {days_after_months}",
+        "weeks": "{total_weeks}, {days_after_weeks}",
+        "days": "{total_days}, {hours}",
+        "hours": "{total_hours}, {minutes_after_hours}",
+        "minutes": "{total_minutes}, {seconds_after_minutes}",
+        "seconds": "{total_seconds}"
+      }
+    },
+    "display_lines": {
+      "time_left": "Time remaining / elapsed",
+      "header": "\"In other words\" heading",
+      "calendar": "Years, months, weeks, days",
+      "months": "Total months",
+      "weeks": "Total weeks",
+      "days": "Total days",
+      "hours": "Total hours",
+      "minutes": "Total minutes",
+      "seconds": "Total seconds"
     }
   },
+  "mini_window": {
+    "compact": "{sign}{days} d {hours:02}:{minutes:02}:{seconds:02}"
+  },
   "about_window": {
     "about_window_title": "About Countdown App",
     "program_info_description": {